@@ -4,18 +4,57 @@
 이미지 CRUD 엔드포인트를 제공합니다.
 """
 
+import asyncio
 from typing import Optional
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, status, Query
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, status, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import CACHE_IMAGE_LIST, CACHE_TOP_24H, response_cache
+from app.core.database import get_db, run_in_session
+from app.core.responses import PUBLIC_CACHE_CONTROL, dumps, etag_matches, json_response, not_modified
 from app.core.security import get_current_user
-from app.schemas.image import ImageResponse, ImageListResponse, ImageUpdateRequest
+from app.schemas.image import (
+    ImageBatchRequest,
+    ImageBatchResponse,
+    ImageResponse,
+    ImageListResponse,
+    ImageSearchResponse,
+    ImageFacetsResponse,
+    ImageUpdateRequest,
+    NearDuplicateItem,
+    SimilarImageItem,
+    SuggestionItem,
+)
+from app.core.config import settings
+from app.services.duplicate_service import DuplicateService
+from app.services.facet_service import FacetService
 from app.services.image_service import ImageService
-from app.utils.file_handler import validate_and_save_file, delete_file
+from app.services.render_service import RenderService
+from app.services.search_service import SearchService
+from app.services.similar_service import SimilarService
+from app.services.suggest_service import SuggestService
+from app.utils.fieldsets import parse_image_fields, sparse_response
+from app.utils.file_handler import StoredFile, save_upload, save_variants, analyze_upload, delete_file, restore_upload
 
 router = APIRouter(prefix="/images", tags=["Images"])
 
+# 캐시할 목록 응답 직렬화용 (response_model과 같은 JSON)
+_IMAGE_LIST_ADAPTER = TypeAdapter(list[ImageResponse])
+
+
+async def _discard_upload(stored: StoredFile, variant_urls: dict[str, str]) -> None:
+    """
+    게시물 생성에 실패한 업로드 파일을 삭제합니다.
+
+    중복 업로드로 기존 파일을 재사용한 경우에는 다른 게시물이 참조하므로 남겨둡니다.
+    """
+    if not stored.created:
+        return
+    for file_url in [stored.url, stored.original_url, *variant_urls.values()]:
+        if file_url:
+            await delete_file(file_url)
+
 
 @router.post(
     "/",
@@ -32,10 +71,18 @@ router = APIRouter(prefix="/images", tags=["Images"])
     - **인증 필수**: JWT 토큰이 Authorization 헤더에 포함되어야 합니다
     - **파일 제한**: 최대 10MB, jpg/jpeg/png/gif/webp 형식만 허용
 
+    ## 처리
+    - 업로드 후 256/512/1024 크기의 축소 이미지(WebP)가 생성되어 `variant_urls`로 반환됩니다
+    - 너비/높이/파일 크기/MIME 타입/대표 색상이 함께 저장되어 반환됩니다
+    - 트랜스코딩이 켜져 있으면 EXIF를 제거하고 WebP 등으로 다시 인코딩하여 저장합니다
+    - 원본 로딩 전에 바로 그릴 수 있는 초소형 플레이스홀더(`placeholder`, data URI)가 포함됩니다
+    - 지각 해시가 계산되며, `reject_near_duplicates=true`면 거의 같은 이미지가 있을 때 거부합니다
+
     ## 응답
     - **201**: 업로드 성공, 생성된 이미지 정보 반환
     - **400**: 잘못된 파일 형식 또는 크기 초과
     - **401**: 인증 실패
+    - **409**: 유사 이미지가 이미 존재함 (`reject_near_duplicates=true`일 때)
     """,
 )
 async def create_image(
@@ -43,33 +90,62 @@ async def create_image(
     prompt: str = Form(..., description="AI 생성 프롬프트", min_length=1, max_length=2000),
     model_name: Optional[str] = Form(None, description="사용한 AI 모델명", max_length=100),
     is_tournament_opt_in: bool = Form(False, description="토너먼트 참여 여부"),
+    reject_near_duplicates: bool = Form(False, description="유사 이미지가 이미 있으면 업로드 거부"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """AI 이미지를 업로드하고 메타데이터를 저장합니다."""
 
     # 1. 파일 검증 및 저장
-    image_url = await validate_and_save_file(file)
+    stored = await save_upload(file)
+    image_url = stored.url
+    variant_urls: dict[str, str] = {}
 
-    # 2. 데이터베이스에 저장
+    # 2. 축소 이미지 생성 + 메타데이터 추출 (프로세스 풀에서 동시 실행) 및 데이터베이스에 저장
     try:
+        variant_urls, image_metadata = await asyncio.gather(
+            save_variants(stored),
+            analyze_upload(stored),
+        )
+
+        # 3. 유사 이미지 확인 (요청 시)
+        phash = image_metadata.get("phash")
+        if reject_near_duplicates and phash is not None:
+            duplicates = await DuplicateService.find_near_duplicates(
+                db, phash, settings.PHASH_MAX_DISTANCE
+            )
+            if duplicates:
+                duplicate_ids = ", ".join(str(image_id) for image_id, _ in duplicates[:10])
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"유사한 이미지가 이미 등록되어 있습니다. (이미지 ID: {duplicate_ids})"
+                )
+
         image = await ImageService.create_image(
             db=db,
             user_id=current_user["user_id"],
             image_url=image_url,
             prompt=prompt,
             model_name=model_name,
-            is_tournament_opt_in=is_tournament_opt_in
+            is_tournament_opt_in=is_tournament_opt_in,
+            variant_urls=variant_urls,
+            image_metadata=image_metadata,
+            original_url=stored.original_url
         )
 
-        return ImageResponse(
-            **image.__dict__,
-            like_count=0
-        )
+        # 콘텐츠 주소 모드: 참조를 잡은 뒤, 재사용한 파일이 그 사이 삭제되었으면 다시 기록
+        if settings.STORAGE_CONTENT_ADDRESSED:
+            await restore_upload(stored, variant_urls)
+
+        return ImageResponse.model_validate(image)
+
+    except HTTPException:
+        await _discard_upload(stored, variant_urls)
+        raise
 
     except Exception as e:
         # DB 저장 실패 시 업로드된 파일 삭제
-        await delete_file(image_url)
+        await _discard_upload(stored, variant_urls)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"이미지 저장 중 오류가 발생했습니다: {str(e)}"
@@ -91,23 +167,195 @@ async def create_image(
     - size: 페이지 크기 (기본값: 20)
     - user_id: 특정 사용자의 이미지만 조회 (선택사항)
     - tournament_only: 토너먼트 참여 이미지만 조회 (선택사항)
+    - color: 이 색을 주요 색상으로 가진 이미지만 조회 (선택사항, 예: `#ff0000` 또는 `ff0000`)
+      - 색은 채널별 4단계로 양자화되어 비슷한 색끼리 같은 그룹으로 검색됩니다
+    - fields: 응답에 포함할 필드 (선택사항, 쉼표 구분, 예: `id,image_url,like_count`)
+      - 지정하면 해당 컬럼만 조회하고 그 필드만 반환합니다 (id는 항상 포함)
+
+    ## 캐시
+    - 본문 기준 강한 `ETag`와 `Cache-Control`을 반환하며, `If-None-Match`가 일치하면 **304**를 반환합니다
     """,
 )
 async def get_images(
+    request: Request,
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
     user_id: Optional[int] = Query(None, description="사용자 ID 필터"),
     tournament_only: bool = Query(False, description="토너먼트 참여 이미지만 조회"),
+    color: Optional[str] = Query(None, pattern="^#?[0-9a-fA-F]{6}$", description="색상 필터 (#rrggbb)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분)"),
     db: AsyncSession = Depends(get_db)
 ):
     """이미지 목록을 페이지네이션하여 반환합니다."""
-    return await ImageService.get_images(
-        db=db,
-        page=page,
-        size=size,
-        user_id=user_id,
-        tournament_only=tournament_only
-    )
+    selected_fields = parse_image_fields(fields)
+
+    async def render(session: AsyncSession) -> bytes:
+        result = await ImageService.get_images(
+            db=session,
+            page=page,
+            size=size,
+            user_id=user_id,
+            tournament_only=tournament_only,
+            color=color,
+            fields=selected_fields
+        )
+        return dumps(result) if selected_fields else result.model_dump_json().encode()
+
+    # 첫 페이지는 누구에게나 같으므로 직렬화된 본문을 응답 캐시에 보관 (캐시 적중 시 쿼리 없이 304 판단)
+    # 합쳐진 조회는 여러 요청이 기다리므로 요청 세션이 아닌 별도 세션으로 실행
+    if page == 1:
+        cache_key = (size, user_id, tournament_only, color.lstrip("#").lower() if color else None,
+                     tuple(selected_fields or ()))
+        body = await response_cache.get_or_load(CACHE_IMAGE_LIST, cache_key, lambda: run_in_session(render))
+    else:
+        body = await render(db)
+
+    return json_response(request, body)
+
+
+@router.get(
+    "/search",
+    response_model=ImageSearchResponse,
+    summary="프롬프트 검색",
+    description="""
+    프롬프트 전문 검색으로 이미지를 관련도 순으로 조회합니다.
+
+    ## 최종 경로
+    `GET /api-image/v1/images/search?q=neon city`
+
+    ## 쿼리 파라미터
+    - q: 검색어 (모든 단어를 포함한 프롬프트를 찾음)
+    - size: 페이지 크기 (기본값: 20)
+    - cursor: 다음 페이지 커서 (이전 응답의 `next_cursor`)
+
+    ## 응답
+    - items: 관련도 순 이미지 목록
+    - next_cursor: 다음 페이지가 있으면 커서, 없으면 null
+    """,
+)
+async def search_images(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, max_length=200, description="다음 페이지 커서"),
+    db: AsyncSession = Depends(get_db)
+):
+    """프롬프트 검색 결과를 반환합니다."""
+    return await SearchService.search_prompts(db, q, size=size, cursor=cursor)
+
+
+def _check_batch_size(image_ids: list[int]) -> None:
+    """일괄 조회 ID 수를 확인합니다."""
+    if len(image_ids) > settings.IMAGE_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.IMAGE_BATCH_MAX_IDS}개까지 조회할 수 있습니다."
+        )
+
+
+@router.get(
+    "/batch",
+    response_model=ImageBatchResponse,
+    summary="이미지 일괄 조회",
+    description="""
+    여러 이미지를 한 번에 조회합니다 (저장한 컬렉션, 랭킹 스냅샷 복원용).
+
+    ## 최종 경로
+    `GET /api-image/v1/images/batch?ids=3,1,7`
+
+    ## 쿼리 파라미터
+    - ids: 쉼표로 구분한 이미지 ID 목록 (최대 100개)
+
+    ## 응답
+    - items: 요청한 ID 순서대로의 이미지 목록 (없거나 삭제된 이미지는 null)
+    - missing: 찾을 수 없는 이미지 ID 목록
+    """,
+)
+async def get_images_batch(
+    ids: str = Query(..., pattern=r"^\d+(,\d+)*$", description="쉼표로 구분한 이미지 ID 목록"),
+    db: AsyncSession = Depends(get_db)
+):
+    """여러 이미지를 요청 순서대로 반환합니다."""
+    image_ids = [int(image_id) for image_id in ids.split(",")]
+    _check_batch_size(image_ids)
+    return await ImageService.get_images_batch(db, image_ids)
+
+
+@router.post(
+    "/batch",
+    response_model=ImageBatchResponse,
+    summary="이미지 일괄 조회 (POST)",
+    description="""
+    ID 목록이 길어 URL에 담기 어려울 때 요청 본문으로 일괄 조회합니다.
+
+    ## 최종 경로
+    `POST /api-image/v1/images/batch`
+
+    ## 요청 본문
+    - `{"ids": [3, 1, 7]}` (최대 100개)
+
+    ## 응답
+    - `GET /images/batch`와 같습니다
+    """,
+)
+async def post_images_batch(
+    request_data: ImageBatchRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """여러 이미지를 요청 순서대로 반환합니다."""
+    _check_batch_size(request_data.ids)
+    return await ImageService.get_images_batch(db, request_data.ids)
+
+
+@router.get(
+    "/facets",
+    response_model=ImageFacetsResponse,
+    summary="갤러리 패싯 조회",
+    description="""
+    갤러리 사이드바용으로 모델명별, 토너먼트 참여 여부별 활성 이미지 수를 조회합니다.
+
+    ## 최종 경로
+    `GET /api-image/v1/images/facets`
+
+    ## 참고
+    - 업로드/수정/삭제 시 갱신되는 집계 테이블을 읽으므로 이미지 수와 무관하게 빠르게 응답합니다
+    """,
+)
+async def get_facets(
+    db: AsyncSession = Depends(get_db)
+):
+    """패싯별 이미지 수를 반환합니다."""
+    return await FacetService.get_facets(db)
+
+
+@router.get(
+    "/suggest",
+    response_model=list[SuggestionItem],
+    summary="자동완성",
+    description="""
+    모델명 또는 프롬프트 구절의 자동완성 후보를 사용 빈도 순으로 조회합니다.
+
+    ## 최종 경로
+    `GET /api-image/v1/images/suggest?q=sta&field=model_name`
+
+    ## 쿼리 파라미터
+    - q: 입력 중인 접두사 (대소문자 구분 없음)
+    - field: `model_name` (모델명) | `prompt` (쉼표로 구분된 프롬프트 구절)
+    - limit: 최대 후보 수 (기본값: 10)
+
+    ## 참고
+    - 서버 메모리의 트라이에서 바로 응답하며, 새 업로드는 즉시 반영됩니다
+    - 삭제/수정은 주기적인 재집계 때 반영됩니다
+    """,
+)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=64, description="입력 중인 접두사"),
+    field: str = Query("model_name", pattern="^(model_name|prompt)$", description="자동완성 대상"),
+    limit: int = Query(10, ge=1, le=settings.SUGGEST_TOP_K, description="최대 후보 수"),
+    db: AsyncSession = Depends(get_db)
+):
+    """자동완성 후보를 반환합니다."""
+    suggestions = await SuggestService.suggest(db, q, field=field, limit=limit)
+    return [SuggestionItem(text=text, count=count) for text, count in suggestions]
 
 
 @router.get(
@@ -119,13 +367,65 @@ async def get_images(
 
     ## 최종 경로
     `GET /api-image/v1/images/{image_id}`
+
+    ## 캐시
+    - 수정일시와 좋아요/승리 횟수로 만든 강한 `ETag`와 `Cache-Control`을 반환합니다
+    - `If-None-Match`가 일치하면 전체 행을 조회하지 않고 **304**를 반환합니다
     """,
 )
 async def get_image(
+    request: Request,
+    response: Response,
     image_id: int,
     db: AsyncSession = Depends(get_db)
 ):
     """ID로 이미지 상세 정보를 조회합니다."""
+    # 버전 컬럼만 먼저 조회해 변경이 없으면 304로 끝냄
+    etag = await ImageService.get_image_etag(db, image_id)
+    if etag is not None and etag_matches(request, etag):
+        return not_modified(etag)
+
+    image = await ImageService.get_image_by_id(db, image_id)
+
+    if not image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="이미지를 찾을 수 없습니다."
+        )
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PUBLIC_CACHE_CONTROL
+    return ImageResponse.model_validate(image)
+
+
+@router.get(
+    "/{image_id}/render",
+    response_class=Response,
+    summary="온디맨드 리사이즈",
+    description="""
+    원본 이미지를 요청한 너비/포맷으로 축소하여 반환합니다.
+
+    ## 최종 경로
+    `GET /api-image/v1/images/{image_id}/render?w=640&fmt=webp`
+
+    ## 쿼리 파라미터
+    - w: 목표 너비 (픽셀, 원본보다 크게 확대하지 않음)
+    - fmt: 출력 포맷 (webp | jpeg | png, 기본값: webp)
+
+    ## 캐시
+    - 결과는 서버 디스크 캐시에 보관되며, 같은 변형에 대한 동시 요청은 한 번만 렌더링됩니다
+    - 강한 `ETag`와 `Cache-Control: immutable` 헤더를 반환합니다
+    - `If-None-Match`가 일치하면 **304**를 반환합니다
+    """,
+)
+async def render_image(
+    request: Request,
+    image_id: int,
+    w: int = Query(..., ge=16, le=settings.RENDER_MAX_WIDTH, description="목표 너비 (픽셀)"),
+    fmt: str = Query("webp", pattern="^(webp|jpeg|png)$", description="출력 포맷"),
+    db: AsyncSession = Depends(get_db)
+):
+    """요청한 크기로 리사이즈된 이미지를 반환합니다."""
     image = await ImageService.get_image_by_id(db, image_id)
 
     if not image:
@@ -134,10 +434,116 @@ async def get_image(
             detail="이미지를 찾을 수 없습니다."
         )
 
-    return ImageResponse(
-        **image.__dict__,
-        like_count=image.like_count
+    # 업로드 파일은 내용이 바뀌지 않으므로 캐시 키를 강한 ETag로 사용
+    etag = f'"{RenderService.cache_key(image.image_url, w, fmt)}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    data = await RenderService.render(image.image_url, w, fmt)
+    return Response(content=data, media_type=RenderService.media_type(fmt), headers=headers)
+
+
+@router.get(
+    "/{image_id}/duplicates",
+    response_model=list[NearDuplicateItem],
+    summary="유사 이미지 조회",
+    description="""
+    지각 해시(dHash)의 해밍 거리로 거의 같은 이미지를 찾습니다.
+
+    ## 최종 경로
+    `GET /api-image/v1/images/{image_id}/duplicates`
+
+    ## 쿼리 파라미터
+    - max_distance: 허용 해밍 거리 (기본값: 서버 설정, 0이면 완전히 같은 해시만)
+
+    ## 응답
+    - 가까운 순으로 정렬된 이미지와 거리 목록
+    """,
+)
+async def get_near_duplicates(
+    image_id: int,
+    max_distance: Optional[int] = Query(None, ge=0, le=16, description="허용 해밍 거리"),
+    db: AsyncSession = Depends(get_db)
+):
+    """유사 이미지 목록을 반환합니다."""
+    image = await ImageService.get_image_by_id(db, image_id)
+
+    if not image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="이미지를 찾을 수 없습니다."
+        )
+
+    if image.phash is None:
+        return []
+
+    if max_distance is None:
+        max_distance = settings.PHASH_MAX_DISTANCE
+
+    matches = await DuplicateService.find_near_duplicates(
+        db, image.phash, max_distance, exclude_id=image.id
     )
+    images = await ImageService.get_images_by_ids(db, [image_id for image_id, _ in matches])
+
+    return [
+        NearDuplicateItem(
+            image=ImageResponse.model_validate(images[match_id]),
+            distance=distance
+        )
+        for match_id, distance in matches
+        if match_id in images
+    ]
+
+
+@router.get(
+    "/{image_id}/similar",
+    response_model=list[SimilarImageItem],
+    summary="비슷한 프롬프트 이미지 추천",
+    description="""
+    프롬프트가 비슷한 이미지를 추천합니다 ("이런 작품은 어때요?").
+
+    ## 최종 경로
+    `GET /api-image/v1/images/{image_id}/similar`
+
+    ## 쿼리 파라미터
+    - limit: 최대 개수 (기본값: 10)
+
+    ## 참고
+    - 프롬프트의 단어/단어쌍으로 만든 MinHash 서명을 LSH 버킷으로 묶어,
+      같은 버킷에 들어간 후보만 비교합니다 (전체 이미지와 비교하지 않음)
+    - similarity는 두 프롬프트 단어 집합의 Jaccard 유사도 추정치입니다
+    """,
+)
+async def get_similar_images(
+    image_id: int,
+    limit: int = Query(10, ge=1, le=50, description="최대 개수"),
+    db: AsyncSession = Depends(get_db)
+):
+    """프롬프트가 비슷한 이미지 목록을 반환합니다."""
+    image = await ImageService.get_image_by_id(db, image_id)
+
+    if not image:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="이미지를 찾을 수 없습니다."
+        )
+
+    matches = await SimilarService.find_similar(db, image, limit=limit)
+    images = await ImageService.get_images_by_ids(db, [match_id for match_id, _ in matches])
+
+    return [
+        SimilarImageItem(
+            image=ImageResponse.model_validate(images[match_id]),
+            similarity=similarity
+        )
+        for match_id, similarity in matches
+        if match_id in images
+    ]
 
 
 @router.put(
@@ -170,10 +576,7 @@ async def update_image(
         is_tournament_opt_in=data.is_tournament_opt_in
     )
 
-    return ImageResponse(
-        **image.__dict__,
-        like_count=image.like_count
-    )
+    return ImageResponse.model_validate(image)
 
 
 @router.delete(
@@ -217,6 +620,8 @@ async def delete_image(
 
     ## 쿼리 파라미터
     - limit: 조회할 이미지 개수 (기본값: 20, 최대: 50)
+    - fields: 응답에 포함할 필드 (선택사항, 쉼표 구분, 예: `id,image_url,like_count`)
+      - 지정하면 해당 컬럼만 조회하고 그 필드만 반환합니다 (id는 항상 포함)
 
     ## 인증
     - 인증 불필요 (누구나 조회 가능)
@@ -224,15 +629,16 @@ async def delete_image(
 )
 async def get_random_feed(
     limit: int = Query(20, ge=1, le=50, description="조회할 이미지 개수"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분)"),
     db: AsyncSession = Depends(get_db)
 ):
     """랜덤 피드를 조회합니다."""
-    images = await ImageService.get_random_feed(db=db, limit=limit)
+    selected_fields = parse_image_fields(fields)
+    images = await ImageService.get_random_feed(db=db, limit=limit, fields=selected_fields)
 
-    return [
-        ImageResponse(**image.__dict__, like_count=image.like_count)
-        for image in images
-    ]
+    if selected_fields:
+        return sparse_response(images)
+    return images
 
 
 @router.get(
@@ -247,19 +653,30 @@ async def get_random_feed(
 
     ## 쿼리 파라미터
     - limit: 조회할 이미지 개수 (기본값: 10, 최대: 50)
+    - fields: 응답에 포함할 필드 (선택사항, 쉼표 구분, 예: `id,image_url,like_count`)
+      - 지정하면 해당 컬럼만 조회하고 그 필드만 반환합니다 (id는 항상 포함)
 
     ## 인증
     - 인증 불필요 (누구나 조회 가능)
+
+    ## 캐시
+    - 본문 기준 강한 `ETag`와 `Cache-Control`을 반환하며, `If-None-Match`가 일치하면 **304**를 반환합니다
     """,
 )
 async def get_top_images_24h(
+    request: Request,
     limit: int = Query(10, ge=1, le=50, description="조회할 이미지 개수"),
-    db: AsyncSession = Depends(get_db)
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분)")
 ):
     """최근 24시간 내 인기 이미지를 조회합니다."""
-    images = await ImageService.get_top_images_24h(db=db, limit=limit)
+    selected_fields = parse_image_fields(fields)
 
-    return [
-        ImageResponse(**image.__dict__, like_count=image.like_count)
-        for image in images
-    ]
+    async def render(session: AsyncSession) -> bytes:
+        images = await ImageService.get_top_images_24h(db=session, limit=limit, fields=selected_fields)
+        return dumps(images) if selected_fields else _IMAGE_LIST_ADAPTER.dump_json(images)
+
+    # 합쳐진 조회는 여러 요청이 기다리므로 요청 세션이 아닌 별도 세션으로 실행
+    body = await response_cache.get_or_load(
+        CACHE_TOP_24H, (limit, tuple(selected_fields or ())), lambda: run_in_session(render)
+    )
+    return json_response(request, body)
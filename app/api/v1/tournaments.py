@@ -4,10 +4,13 @@
 토너먼트 매칭, 투표, 랭킹 엔드포인트를 제공합니다.
 """
 
-from fastapi import APIRouter, Depends, status, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import CACHE_RANKINGS, get_or_load_shared, response_cache
+from app.core.database import get_db, run_in_session
+from app.core.responses import dumps, json_response
 from app.core.security import get_current_user
 from app.schemas.tournament import (
     TournamentMatchResponse,
@@ -18,9 +21,13 @@ from app.schemas.tournament import (
 )
 from app.schemas.image import ImageResponse
 from app.services.tournament_service import TournamentService
+from app.utils.fieldsets import parse_image_fields
 
 router = APIRouter(prefix="/tournaments", tags=["Tournaments"])
 
+# 랭킹 기본 조회 개수 (이 요청만 워커 간 공유 캐시에 보관)
+_DEFAULT_RANKING_LIMIT = 50
+
 
 @router.get(
     "/match",
@@ -51,8 +58,8 @@ async def get_tournament_match(
     image1, image2 = await TournamentService.get_random_match(db=db)
 
     return TournamentMatchResponse(
-        image1=ImageResponse(**image1.__dict__, like_count=image1.like_count),
-        image2=ImageResponse(**image2.__dict__, like_count=image2.like_count),
+        image1=ImageResponse.model_validate(image1),
+        image2=ImageResponse.model_validate(image2),
         message="두 이미지 중 마음에 드는 것을 선택하세요!"
     )
 
@@ -118,6 +125,8 @@ async def vote_tournament(
 
     ## 쿼리 파라미터
     - limit: 조회할 랭킹 개수 (기본값: 50, 최대: 100)
+    - fields: image에 포함할 필드 (선택사항, 쉼표 구분, 예: `id,image_url,like_count`)
+      - 지정하면 해당 컬럼만 조회하고 그 필드만 반환합니다 (id는 항상 포함)
 
     ## 정렬 기준
     1. tournament_win_count (내림차순)
@@ -125,25 +134,50 @@ async def vote_tournament(
 
     ## 인증
     - 인증 불필요 (누구나 조회 가능)
+
+    ## 캐시
+    - 본문 기준 강한 `ETag`와 `Cache-Control`을 반환하며, `If-None-Match`가 일치하면 **304**를 반환합니다
     """,
 )
 async def get_tournament_rankings(
-    limit: int = Query(50, ge=1, le=100, description="조회할 랭킹 개수"),
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    limit: int = Query(_DEFAULT_RANKING_LIMIT, ge=1, le=100, description="조회할 랭킹 개수"),
+    fields: Optional[str] = Query(None, description="image에 포함할 필드 (쉼표 구분)")
 ):
     """토너먼트 랭킹을 조회합니다."""
-    images = await TournamentService.get_rankings(db=db, limit=limit)
-
-    rankings = [
-        TournamentRankingItem(
-            rank=idx + 1,
-            image=ImageResponse(**image.__dict__, like_count=image.like_count),
-            win_count=image.tournament_win_count
+    selected_fields = parse_image_fields(fields)
+
+    async def render(session: AsyncSession) -> bytes:
+        images = await TournamentService.get_rankings(db=session, limit=limit, fields=selected_fields)
+
+        if selected_fields:
+            rankings = [
+                {
+                    "rank": idx + 1,
+                    "image": {name: image[name] for name in selected_fields},
+                    "win_count": image["tournament_win_count"],
+                }
+                for idx, image in enumerate(images)
+            ]
+            return dumps({"rankings": rankings, "total": len(rankings)})
+
+        rankings = [
+            TournamentRankingItem(
+                rank=idx + 1,
+                image=image,
+                win_count=image.tournament_win_count
+            )
+            for idx, image in enumerate(images)
+        ]
+        return TournamentRankingResponse(rankings=rankings, total=len(rankings)).model_dump_json().encode()
+
+    # 기본 요청(필드 선택 없음, 기본 개수)의 JSON은 워커 간 공유 캐시에 두고 그대로 응답하고,
+    # 그 밖의 파라미터 조합은 공유 캐시가 무한히 늘지 않도록 워커별 응답 캐시(LRU)에 보관
+    # 합쳐진 조회는 여러 요청이 기다리므로 요청 세션이 아닌 별도 세션으로 실행
+    if selected_fields is None and limit == _DEFAULT_RANKING_LIMIT:
+        body = await get_or_load_shared(CACHE_RANKINGS, limit, lambda: run_in_session(render))
+    else:
+        body = await response_cache.get_or_load(
+            CACHE_RANKINGS, (limit, tuple(selected_fields or ())), lambda: run_in_session(render)
         )
-        for idx, image in enumerate(images)
-    ]
-
-    return TournamentRankingResponse(
-        rankings=rankings,
-        total=len(rankings)
-    )
+    return json_response(request, body)
@@ -0,0 +1,168 @@
+"""
+프로세스 내 응답 캐시 (TTL + LRU)
+
+익명 사용자 모두에게 같은 결과를 주는 공개 조회(랭킹, 인기 피드, 목록 첫 페이지)의
+서비스 결과를 워커 프로세스 메모리에 잠시 보관합니다.
+
+- 키: (네임스페이스, 엔드포인트별 쿼리 파라미터 튜플)
+- 만료: TTL이 지나면 다시 조회, 최대 항목 수를 넘으면 가장 오래 안 쓴 항목부터 제거
+- 무효화: 쓰기 경로가 invalidate_on_commit으로 네임스페이스를 표시하면,
+  세션이 커밋된 뒤(after_commit) 해당 네임스페이스를 비웁니다.
+  조회 중에 무효화가 일어나면 그 조회 결과는 캐시에 넣지 않습니다 (세대 번호 비교).
+- 캐시 미스가 동시에 몰리면(만료 직후 등) 같은 키·세대의 조회는 singleflight로 한 번만 실행합니다.
+- 다른 워커 프로세스의 캐시는 TTL이 지나야 갱신됩니다.
+
+워커마다 같은 값을 따로 만들 필요가 없는 항목(랭킹 응답 JSON, 토너먼트 후보 ID 목록)은
+get_or_load_shared로 같은 호스트의 워커들이 mmap 공유 캐시(SharedCache)를 함께 씁니다.
+"""
+
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.utils.shared_cache import Buffer, SharedCache
+from app.utils.singleflight import SingleFlight
+
+T = TypeVar("T")
+
+# ===== 캐시 네임스페이스 =====
+CACHE_IMAGE_LIST = "image_list"
+CACHE_TOP_24H = "feed_top_24h"
+CACHE_RANKINGS = "rankings"
+CACHE_TOURNAMENT_POOL = "tournament_pool"
+
+# 이미지 응답(좋아요 수/승리 횟수 포함)을 담는 모든 네임스페이스
+IMAGE_NAMESPACES = (CACHE_IMAGE_LIST, CACHE_TOP_24H, CACHE_RANKINGS)
+
+_PENDING_KEY = "response_cache_invalidate"
+
+
+class ResponseCache:
+    """TTL/LRU 응답 캐시 (이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._flight = SingleFlight("response_cache")
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        캐시된 값을 반환하고, 없거나 만료되었으면 loader로 조회해 보관합니다.
+
+        Args:
+            namespace: 캐시 네임스페이스 (무효화 단위)
+            key: 네임스페이스 안의 키 (쿼리 파라미터 튜플 등)
+            loader: 캐시 미스 시 호출할 비동기 함수 (동시 호출자가 공유하므로
+                    요청 세션 대신 run_in_session으로 자체 세션 사용)
+
+        Returns:
+            T: 캐시된 값 또는 새로 조회한 값
+        """
+        entry_key = (namespace, key)
+        generation = self._generations.get(namespace, 0)
+
+        if not self.enabled:
+            return await self._flight.do((entry_key, generation), loader)
+
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(entry_key)
+                metrics.inc(f"cache.{namespace}.hits")
+                return value
+            del self._entries[entry_key]
+
+        # 같은 항목의 동시 미스는 한 번만 조회 (무효화 후 호출은 세대가 달라 새로 조회)
+        metrics.inc(f"cache.{namespace}.misses")
+        value = await self._flight.do((entry_key, generation), loader)
+
+        # 조회하는 동안 무효화되었다면 오래된 결과일 수 있으므로 보관하지 않음
+        if self._generations.get(namespace, 0) == generation:
+            self._entries[entry_key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                metrics.inc("cache.evictions")
+        return value
+
+    def invalidate(self, *namespaces: str) -> None:
+        """네임스페이스의 캐시 항목을 모두 제거합니다."""
+        targets = set(namespaces)
+        for namespace in targets:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            metrics.inc(f"cache.{namespace}.invalidations")
+        for entry_key in [k for k in self._entries if k[0] in targets]:
+            del self._entries[entry_key]
+
+    def invalidate_on_commit(self, db: AsyncSession, *namespaces: str) -> None:
+        """세션이 커밋되면 네임스페이스를 무효화하도록 표시합니다."""
+        db.sync_session.info.setdefault(_PENDING_KEY, set()).update(namespaces)
+
+
+def _shared_cache_dir() -> str:
+    if settings.SHARED_CACHE_DIR:
+        return settings.SHARED_CACHE_DIR
+    # tmpfs가 있으면 디스크 I/O 없이 메모리에서 공유
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "ai-image-cache")
+
+
+# 응답 캐시 싱글톤 인스턴스 (워커 프로세스별)
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+)
+
+# 워커 간 공유 캐시 (같은 호스트의 워커들이 함께 사용)
+shared_cache = SharedCache(
+    _shared_cache_dir(),
+    enabled=settings.SHARED_CACHE_ENABLED and settings.RESPONSE_CACHE_ENABLED,
+)
+
+
+async def get_or_load_shared(
+    namespace: str,
+    key: Hashable,
+    loader: Callable[[], Awaitable[bytes]]
+) -> Buffer:
+    """
+    직렬화된 값(bytes)을 워커 간 공유 캐시에서 찾거나 만들어 반환합니다.
+
+    공유 캐시는 항목 수 제한이 없으므로 기본 파라미터처럼 종류가 몇 개로 정해진 키만
+    넘기세요 (요청 파라미터 조합별 키는 response_cache.get_or_load 사용).
+    공유 캐시를 쓸 수 없으면 워커별 응답 캐시에 bytes로 보관합니다.
+    """
+    if shared_cache.enabled:
+        return await shared_cache.get_or_refresh(namespace, key, settings.RESPONSE_CACHE_TTL_SECONDS, loader)
+    return await response_cache.get_or_load(namespace, key, loader)
+
+
+def invalidate(*namespaces: str) -> None:
+    """워커별 응답 캐시와 공유 캐시에서 네임스페이스를 무효화합니다."""
+    response_cache.invalidate(*namespaces)
+    shared_cache.invalidate(*namespaces)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        invalidate(*pending)
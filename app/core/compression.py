@@ -0,0 +1,199 @@
+"""
+응답 압축 미들웨어
+
+Accept-Encoding에 따라 JSON/텍스트 응답을 brotli 또는 gzip으로 압축합니다.
+- minimum_size보다 작은 응답, 이미 Content-Encoding이 있는 응답,
+  압축 대상이 아닌 콘텐츠 타입(이미지 등)과 exclude_paths(/uploads)는 그대로 보냅니다.
+- cached_paths(랭킹 등 모든 사용자에게 같은 응답)는 본문 해시 기준으로
+  압축 결과를 LRU 캐시에 보관해, 같은 본문을 매번 다시 압축하지 않습니다.
+- 압축한 응답의 강한 ETag는 약한 ETag(W/"...")로 바꿉니다. 압축 결과는 원본과 바이트가
+  다르므로 같은 강한 ETag를 쓸 수 없고, If-None-Match 재검증은 약한 비교로 그대로 동작합니다.
+- brotli 패키지가 없으면 gzip만 사용합니다.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli는 선택 의존성
+    brotli = None
+
+# 압축할 콘텐츠 타입 (나머지는 이미 압축된 포맷이거나 효과가 작음)
+COMPRESSIBLE_TYPES = ("application/json", "application/javascript", "application/xml", "image/svg+xml", "text/")
+
+# 이보다 큰 본문은 이벤트 루프를 막지 않도록 스레드에서 압축
+_THREAD_MIN_SIZE = 256 * 1024
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 인코딩을 고릅니다 (br 우선, 다음 gzip).
+
+    Returns:
+        Optional[str]: 'br' | 'gzip' | None
+    """
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        token, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(token.strip())
+
+    if brotli is not None and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+class CompressedBodyCache:
+    """(인코딩, 본문 해시) → 압축 본문을 보관하는 스레드 안전 LRU 캐시 (총 바이트 상한)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, bytes]) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: tuple[str, bytes], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+class CompressionMiddleware:
+    """gzip/brotli 응답 압축 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        exclude_paths: tuple[str, ...] = (),
+        cached_paths: tuple[str, ...] = (),
+        cache_max_bytes: int = 16 * 1024 * 1024,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.exclude_paths = exclude_paths
+        self.cached_paths = cached_paths
+        self.cache = CompressedBodyCache(cache_max_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        cacheable = scope["path"].startswith(self.cached_paths) if self.cached_paths else False
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            if (
+                message.get("more_body", False)
+                or not self._should_compress(start_message["status"], headers, len(body))
+            ):
+                # 스트리밍/작은/압축 대상이 아닌 응답은 그대로 전달
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = await self._compress(body, encoding, cacheable)
+            headers.add_vary_header("Accept-Encoding")
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            metrics.inc(f"compression.{encoding}.responses")
+            metrics.inc("compression.bytes_in", len(body))
+            metrics.inc("compression.bytes_out", len(compressed))
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _should_compress(self, status: int, headers: MutableHeaders, size: int) -> bool:
+        if size < self.minimum_size or status in (204, 206, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def _compress(self, body: bytes, encoding: str, cacheable: bool) -> bytes:
+        key = None
+        if cacheable:
+            key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+            cached = self.cache.get(key)
+            if cached is not None:
+                metrics.inc("compression.cache_hits")
+                return cached
+            metrics.inc("compression.cache_misses")
+
+        if len(body) >= _THREAD_MIN_SIZE:
+            compressed = await asyncio.to_thread(self._encode, body, encoding)
+        else:
+            compressed = self._encode(body, encoding)
+
+        if key is not None:
+            self.cache.put(key, compressed)
+        return compressed
+
+    def _encode(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
@@ -45,6 +45,82 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "./uploads/images"
     MAX_FILE_SIZE: int = 10485760  # 10MB (바이트 단위)
     ALLOWED_EXTENSIONS: List[str] = ["jpg", "jpeg", "png", "gif", "webp"]
+    # 콘텐츠 주소 저장 모드: 파일 내용의 SHA-256 해시를 저장 키로 사용합니다.
+    # 같은 이미지를 다시 업로드하면 저장을 건너뛰고 기존 파일을 재사용합니다.
+    STORAGE_CONTENT_ADDRESSED: bool = False
+    # 로컬 저장 시 'ab/cd/<파일명>' 형태의 해시 프리픽스 하위 디렉토리에 나눠 저장합니다.
+    # 기존 평면 구조 파일은 그대로 서빙/삭제되며, app.scripts.migrate_upload_shards로 이전할 수 있습니다.
+    UPLOAD_SHARDING: bool = True
+    # /uploads 서빙: 업로드 파일은 바뀌지 않으므로 immutable 캐시 (초, 기본 1년)
+    UPLOADS_CACHE_MAX_AGE: int = 31536000
+    # 자주 요청되는 파일의 열린 fd/stat을 워커별로 보관하는 개수와 재확인 주기(초)
+    UPLOADS_FILE_CACHE_SIZE: int = 256
+    UPLOADS_FILE_CACHE_TTL_SECONDS: float = 60.0
+    # nginx 뒤에서 실행할 때 internal location 경로 (예: '/_uploads'). 설정하면 X-Accel-Redirect로
+    # 파일 전송을 nginx(sendfile)에 넘깁니다. 비어 있으면 앱이 직접 전송합니다.
+    UPLOADS_ACCEL_REDIRECT_PREFIX: str = ""
+
+    # ===== 이미지 처리 설정 =====
+    # CPU 작업(리사이즈/인코딩)을 실행할 프로세스 풀 크기 (0이면 CPU 코어 수)
+    IMAGE_WORKER_PROCESSES: int = 2
+    # 업로드 후 피드/카드용 축소 이미지(변형)를 생성할지 여부
+    IMAGE_VARIANTS_ENABLED: bool = True
+    # 생성할 변형 크기 (긴 변 기준 픽셀, 원본보다 큰 크기는 생성하지 않음)
+    IMAGE_VARIANT_SIZES: List[int] = [256, 512, 1024]
+    IMAGE_VARIANT_FORMAT: str = "webp"  # 'webp' | 'jpeg' | 'png'
+    IMAGE_VARIANT_QUALITY: int = 80
+
+    # 업로드 원본을 저장 전에 다시 인코딩(EXIF 제거 + WebP/JPEG, 애니메이션 GIF는 애니메이션 WebP)
+    TRANSCODE_ENABLED: bool = False
+    TRANSCODE_FORMAT: str = "webp"  # 'webp' | 'jpeg'
+    TRANSCODE_QUALITY: int = 82
+    # 트랜스코딩 전 원본 파일도 '<이름>_original.<확장자>'로 보관할지 여부
+    TRANSCODE_KEEP_ORIGINAL: bool = False
+
+    # 유사 이미지 판정 기준 (64비트 지각 해시의 해밍 거리, 작을수록 엄격)
+    PHASH_MAX_DISTANCE: int = 6
+
+    # ===== 자동완성 설정 =====
+    # 모델명/프롬프트 구절 트라이를 DB에서 다시 집계하는 주기(초)와 접두사별 후보 수
+    SUGGEST_REBUILD_SECONDS: int = 600
+    SUGGEST_TOP_K: int = 10
+    # 프롬프트 구절 집계에 사용할 최근 게시물 수, 트라이에 넣을 최대 구절 수/노드 수 (메모리 상한)
+    SUGGEST_PROMPT_SAMPLE: int = 10000
+    SUGGEST_MAX_FRAGMENTS: int = 20000
+    SUGGEST_MAX_NODES: int = 300000
+
+    # ===== 조회 API 설정 =====
+    # 일괄 조회(GET/POST /images/batch) 한 번에 요청할 수 있는 최대 ID 수
+    IMAGE_BATCH_MAX_IDS: int = 100
+    # 랭킹/인기 피드/목록 첫 페이지 응답 캐시 (워커별 메모리, 쓰기 시 무효화)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    # 랭킹 응답/토너먼트 후보 ID 목록을 같은 호스트의 워커들이 mmap 파일로 공유 (Linux/macOS)
+    SHARED_CACHE_ENABLED: bool = True
+    SHARED_CACHE_DIR: str = ""  # 비어 있으면 /dev/shm/ai-image-cache (없으면 임시 디렉토리)
+    # 공개 조회 응답의 Cache-Control (브라우저 max-age / CDN s-maxage, 초). 이후에는 ETag로 재검증
+    HTTP_CACHE_MAX_AGE: int = 5
+    HTTP_CACHE_S_MAXAGE: int = 30
+    # 워커 간 캐시 무효화 (PostgreSQL LISTEN/NOTIFY, 다른 DB에서는 사용 안 함)
+    INVALIDATION_BUS_ENABLED: bool = True
+    INVALIDATION_CHANNEL: str = "image_events"
+
+    # ===== 응답 압축 설정 =====
+    # JSON/텍스트 응답을 Accept-Encoding에 따라 brotli(설치 시) 또는 gzip으로 압축합니다.
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # 이보다 작은 응답은 압축하지 않음 (바이트)
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    # 랭킹 등 공용 응답의 압축 결과 캐시 크기 (바이트)
+    COMPRESSION_CACHE_MAX_BYTES: int = 16777216  # 16MB
+
+    # ===== 온디맨드 리사이즈(render) 설정 =====
+    # 미리 만들지 않은 크기를 요청 시 생성하고, 결과를 디스크 LRU 캐시에 보관합니다.
+    RENDER_CACHE_DIR: str = "./cache/render"
+    RENDER_CACHE_MAX_BYTES: int = 536870912  # 512MB
+    RENDER_MAX_WIDTH: int = 2048
+    RENDER_QUALITY: int = 80
 
     # ===== S3 설정 (STORAGE_BACKEND='s3'일 때 사용) =====
     # 참고: EC2에서는 인스턴스 프로파일(IAM Role) 사용을 권장하며,
@@ -60,16 +136,21 @@ class Settings(BaseSettings):
     # 공개 URL 베이스를 오버라이드하고 싶을 때 사용 (예: CloudFront 도메인).
     # 설정 시: 최종 URL = f"{AWS_S3_PUBLIC_URL}/{key}"
     AWS_S3_PUBLIC_URL: str = ""
+    # S3 원본을 로컬 디스크에 캐시 (리사이즈/해시/백필이 같은 오브젝트를 반복 다운로드하지 않도록)
+    # 디렉토리는 워커 간 공유되며, 크기를 넘으면 오래 사용하지 않은 파일부터 삭제합니다.
+    STORAGE_CACHE_ENABLED: bool = True
+    STORAGE_CACHE_DIR: str = "./cache/objects"
+    STORAGE_CACHE_MAX_BYTES: int = 2147483648  # 2GB
 
     # ===== 서버 설정 =====
     HOST: str = "0.0.0.0"
     PORT: int = 8000
 
-    @field_validator("ALLOWED_EXTENSIONS", mode="before")
+    @field_validator("ALLOWED_EXTENSIONS", "IMAGE_VARIANT_SIZES", mode="before")
     @classmethod
     def parse_extensions(cls, v):
         """
-        허용 확장자를 파싱합니다.
+        허용 확장자(및 변형 크기 같은 목록 설정)를 파싱합니다.
 
         환경변수에서 JSON 배열 또는 콤마 구분 문자열을 받아 리스트로 변환합니다.
         """
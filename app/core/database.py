@@ -4,7 +4,7 @@
 SQLAlchemy 2.0의 비동기(async) 패턴을 사용합니다.
 """
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable, TypeVar
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -20,6 +20,13 @@ from app.models.base import Base
 from app.models.image_post import ImagePost  # noqa: F401
 from app.models.image_like import ImageLike  # noqa: F401
 from app.models.tournament_vote import TournamentVote  # noqa: F401
+from app.models.storage_object import StorageObject  # noqa: F401
+from app.models.image_color import ImageColorBucket  # noqa: F401
+from app.models.prompt_bucket import ImagePromptBucket  # noqa: F401
+from app.models.facet_count import FacetCount  # noqa: F401
+from app.models import search_index  # noqa: F401  (전문 검색 인덱스 DDL)
+
+T = TypeVar("T")
 
 # ===== 비동기 엔진 생성 =====
 engine = create_async_engine(
@@ -67,6 +74,23 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def run_in_session(fn: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """
+    요청과 무관한 새 세션으로 fn을 실행합니다.
+
+    여러 요청이 함께 기다리는 작업(singleflight/응답 캐시 로더)에 사용합니다.
+    처음 호출한 요청의 세션을 쓰면, 그 요청이 끊겨 get_db가 세션을 닫을 때
+    다른 요청을 위해 계속 실행 중인 작업도 함께 깨지기 때문입니다.
+
+    Example:
+        ```python
+        body = await response_cache.get_or_load(namespace, key, lambda: run_in_session(render))
+        ```
+    """
+    async with AsyncSessionLocal() as session:
+        return await fn(session)
+
+
 # ===== 데이터베이스 초기화 함수 =====
 async def init_db() -> None:
     """
@@ -10,6 +10,8 @@ from fastapi import FastAPI
 
 from app.core.database import init_db, close_db
 from app.core.config import settings
+from app.core.process_pool import shutdown_process_pool
+from app.services.invalidation_service import InvalidationService
 
 
 @asynccontextmanager
@@ -20,8 +22,11 @@ async def lifespan(app: FastAPI):
     시작 시:
         - 업로드 디렉토리 생성
         - 데이터베이스 테이블 초기화 (개발 환경)
+        - 워커 간 캐시 무효화 리스너 시작 (PostgreSQL)
 
     종료 시:
+        - 캐시 무효화 리스너 종료
+        - 이미지 처리 프로세스 풀 종료
         - 데이터베이스 연결 종료
     """
     # ===== 시작 시 실행 =====
@@ -47,6 +52,12 @@ async def lifespan(app: FastAPI):
     else:
         print("ℹ️  운영 환경: Alembic 마이그레이션을 사용하세요")
 
+    # 워커 간 캐시 무효화 (다른 워커의 쓰기를 로컬 캐시/인덱스에 반영)
+    if InvalidationService.enabled():
+        await InvalidationService.start()
+    else:
+        print("ℹ️  워커 간 캐시 무효화 비활성 (PostgreSQL 전용)")
+
     print("=" * 60)
     print(f"✅ 서버 준비 완료: http://{settings.HOST}:{settings.PORT}")
     print("=" * 60)
@@ -58,6 +69,13 @@ async def lifespan(app: FastAPI):
     print("🛑 애플리케이션 종료 중...")
     print("=" * 60)
 
+    # 캐시 무효화 리스너 종료
+    await InvalidationService.stop()
+
+    # 이미지 처리 프로세스 풀 종료
+    shutdown_process_pool()
+    print("✅ 이미지 처리 프로세스 풀 종료")
+
     # 데이터베이스 연결 종료
     await close_db()
     print("✅ 데이터베이스 연결 종료")
@@ -0,0 +1,37 @@
+"""
+간단한 애플리케이션 메트릭
+
+프로세스 내부 카운터를 모아 /metrics 엔드포인트로 노출합니다.
+외부 의존성 없이 동작하며, 값은 워커 프로세스별로 집계됩니다
+(여러 워커를 띄운 경우 수집 측에서 합산하세요).
+"""
+
+import threading
+from collections import defaultdict
+
+
+class Metrics:
+    """스레드 안전한 카운터 모음"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = defaultdict(int)
+
+    def inc(self, name: str, value: float = 1) -> None:
+        """카운터를 value만큼 증가시킵니다."""
+        with self._lock:
+            self._counters[name] += value
+
+    def get(self, name: str) -> float:
+        """카운터의 현재 값을 반환합니다."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict[str, float]:
+        """모든 카운터의 현재 값을 복사해 반환합니다."""
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+
+
+# 메트릭 싱글톤 인스턴스
+metrics = Metrics()
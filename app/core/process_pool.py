@@ -0,0 +1,68 @@
+"""
+CPU 작업용 프로세스 풀 관리
+
+이미지 리사이즈/인코딩처럼 CPU를 많이 쓰는 작업을 별도 프로세스에서 실행하여
+이벤트 루프가 막히지 않도록 합니다.
+풀은 처음 사용할 때 생성되고, 애플리케이션 종료 시 lifespan에서 정리됩니다.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    공유 프로세스 풀을 반환합니다 (없으면 생성).
+
+    fork 대신 spawn을 사용합니다. 이벤트 루프/DB 커넥션을 가진 부모 프로세스를
+    그대로 복제하지 않기 위함입니다. 작업 함수는 모듈 최상위 함수여야 합니다.
+
+    Args:
+        max_workers: 풀을 새로 만들 때의 프로세스 수 (없으면 IMAGE_WORKER_PROCESSES 설정,
+                     0이면 CPU 코어 수). 이미 만들어진 풀에는 영향이 없습니다.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=max_workers or settings.IMAGE_WORKER_PROCESSES or None,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+async def run_in_process(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    함수를 프로세스 풀에서 실행하고 결과를 기다립니다.
+
+    Example:
+        ```python
+        variants = await run_in_process(generate_variants, content, [256, 512])
+        ```
+    """
+    global _executor
+    loop = asyncio.get_running_loop()
+    executor = get_process_pool()
+    try:
+        return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+    except BrokenProcessPool:
+        # 워커가 비정상 종료(OOM 등)되면 풀을 버리고 다음 호출에서 새로 만듭니다
+        if _executor is executor:
+            _executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def shutdown_process_pool() -> None:
+    """프로세스 풀을 종료합니다. 애플리케이션 종료 시 호출됩니다."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,105 @@
+"""
+JSON 응답 클래스
+
+orjson으로 직렬화하는 JSONResponse입니다. orjson이 설치되지 않은 환경에서는
+FastAPI 기본 방식(jsonable_encoder + 표준 json)으로 동작합니다.
+
+response_model이 있는 엔드포인트는 FastAPI가 pydantic-core로 바로 JSON 바이트를
+만들므로 이 클래스를 쓰지 않습니다 (response_class를 지정하면 그 경로가 꺼짐).
+response_model 검증을 건너뛰고 dict/list를 직접 돌려주는 응답(sparse fieldsets 등)에 사용합니다.
+
+조건부 GET (ETag / If-None-Match):
+- json_response()는 직렬화된 본문의 해시를 강한 ETag로 붙이고, If-None-Match가 일치하면
+  본문 없이 304를 반환합니다. 본문이 캐시에서 나오면 쿼리 없이 304가 결정됩니다.
+- 압축 미들웨어는 압축한 응답의 ETag를 약한 ETag(W/"...")로 바꾸므로,
+  If-None-Match는 약한 비교(W/ 무시)로 판단합니다.
+- 공개 조회 응답에는 CDN이 보관할 수 있도록 PUBLIC_CACHE_CONTROL을 붙입니다.
+"""
+
+import hashlib
+from typing import Any, Union
+
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 requirements.txt에 포함
+    orjson = None
+
+# 날짜는 pydantic과 같은 ISO 8601 형식 (UTC는 'Z' 접미사), dict 키는 문자열로 변환
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z) if orjson else 0
+
+
+def dumps(content: Any) -> bytes:
+    """content를 JSON 바이트로 직렬화합니다 (datetime/dict/list/원시 타입)."""
+    if orjson is None:
+        return JSONResponse(content=jsonable_encoder(content)).body
+    return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+# 공개 조회 응답의 캐시 정책 (브라우저는 짧게, CDN은 s-maxage 동안 보관 후 ETag로 재검증)
+PUBLIC_CACHE_CONTROL = (
+    f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, s-maxage={settings.HTTP_CACHE_S_MAXAGE}"
+)
+
+
+def etag_for(body: Union[bytes, memoryview]) -> str:
+    """본문 해시로 강한 ETag를 만듭니다."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 약한 비교로 확인합니다 (목록, '*' 지원)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in header.split(","))
+
+
+def not_modified(etag: str, cache_control: str = PUBLIC_CACHE_CONTROL) -> Response:
+    """본문 없는 304 응답을 만듭니다."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control}
+    )
+
+
+def json_response(
+    request: Request,
+    body: Union[bytes, memoryview],
+    cache_control: str = PUBLIC_CACHE_CONTROL
+) -> Response:
+    """
+    직렬화된 JSON 본문을 ETag와 Cache-Control을 붙여 반환합니다.
+
+    Args:
+        request: 요청 (If-None-Match 확인)
+        body: JSON 본문 바이트
+        cache_control: Cache-Control 헤더 값
+
+    Returns:
+        Response: If-None-Match가 일치하면 304, 아니면 200 응답
+    """
+    etag = etag_for(body)
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+    return Response(
+        content=bytes(body),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control}
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 본문을 만드는 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
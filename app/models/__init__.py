@@ -4,6 +4,11 @@ from app.models.base import Base, TimestampMixin
 from app.models.image_post import ImagePost
 from app.models.image_like import ImageLike
 from app.models.tournament_vote import TournamentVote
+from app.models.storage_object import StorageObject
+from app.models.image_color import ImageColorBucket
+from app.models.prompt_bucket import ImagePromptBucket
+from app.models.facet_count import FacetCount
+from app.models import search_index  # noqa: F401  (image_posts 생성 시 검색 인덱스 DDL 등록)
 
 __all__ = [
     "Base",
@@ -11,4 +16,8 @@ __all__ = [
     "ImagePost",
     "ImageLike",
     "TournamentVote",
+    "StorageObject",
+    "ImageColorBucket",
+    "ImagePromptBucket",
+    "FacetCount",
 ]
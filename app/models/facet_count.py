@@ -0,0 +1,55 @@
+"""
+갤러리 패싯 집계 모델
+
+모델명별/토너먼트 참여 여부별 활성 이미지 수를 미리 집계해 저장합니다.
+"""
+
+from sqlalchemy import String, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+
+class FacetCount(Base, TimestampMixin):
+    """
+    패싯 집계 모델
+
+    (facet, value)마다 활성 이미지 수를 저장합니다.
+    이미지 생성/수정/삭제 시 ImageService가 증감하며, 정합성 점검 스크립트로 다시 맞출 수 있습니다.
+    """
+    __tablename__ = "image_facet_counts"
+
+    # ===== 기본 필드 =====
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        autoincrement=True,
+        comment="패싯 집계 ID"
+    )
+
+    facet: Mapped[str] = mapped_column(
+        String(30),
+        nullable=False,
+        comment="패싯 종류 (model_name | tournament_opt_in)"
+    )
+
+    value: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="패싯 값 (모델명 미지정은 빈 문자열, 토너먼트 참여는 'true'/'false')"
+    )
+
+    count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="해당 값을 가진 활성 이미지 수"
+    )
+
+    # ===== 제약조건 =====
+    __table_args__ = (
+        UniqueConstraint("facet", "value", name="uq_facet_value"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<FacetCount(facet={self.facet}, value={self.value}, count={self.count})>"
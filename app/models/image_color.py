@@ -0,0 +1,49 @@
+"""
+이미지 색상 버킷 모델
+
+색상 검색을 위해 이미지 팔레트의 각 색을 양자화한 버킷 번호를 저장합니다.
+"""
+
+from sqlalchemy import Integer, SmallInteger, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ImageColorBucket(Base):
+    """
+    이미지 색상 버킷 모델
+
+    이미지 팔레트의 색마다 (버킷 번호, 이미지 ID) 한 행을 저장합니다.
+    (bucket, image_post_id) 인덱스로 "이 색을 포함한 이미지"를 행별 계산 없이 찾습니다.
+    """
+    __tablename__ = "image_color_buckets"
+
+    # ===== 기본 필드 =====
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        autoincrement=True,
+        comment="색상 버킷 ID"
+    )
+
+    image_post_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("image_posts.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="이미지 게시물 ID"
+    )
+
+    bucket: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        comment="양자화된 색상 버킷 번호 (채널별 4단계, 0~63)"
+    )
+
+    # ===== 제약조건 및 인덱스 =====
+    __table_args__ = (
+        UniqueConstraint("image_post_id", "bucket", name="uq_image_color_bucket"),
+        Index("idx_color_bucket_image", "bucket", "image_post_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ImageColorBucket(image_post_id={self.image_post_id}, bucket={self.bucket})>"
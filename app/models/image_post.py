@@ -5,7 +5,7 @@ AI로 생성한 이미지 게시물을 저장합니다.
 """
 
 from typing import Optional, List
-from sqlalchemy import String, Text, Boolean, Integer, Index
+from sqlalchemy import String, Text, Boolean, Integer, BigInteger, Index, JSON, LargeBinary
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -51,6 +51,73 @@ class ImagePost(Base, TimestampMixin):
         comment="사용한 AI 모델명 (예: DALL-E, Midjourney, Stable Diffusion)"
     )
 
+    original_url: Mapped[Optional[str]] = mapped_column(
+        String(500),
+        nullable=True,
+        comment="트랜스코딩 전 원본 파일 URL (원본 보관 설정 시에만)"
+    )
+
+    # ===== 이미지 메타데이터 (업로드 시 추출) =====
+    width: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="이미지 너비 (픽셀)"
+    )
+
+    height: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="이미지 높이 (픽셀)"
+    )
+
+    file_size: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="원본 파일 크기 (바이트)"
+    )
+
+    mime_type: Mapped[Optional[str]] = mapped_column(
+        String(50),
+        nullable=True,
+        comment="원본 파일 MIME 타입 (예: image/png)"
+    )
+
+    dominant_color: Mapped[Optional[str]] = mapped_column(
+        String(7),
+        nullable=True,
+        comment="대표 색상 (#rrggbb, 이미지 로딩 전 배경색으로 사용)"
+    )
+
+    palette: Mapped[Optional[list]] = mapped_column(
+        JSON,
+        nullable=True,
+        comment="주요 색상 팔레트 (#rrggbb 목록, 면적이 넓은 순)"
+    )
+
+    placeholder: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="로딩 전 표시용 초소형 WebP 썸네일 (base64 data URI)"
+    )
+
+    phash: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        nullable=True,
+        comment="지각 해시 (64비트 dHash, 유사/중복 이미지 탐지용)"
+    )
+
+    prompt_signature: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        comment="프롬프트 MinHash 서명 (64 x 32비트, 비슷한 프롬프트 추천용)"
+    )
+
+    variant_urls: Mapped[Optional[dict]] = mapped_column(
+        JSON,
+        nullable=True,
+        comment="크기별 축소 이미지 URL (예: {\"256\": \"...\", \"512\": \"...\"})"
+    )
+
     # ===== 토너먼트 관련 =====
     is_tournament_opt_in: Mapped[bool] = mapped_column(
         Boolean,
@@ -60,6 +127,15 @@ class ImagePost(Base, TimestampMixin):
         comment="토너먼트 참여 여부"
     )
 
+    # ===== 반응 =====
+    like_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="좋아요 수 (좋아요 추가/취소 시 함께 증감)"
+    )
+
     tournament_win_count: Mapped[int] = mapped_column(
         Integer,
         default=0,
@@ -78,11 +154,14 @@ class ImagePost(Base, TimestampMixin):
     )
 
     # ===== 관계 설정 =====
+    # 좋아요 수는 like_count 컬럼을 사용하므로 목록은 자동으로 불러오지 않음
+    # (게시물 삭제 시 좋아요 행은 DB의 ON DELETE CASCADE로 정리)
     likes: Mapped[List["ImageLike"]] = relationship(
         "ImageLike",
         back_populates="image_post",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,
+        lazy="noload"
     )
 
     # ===== 인덱스 설정 =====
@@ -97,6 +176,10 @@ class ImagePost(Base, TimestampMixin):
         return f"<ImagePost(id={self.id}, user_id={self.user_id}, prompt='{self.prompt[:30]}...')>"
 
     @property
-    def like_count(self) -> int:
-        """좋아요 개수를 반환합니다."""
-        return len(self.likes) if self.likes else 0
+    def file_urls(self) -> list[str]:
+        """이 게시물이 저장소에 가진 모든 파일 URL (원본, 보관 원본, 변형)을 반환합니다."""
+        urls = [self.image_url]
+        if self.original_url:
+            urls.append(self.original_url)
+        urls.extend((self.variant_urls or {}).values())
+        return urls
@@ -0,0 +1,56 @@
+"""
+프롬프트 LSH 버킷 모델
+
+"비슷한 프롬프트" 추천을 위해 프롬프트 MinHash 서명의 밴드별 버킷 키를 저장합니다.
+"""
+
+from sqlalchemy import Integer, SmallInteger, BigInteger, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ImagePromptBucket(Base):
+    """
+    프롬프트 LSH 버킷 모델
+
+    이미지마다 밴드 수(16)만큼 (밴드 번호, 버킷 키) 행을 저장합니다.
+    서버는 시작 후 처음 조회할 때 이 테이블을 메모리 인덱스로 적재하고,
+    (band, bucket) 인덱스로 같은 버킷의 이미지를 DB에서 바로 찾을 수도 있습니다.
+    """
+    __tablename__ = "image_prompt_buckets"
+
+    # ===== 기본 필드 =====
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        autoincrement=True,
+        comment="프롬프트 버킷 ID"
+    )
+
+    image_post_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("image_posts.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="이미지 게시물 ID"
+    )
+
+    band: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        comment="LSH 밴드 번호"
+    )
+
+    bucket: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        comment="밴드 값의 해시 (버킷 키)"
+    )
+
+    # ===== 인덱스 =====
+    __table_args__ = (
+        Index("idx_prompt_bucket_band", "band", "bucket"),
+        Index("idx_prompt_bucket_image", "image_post_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ImagePromptBucket(image_post_id={self.image_post_id}, band={self.band})>"
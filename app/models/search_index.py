@@ -0,0 +1,80 @@
+"""
+프롬프트 전문 검색 인덱스 DDL
+
+image_posts 테이블이 생성될 때 DB 종류에 맞는 검색 인덱스를 함께 만듭니다.
+- PostgreSQL: 저장형 생성 컬럼 prompt_tsv(tsvector) + GIN 인덱스
+- SQLite: FTS5 외부 콘텐츠 테이블 image_posts_fts + 동기화 트리거 (로컬/테스트 환경용)
+
+두 구조 모두 ORM에 매핑하지 않고 SearchService에서 SQL 식으로만 참조합니다.
+"""
+
+from sqlalchemy import DDL, event
+from sqlalchemy.engine import Connection
+
+from app.models.image_post import ImagePost
+
+# tsvector 변환 설정 (한국어/영어 프롬프트가 섞여 있으므로 형태소 분석 없이 단어 단위로 색인)
+TS_CONFIG = "simple"
+
+POSTGRES_DDL = [
+    f"""
+    ALTER TABLE image_posts
+    ADD COLUMN IF NOT EXISTS prompt_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('{TS_CONFIG}', coalesce(prompt, ''))) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_prompt_tsv ON image_posts USING GIN (prompt_tsv)",
+]
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS image_posts_fts
+    USING fts5(prompt, content='image_posts', content_rowid='id', tokenize='unicode61')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS image_posts_fts_ai AFTER INSERT ON image_posts BEGIN
+        INSERT INTO image_posts_fts(rowid, prompt) VALUES (new.id, new.prompt);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS image_posts_fts_ad AFTER DELETE ON image_posts BEGIN
+        INSERT INTO image_posts_fts(image_posts_fts, rowid, prompt) VALUES ('delete', old.id, old.prompt);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS image_posts_fts_au AFTER UPDATE OF prompt ON image_posts BEGIN
+        INSERT INTO image_posts_fts(image_posts_fts, rowid, prompt) VALUES ('delete', old.id, old.prompt);
+        INSERT INTO image_posts_fts(rowid, prompt) VALUES (new.id, new.prompt);
+    END
+    """,
+]
+
+for statement in POSTGRES_DDL:
+    event.listen(ImagePost.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+for statement in SQLITE_DDL:
+    event.listen(ImagePost.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+event.listen(
+    ImagePost.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS image_posts_fts").execute_if(dialect="sqlite"),
+)
+
+
+def create_search_index(conn: Connection) -> None:
+    """
+    이미 존재하는 image_posts 테이블에 검색 인덱스를 추가합니다 (여러 번 실행해도 안전).
+
+    SQLite는 기존 행을 FTS 테이블에 다시 색인합니다.
+    PostgreSQL은 생성 컬럼 추가 시 기존 행이 자동으로 계산됩니다.
+    """
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        for statement in POSTGRES_DDL:
+            conn.exec_driver_sql(statement)
+    elif dialect == "sqlite":
+        for statement in SQLITE_DDL:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql("INSERT INTO image_posts_fts(image_posts_fts) VALUES ('rebuild')")
+    else:
+        raise RuntimeError(f"전문 검색을 지원하지 않는 데이터베이스입니다: {dialect}")
@@ -0,0 +1,46 @@
+"""
+저장 객체 참조 카운트 모델
+
+콘텐츠 주소 저장 모드에서 하나의 파일을 여러 이미지 게시물이 공유할 수 있으므로,
+파일별로 몇 개의 게시물이 참조하고 있는지 기록합니다.
+"""
+
+from sqlalchemy import String, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, TimestampMixin
+
+
+class StorageObject(Base, TimestampMixin):
+    """
+    저장 객체 참조 카운트 모델
+
+    활성 ImagePost가 참조할 때마다 ref_count가 1 증가하고, 삭제 시 1 감소합니다.
+    ref_count가 0이 되면 커밋 후 삭제 작업이 이 행을 잠그고 지우면서 실제 파일을 삭제합니다.
+    """
+    __tablename__ = "storage_objects"
+
+    # ===== 기본 필드 =====
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        autoincrement=True,
+        comment="저장 객체 ID"
+    )
+
+    object_key: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        unique=True,
+        comment="저장 키 (콘텐츠 해시 기반 파일명)"
+    )
+
+    ref_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="이 파일을 참조하는 활성 이미지 게시물 수"
+    )
+
+    def __repr__(self) -> str:
+        return f"<StorageObject(object_key={self.object_key}, ref_count={self.ref_count})>"
@@ -24,6 +24,11 @@ class ImageUpdateRequest(BaseModel):
     is_tournament_opt_in: Optional[bool] = None
 
 
+class ImageBatchRequest(BaseModel):
+    """이미지 일괄 조회 요청 스키마"""
+    ids: list[int] = Field(..., min_length=1, description="조회할 이미지 ID 목록 (순서 유지)")
+
+
 # ===== 응답 스키마 =====
 class ImageResponse(BaseModel):
     """이미지 단일 응답 스키마"""
@@ -32,8 +37,18 @@ class ImageResponse(BaseModel):
     id: int
     user_id: int
     image_url: str
+    original_url: Optional[str] = None  # 트랜스코딩 전 원본 URL (보관 설정 시)
     prompt: str
     model_name: Optional[str]
+    variant_urls: Optional[dict[str, str]] = None  # 크기별 축소 이미지 URL (피드/카드용)
+    # 이미지 메타데이터 (클라이언트가 이미지를 받기 전에 그리드 레이아웃을 잡을 수 있도록)
+    width: Optional[int] = None
+    height: Optional[int] = None
+    file_size: Optional[int] = None
+    mime_type: Optional[str] = None
+    dominant_color: Optional[str] = None
+    palette: Optional[list[str]] = None  # 주요 색상 팔레트 (#rrggbb, 면적이 넓은 순)
+    placeholder: Optional[str] = None  # 초소형 WebP data URI (원본 로딩 전 즉시 표시용)
     is_tournament_opt_in: bool
     tournament_win_count: int
     is_active: bool
@@ -51,6 +66,48 @@ class ImageListResponse(BaseModel):
     has_next: bool
 
 
+class ImageBatchResponse(BaseModel):
+    """이미지 일괄 조회 응답 스키마"""
+    items: list[Optional[ImageResponse]]  # 요청한 ids와 같은 순서, 없는 이미지는 null
+    missing: list[int]  # 찾을 수 없거나 삭제된 이미지 ID
+
+
+class ImageSearchResponse(BaseModel):
+    """프롬프트 검색 응답 스키마 (키셋 페이지네이션)"""
+    items: list[ImageResponse]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (없으면 마지막 페이지)
+
+
+class FacetValue(BaseModel):
+    """패싯 값별 이미지 수"""
+    value: Optional[str]  # 모델명 미지정은 null, 토너먼트 참여는 "true"/"false"
+    count: int
+
+
+class ImageFacetsResponse(BaseModel):
+    """갤러리 패싯 응답 스키마"""
+    model_name: list[FacetValue]
+    tournament_opt_in: list[FacetValue]
+
+
+class SuggestionItem(BaseModel):
+    """자동완성 후보 항목"""
+    text: str
+    count: int  # 사용 빈도
+
+
+class SimilarImageItem(BaseModel):
+    """비슷한 프롬프트 이미지 항목"""
+    image: ImageResponse
+    similarity: float  # 프롬프트 유사도 추정치 (0~1, MinHash 기준)
+
+
+class NearDuplicateItem(BaseModel):
+    """유사 이미지 항목"""
+    image: ImageResponse
+    distance: int  # 지각 해시의 해밍 거리 (0이면 같은 해시)
+
+
 class ImageDetailResponse(ImageResponse):
     """이미지 상세 응답 스키마 (추가 정보 포함 가능)"""
     pass
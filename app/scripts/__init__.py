@@ -0,0 +1 @@
+"""운영/유지보수용 스크립트 패키지 (python -m app.scripts.<이름> 으로 실행)"""
@@ -0,0 +1,126 @@
+"""
+이미지 배치 백필 공통 실행기
+
+기존 image_posts 행에 대해 원본 파일을 읽어 프로세스 풀에서 분석하고,
+결과를 배치 단위로 일괄 UPDATE 합니다.
+
+- 처리 대상은 pending 조건(예: width IS NULL)으로 고르므로, 중단 후 다시 실행하면 남은 행만 처리합니다.
+- 배치 안에서 파일 읽기와 분석은 동시에 실행되며, 분석은 여러 워커 프로세스에 분산됩니다.
+- 실패한 행은 건너뛰고 다음 배치로 진행합니다 (다음 실행 시 다시 시도됨).
+- 시작 전에 스키마 업그레이드(upgrade_schema)를 실행하므로, 채울 컬럼이 없는 기존 DB에서도 동작합니다.
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, close_db, engine
+from app.core.process_pool import get_process_pool, run_in_process, shutdown_process_pool
+from app.models.image_post import ImagePost
+from app.scripts.upgrade_schema import upgrade_schema
+from app.utils.file_handler import read_file
+
+
+async def _process_row(
+    image_url: str,
+    worker_fn: Callable[..., Any],
+    worker_args: tuple,
+    semaphore: asyncio.Semaphore,
+) -> Optional[Any]:
+    """한 행의 원본을 읽어 워커 프로세스에서 분석합니다. 실패하면 None."""
+    async with semaphore:
+        try:
+            content = await read_file(image_url)
+            return await run_in_process(worker_fn, content, *worker_args)
+        except Exception as e:
+            print(f"⚠️  처리 실패 ({image_url}): {e}")
+            return None
+
+
+async def run_backfill(
+    *,
+    name: str,
+    pending: ColumnElement[bool],
+    worker_fn: Callable[..., Any],
+    to_values: Callable[[Any], dict],
+    worker_args: tuple = (),
+    batch_size: int = 200,
+    workers: int = 0,
+    after_update: Optional[Callable[[AsyncSession, list[dict]], Awaitable[None]]] = None,
+) -> None:
+    """
+    pending 조건에 맞는 활성 이미지들을 배치로 분석해 컬럼을 채웁니다.
+
+    Args:
+        name: 로그에 표시할 작업 이름
+        pending: 처리 대상 조건 (예: ImagePost.width.is_(None))
+        worker_fn: 워커 프로세스에서 실행할 함수 (첫 인자는 이미지 바이트)
+        to_values: worker_fn 결과를 {컬럼명: 값} 딕셔너리로 변환하는 함수
+        worker_args: worker_fn에 추가로 넘길 인자
+        batch_size: 배치당 처리할 행 수
+        workers: 워커 프로세스 수 (0이면 IMAGE_WORKER_PROCESSES 설정 사용)
+        after_update: 배치 UPDATE 직후 같은 트랜잭션에서 실행할 함수
+                      (세션과 [{"_id": 이미지 ID, 컬럼명: 값, ...}] 목록을 받음)
+    """
+    # 전역 설정을 바꾸지 않고 이 실행에서 쓸 프로세스 수로 풀을 만듦
+    processes = workers or settings.IMAGE_WORKER_PROCESSES or os.cpu_count() or 1
+    get_process_pool(processes)
+
+    table = ImagePost.__table__
+    semaphore = asyncio.Semaphore(processes * 2)
+    last_id = 0
+    done = 0
+    failed = 0
+
+    try:
+        # 채울 컬럼이 아직 없는 DB라면 먼저 추가
+        async with engine.begin() as conn:
+            added = await conn.run_sync(upgrade_schema)
+        if added:
+            print(f"✅ [{name}] 스키마 업그레이드: {', '.join(added)}")
+
+        while True:
+            async with AsyncSessionLocal() as db:
+                stmt = (
+                    select(ImagePost.id, ImagePost.image_url)
+                    .where(ImagePost.id > last_id, ImagePost.is_active == True, pending)
+                    .order_by(ImagePost.id)
+                    .limit(batch_size)
+                )
+                rows = (await db.execute(stmt)).all()
+                if not rows:
+                    break
+
+                results = await asyncio.gather(*[
+                    _process_row(row.image_url, worker_fn, worker_args, semaphore)
+                    for row in rows
+                ])
+                succeeded = [(row.id, result) for row, result in zip(rows, results) if result is not None]
+
+                if succeeded:
+                    params = [{"_id": image_id, **to_values(result)} for image_id, result in succeeded]
+                    columns = [key for key in params[0] if key != "_id"]
+                    update_stmt = (
+                        table.update()
+                        .where(table.c.id == bindparam("_id"))
+                        .values({column: bindparam(column) for column in columns})
+                    )
+                    await db.execute(update_stmt, params)
+                    if after_update is not None:
+                        await after_update(db, params)
+                    await db.commit()
+
+                done += len(succeeded)
+                failed += len(rows) - len(succeeded)
+                last_id = rows[-1].id
+                print(f"✅ [{name}] ~ID {last_id}: 누적 {done}개 처리, {failed}개 실패")
+    finally:
+        shutdown_process_pool()
+        await close_db()
+
+    print(f"ℹ️  [{name}] 완료: {done}개 처리, {failed}개 실패")
@@ -0,0 +1,42 @@
+"""
+이미지 메타데이터 백필 스크립트
+
+메타데이터 컬럼이 추가되기 전에 업로드된 이미지의
+width/height/file_size/mime_type/dominant_color/palette/placeholder/phash를 채우고,
+팔레트는 색상 검색 인덱스에도 기록합니다.
+분석은 프로세스 풀에서 병렬로 실행됩니다.
+
+사용법:
+    python -m app.scripts.backfill_image_metadata --batch-size 200 --workers 4
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import or_
+
+from app.models.image_post import ImagePost
+from app.scripts._backfill import run_backfill
+from app.scripts.build_color_index import index_backfilled_palettes
+from app.utils.image_processing import analyze_image
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="기존 이미지의 메타데이터를 채웁니다.")
+    parser.add_argument("--batch-size", type=int, default=200, help="배치당 처리할 게시물 수")
+    parser.add_argument("--workers", type=int, default=0, help="워커 프로세스 수 (0이면 설정값)")
+    args = parser.parse_args()
+
+    await run_backfill(
+        name="metadata",
+        pending=or_(ImagePost.width.is_(None), ImagePost.phash.is_(None), ImagePost.palette.is_(None)),
+        worker_fn=analyze_image,
+        to_values=lambda metadata: metadata,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        after_update=index_backfilled_palettes,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
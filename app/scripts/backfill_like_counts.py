@@ -0,0 +1,66 @@
+"""
+좋아요 수 백필 스크립트
+
+like_count 컬럼이 추가되기 전의 데이터에 대해 image_likes를 집계하여
+image_posts.like_count를 ID 구간별로 채웁니다 (실제 값과 어긋났을 때 재실행해도 안전).
+시작 전에 스키마 업그레이드(upgrade_schema)로 like_count 컬럼(NOT NULL DEFAULT 0)이 없으면 추가합니다.
+
+사용법:
+    python -m app.scripts.backfill_like_counts --batch-size 5000
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import func, select, update
+
+from app.core.database import AsyncSessionLocal, close_db, engine
+from app.models.image_like import ImageLike
+from app.models.image_post import ImagePost
+from app.scripts.upgrade_schema import upgrade_schema
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="image_posts.like_count를 실제 좋아요 수로 채웁니다.")
+    parser.add_argument("--batch-size", type=int, default=5000, help="한 번에 갱신할 ID 구간 크기")
+    args = parser.parse_args()
+
+    like_count = (
+        select(func.count(ImageLike.id))
+        .where(ImageLike.image_post_id == ImagePost.id)
+        .scalar_subquery()
+    )
+
+    try:
+        # like_count 컬럼이 아직 없는 DB라면 먼저 추가 (기존 행은 0으로 채워짐)
+        async with engine.begin() as conn:
+            added = await conn.run_sync(upgrade_schema)
+        if added:
+            print(f"✅ [like-count] 스키마 업그레이드: {', '.join(added)}")
+
+        async with AsyncSessionLocal() as db:
+            max_id = (await db.execute(select(func.max(ImagePost.id)))).scalar_one_or_none() or 0
+
+        updated = 0
+        for start in range(0, max_id, args.batch_size):
+            end = start + args.batch_size
+            async with AsyncSessionLocal() as db:
+                stmt = (
+                    update(ImagePost)
+                    .where(ImagePost.id > start, ImagePost.id <= end)
+                    .where(ImagePost.like_count != like_count)
+                    .values(like_count=like_count)
+                    .execution_options(synchronize_session=False)
+                )
+                result = await db.execute(stmt)
+                await db.commit()
+            updated += result.rowcount or 0
+            print(f"✅ [like-count] ~ID {min(end, max_id)}: 누적 {updated}개 갱신")
+    finally:
+        await close_db()
+
+    print(f"ℹ️  [like-count] 완료: {updated}개 갱신")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
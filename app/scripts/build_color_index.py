@@ -0,0 +1,47 @@
+"""
+색상 검색 인덱스 백필 스크립트
+
+palette 컬럼이 비어 있는 기존 image_posts에 대해 팔레트를 추출하고,
+같은 트랜잭션에서 색상 버킷 인덱스(image_color_buckets)를 배치 단위로 채웁니다.
+
+사용법:
+    python -m app.scripts.build_color_index --batch-size 500 --workers 4
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.image_post import ImagePost
+from app.scripts._backfill import run_backfill
+from app.services.color_service import ColorService
+from app.utils.image_processing import extract_palette
+
+
+async def index_backfilled_palettes(db: AsyncSession, params: list[dict]) -> None:
+    """백필로 채운 팔레트를 색상 버킷 인덱스에 기록합니다."""
+    await ColorService.index_palettes(
+        db, {row["_id"]: row["palette"] for row in params if row.get("palette")}
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="기존 이미지의 색상 검색 인덱스를 생성합니다.")
+    parser.add_argument("--batch-size", type=int, default=500, help="배치당 처리할 게시물 수")
+    parser.add_argument("--workers", type=int, default=0, help="워커 프로세스 수 (0이면 설정값)")
+    args = parser.parse_args()
+
+    await run_backfill(
+        name="color-index",
+        pending=ImagePost.palette.is_(None),
+        worker_fn=extract_palette,
+        to_values=lambda palette: {"palette": palette},
+        batch_size=args.batch_size,
+        workers=args.workers,
+        after_update=index_backfilled_palettes,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
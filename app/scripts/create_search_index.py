@@ -0,0 +1,30 @@
+"""
+프롬프트 검색 인덱스 생성 스크립트
+
+검색 기능이 추가되기 전에 만들어진 DB에 검색 인덱스를 추가합니다.
+(새로 만드는 테이블에는 자동으로 생성되므로 실행할 필요가 없습니다)
+
+- PostgreSQL: prompt_tsv 생성 컬럼과 GIN 인덱스 추가 (기존 행은 DB가 자동 계산)
+- SQLite: FTS5 테이블/트리거 생성 후 기존 행 재색인
+
+사용법:
+    python -m app.scripts.create_search_index
+"""
+
+import asyncio
+
+from app.core.database import engine, close_db
+from app.models.search_index import create_search_index
+
+
+async def main() -> None:
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(create_search_index)
+        print(f"✅ 검색 인덱스 생성 완료 ({engine.dialect.name})")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,36 @@
+"""
+플레이스홀더(LQIP) 일괄 생성 스크립트
+
+placeholder 컬럼이 비어 있는 기존 image_posts에 대해
+초소형 WebP data URI를 청크 단위로, 여러 워커 프로세스에서 병렬로 생성합니다.
+
+사용법:
+    python -m app.scripts.generate_placeholders --batch-size 500 --workers 4
+"""
+
+import argparse
+import asyncio
+
+from app.models.image_post import ImagePost
+from app.scripts._backfill import run_backfill
+from app.utils.image_processing import make_placeholder
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="기존 이미지의 플레이스홀더를 일괄 생성합니다.")
+    parser.add_argument("--batch-size", type=int, default=500, help="청크당 처리할 게시물 수")
+    parser.add_argument("--workers", type=int, default=0, help="워커 프로세스 수 (0이면 설정값)")
+    args = parser.parse_args()
+
+    await run_backfill(
+        name="placeholder",
+        pending=ImagePost.placeholder.is_(None),
+        worker_fn=make_placeholder,
+        to_values=lambda placeholder: {"placeholder": placeholder},
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
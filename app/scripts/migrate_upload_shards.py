@@ -0,0 +1,190 @@
+"""
+로컬 업로드 파일 샤딩 마이그레이션 스크립트
+
+평면 레이아웃('uploads/images/<파일명>')에 저장된 기존 파일을
+샤딩 레이아웃('uploads/images/ab/cd/<파일명>')으로 옮기고,
+image_posts.image_url 값을 배치 단위로 일괄 변경합니다.
+
+특징
+- 배치마다 커밋하고 마지막으로 처리한 게시물 ID를 상태 파일에 기록하므로,
+  중간에 중단되어도 같은 명령을 다시 실행하면 이어서 진행합니다.
+- 파일 이동 후 URL 변경 전에 중단되더라도 /uploads 마운트가 평면 경로 요청을
+  샤드 위치로 폴백하므로 이미지가 깨지지 않습니다.
+- 같은 파일을 여러 게시물이 공유(콘텐츠 주소 모드)해도 한 번만 이동합니다.
+
+사용법:
+    python -m app.scripts.migrate_upload_shards --batch-size 500
+    python -m app.scripts.migrate_upload_shards --dry-run
+    python -m app.scripts.migrate_upload_shards --include-orphans
+"""
+
+import argparse
+import asyncio
+import os
+
+from sqlalchemy import bindparam, select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, close_db
+from app.models.image_post import ImagePost
+from app.utils.file_handler import shard_relpath
+
+FLAT_URL_PREFIX = "/uploads/images/"
+DEFAULT_STATE_FILE = "./.shard_migration_state"
+
+
+def _is_flat_url(url: str) -> bool:
+    """평면 레이아웃의 로컬 URL인지 확인합니다."""
+    return url.startswith(FLAT_URL_PREFIX) and "/" not in url[len(FLAT_URL_PREFIX):]
+
+
+def _move_to_shard(filename: str, dry_run: bool) -> bool:
+    """
+    평면 위치의 파일을 샤드 위치로 옮깁니다.
+
+    Returns:
+        bool: 파일이 샤드 위치에 존재하게 되면 True (이미 옮겨진 경우 포함)
+    """
+    flat_path = os.path.join(settings.UPLOAD_DIR, filename)
+    shard_path = os.path.join(settings.UPLOAD_DIR, *shard_relpath(filename).split("/"))
+
+    if os.path.exists(shard_path):
+        # 이전 실행에서 이미 옮겨졌거나, 새 업로드가 샤드 위치에 있는 경우
+        if os.path.exists(flat_path) and not dry_run:
+            os.remove(flat_path)
+        return True
+
+    if not os.path.exists(flat_path):
+        return False
+
+    if not dry_run:
+        os.makedirs(os.path.dirname(shard_path), exist_ok=True)
+        os.replace(flat_path, shard_path)  # 같은 파일시스템 내에서 원자적 이동
+    return True
+
+
+def _read_state(state_file: str) -> int:
+    """마지막으로 처리한 게시물 ID를 읽습니다."""
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            return int(f.read().strip() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def _write_state(state_file: str, last_id: int) -> None:
+    """마지막으로 처리한 게시물 ID를 원자적으로 기록합니다."""
+    tmp_path = f"{state_file}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(str(last_id))
+    os.replace(tmp_path, state_file)
+
+
+async def migrate_posts(batch_size: int, state_file: str, dry_run: bool) -> None:
+    """DB에 등록된 이미지 파일을 배치 단위로 이전하고 URL을 일괄 변경합니다."""
+    last_id = _read_state(state_file)
+    table = ImagePost.__table__
+    rewrite_stmt = (
+        table.update()
+        .where(table.c.image_url == bindparam("old_url"))
+        .values(image_url=bindparam("new_url"))
+    )
+
+    moved_total = 0
+    missing_total = 0
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            # 키셋 페이지네이션: 평면 URL을 가진 게시물만 ID 순으로 조회
+            stmt = (
+                select(ImagePost.id, ImagePost.image_url)
+                .where(
+                    ImagePost.id > last_id,
+                    ImagePost.image_url.like(f"{FLAT_URL_PREFIX}%"),
+                    ImagePost.image_url.not_like(f"{FLAT_URL_PREFIX}%/%"),
+                )
+                .order_by(ImagePost.id)
+                .limit(batch_size)
+            )
+            rows = (await db.execute(stmt)).all()
+            if not rows:
+                break
+
+            # 같은 파일을 공유하는 게시물이 있을 수 있으므로 URL 단위로 처리
+            rewrites: dict[str, str] = {}
+            for _, url in rows:
+                if url in rewrites or not _is_flat_url(url):
+                    continue
+                filename = url[len(FLAT_URL_PREFIX):]
+                if _move_to_shard(filename, dry_run):
+                    rewrites[url] = FLAT_URL_PREFIX + shard_relpath(filename)
+                else:
+                    missing_total += 1
+                    print(f"⚠️  파일 없음 (건너뜀): {url}")
+
+            if rewrites and not dry_run:
+                await db.execute(
+                    rewrite_stmt,
+                    [{"old_url": old, "new_url": new} for old, new in rewrites.items()],
+                )
+                await db.commit()
+
+            moved_total += len(rewrites)
+            last_id = rows[-1].id
+            if not dry_run:
+                _write_state(state_file, last_id)
+            print(f"✅ ~ID {last_id}: {len(rewrites)}개 파일 이전 (누적 {moved_total}개)")
+
+    print(f"ℹ️  게시물 기준 이전 완료: {moved_total}개 이전, {missing_total}개 누락")
+
+
+def migrate_orphans(batch_size: int, dry_run: bool) -> None:
+    """DB에서 참조하지 않는 평면 파일(변형 이미지 등)도 샤드 위치로 이동합니다."""
+    moved = 0
+    batch: list[str] = []
+
+    def flush() -> None:
+        nonlocal moved
+        for filename in batch:
+            if _move_to_shard(filename, dry_run):
+                moved += 1
+        batch.clear()
+        print(f"✅ 평면 파일 {moved}개 이동")
+
+    with os.scandir(settings.UPLOAD_DIR) as entries:
+        for entry in entries:
+            if not entry.is_file() or entry.name.startswith("."):
+                continue
+            batch.append(entry.name)
+            if len(batch) >= batch_size:
+                flush()
+    if batch:
+        flush()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 업로드 파일을 샤딩 레이아웃으로 이전합니다.")
+    parser.add_argument("--batch-size", type=int, default=500, help="배치당 처리할 게시물 수")
+    parser.add_argument("--state-file", default=DEFAULT_STATE_FILE, help="진행 상태 파일 경로")
+    parser.add_argument("--dry-run", action="store_true", help="파일 이동/DB 변경 없이 확인만")
+    parser.add_argument("--include-orphans", action="store_true", help="DB에 없는 평면 파일도 이동")
+    parser.add_argument("--restart", action="store_true", help="상태 파일을 무시하고 처음부터 실행")
+    args = parser.parse_args()
+
+    if settings.STORAGE_BACKEND.lower() != "local":
+        print("ℹ️  로컬 스토리지가 아니므로 마이그레이션할 파일이 없습니다.")
+        return
+
+    if args.restart and os.path.exists(args.state_file):
+        os.remove(args.state_file)
+
+    try:
+        await migrate_posts(args.batch_size, args.state_file, args.dry_run)
+        if args.include_orphans:
+            migrate_orphans(args.batch_size, args.dry_run)
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+프롬프트 LSH 인덱스 재구성 스크립트
+
+활성 image_posts의 프롬프트 MinHash 서명을 다시 계산하고,
+image_prompt_buckets를 배치 단위로 교체합니다.
+서명 파라미터(NUM_PERM/BANDS)를 바꾼 뒤나, 기능 추가 전 데이터에 대해 실행합니다.
+시작 전에 스키마 업그레이드(upgrade_schema)를 실행하므로, 서명 컬럼/버킷 테이블이 없는 기존 DB에서도 동작합니다.
+
+사용법:
+    python -m app.scripts.rebuild_prompt_index                # 전체 재구성
+    python -m app.scripts.rebuild_prompt_index --missing-only # 서명이 없는 게시물만
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import bindparam, delete, insert, select
+
+from app.core.database import AsyncSessionLocal, close_db, engine
+from app.models.image_post import ImagePost
+from app.models.prompt_bucket import ImagePromptBucket
+from app.scripts.upgrade_schema import upgrade_schema
+from app.utils.minhash import band_keys, signature, signature_to_bytes
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="프롬프트 LSH 인덱스를 재구성합니다.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="배치당 처리할 게시물 수")
+    parser.add_argument("--missing-only", action="store_true", help="서명이 없는 게시물만 처리")
+    args = parser.parse_args()
+
+    table = ImagePost.__table__
+    update_stmt = (
+        table.update()
+        .where(table.c.id == bindparam("_id"))
+        .values(prompt_signature=bindparam("prompt_signature"))
+    )
+    last_id = 0
+    done = 0
+
+    try:
+        # 서명 컬럼/버킷 테이블이 아직 없는 DB라면 먼저 추가
+        async with engine.begin() as conn:
+            added = await conn.run_sync(upgrade_schema)
+        if added:
+            print(f"✅ [prompt-index] 스키마 업그레이드: {', '.join(added)}")
+
+        if not args.missing_only:
+            # 삭제된 게시물의 남은 버킷 정리
+            async with AsyncSessionLocal() as db:
+                inactive_ids = select(ImagePost.id).where(ImagePost.is_active == False)
+                await db.execute(delete(ImagePromptBucket).where(ImagePromptBucket.image_post_id.in_(inactive_ids)))
+                await db.commit()
+
+        while True:
+            async with AsyncSessionLocal() as db:
+                stmt = (
+                    select(ImagePost.id, ImagePost.prompt)
+                    .where(ImagePost.id > last_id, ImagePost.is_active == True)
+                    .order_by(ImagePost.id)
+                    .limit(args.batch_size)
+                )
+                if args.missing_only:
+                    stmt = stmt.where(ImagePost.prompt_signature.is_(None))
+                rows = (await db.execute(stmt)).all()
+                if not rows:
+                    break
+
+                params = []
+                buckets = []
+                for image_id, prompt in rows:
+                    sig = signature(prompt)
+                    params.append({"_id": image_id, "prompt_signature": signature_to_bytes(sig) if sig else None})
+                    if sig:
+                        buckets.extend(
+                            {"image_post_id": image_id, "band": band, "bucket": key}
+                            for band, key in enumerate(band_keys(sig))
+                        )
+
+                ids = [row.id for row in rows]
+                await db.execute(update_stmt, params)
+                await db.execute(delete(ImagePromptBucket).where(ImagePromptBucket.image_post_id.in_(ids)))
+                if buckets:
+                    await db.execute(insert(ImagePromptBucket), buckets)
+                await db.commit()
+
+                done += len(rows)
+                last_id = rows[-1].id
+                print(f"✅ [prompt-index] ~ID {last_id}: 누적 {done}개 처리")
+    finally:
+        await close_db()
+
+    print(f"ℹ️  [prompt-index] 완료: {done}개 처리")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+패싯 집계 정합성 점검 스크립트
+
+활성 image_posts를 GROUP BY로 다시 집계하여 image_facet_counts와 비교하고,
+차이가 있으면 집계 테이블을 실제 값으로 교체합니다.
+(증감 누락이나 수동 DB 수정 등으로 어긋난 값을 바로잡습니다)
+집계 테이블이 없는 기존 DB라면 스키마 업그레이드(upgrade_schema)로 먼저 만든 뒤 채웁니다.
+
+사용법:
+    python -m app.scripts.reconcile_facets           # 차이 출력 후 교체
+    python -m app.scripts.reconcile_facets --dry-run # 차이만 출력
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import delete, func, insert, select, text
+
+from app.core.database import AsyncSessionLocal, close_db, engine
+from app.models.facet_count import FacetCount
+from app.models.image_post import ImagePost
+from app.scripts.upgrade_schema import upgrade_schema
+from app.services.facet_service import FACET_MODEL_NAME, FACET_TOURNAMENT, FacetService
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="패싯 집계를 실제 이미지 수와 맞춥니다.")
+    parser.add_argument("--dry-run", action="store_true", help="차이만 출력하고 수정하지 않음")
+    args = parser.parse_args()
+
+    try:
+        if not args.dry_run:
+            # 집계 테이블이 아직 없는 DB라면 먼저 추가
+            async with engine.begin() as conn:
+                added = await conn.run_sync(upgrade_schema)
+            if added:
+                print(f"✅ 스키마 업그레이드: {', '.join(added)}")
+
+        async with AsyncSessionLocal() as db:
+            # 집계 도중 업로드/삭제가 반영한 증감이 덮어써지지 않도록 교체가 끝날 때까지 쓰기를 막음
+            if db.bind.dialect.name == "postgresql" and not args.dry_run:
+                await db.execute(text("LOCK TABLE image_facet_counts IN EXCLUSIVE MODE"))
+
+            actual: dict[tuple[str, str], int] = {}
+            stmt = (
+                select(ImagePost.model_name, ImagePost.is_tournament_opt_in, func.count(ImagePost.id))
+                .where(ImagePost.is_active == True)
+                .group_by(ImagePost.model_name, ImagePost.is_tournament_opt_in)
+            )
+            for model_name, is_tournament_opt_in, count in (await db.execute(stmt)).all():
+                for facet, value in FacetService.facet_values(model_name, is_tournament_opt_in).items():
+                    actual[(facet, value)] = actual.get((facet, value), 0) + count
+
+            stored = {
+                (facet, value): count
+                for facet, value, count in (
+                    await db.execute(select(FacetCount.facet, FacetCount.value, FacetCount.count))
+                ).all()
+            }
+
+            mismatches = [
+                (key, stored.get(key, 0), actual.get(key, 0))
+                for key in sorted(set(actual) | set(stored))
+                if stored.get(key, 0) != actual.get(key, 0)
+            ]
+            for (facet, value), old, new in mismatches:
+                print(f"⚠️  {facet}={value!r}: 저장 {old} -> 실제 {new}")
+
+            if not mismatches:
+                print("✅ 패싯 집계가 실제 값과 일치합니다.")
+                return
+
+            if args.dry_run:
+                print(f"ℹ️  {len(mismatches)}개 항목 불일치 (--dry-run: 수정하지 않음)")
+                return
+
+            await db.execute(delete(FacetCount).where(FacetCount.facet.in_([FACET_MODEL_NAME, FACET_TOURNAMENT])))
+            if actual:
+                await db.execute(
+                    insert(FacetCount),
+                    [{"facet": facet, "value": value, "count": count} for (facet, value), count in actual.items()]
+                )
+            await db.commit()
+            print(f"✅ {len(mismatches)}개 항목 수정 완료")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
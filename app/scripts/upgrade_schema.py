@@ -0,0 +1,98 @@
+"""
+스키마 업그레이드 스크립트
+
+기존 DB에 기능 추가로 늘어난 테이블/컬럼을 만듭니다.
+운영 환경(DEBUG=False)에서는 create_all이 실행되지 않으므로, 새 버전을 배포하기 전에 실행하세요.
+이미 있는 테이블/컬럼은 건너뛰므로 여러 번 실행해도 안전합니다.
+
+- 테이블: 없으면 모델 정의대로 생성 (인덱스/제약조건 포함)
+- image_posts 컬럼: 없으면 모델 정의(타입, NULL 허용, 기본값)대로 ALTER TABLE ... ADD COLUMN
+  (NOT NULL 컬럼은 server_default가 있어 기존 행도 기본값으로 채워짐)
+
+새로 만든 테이블 중 기존 데이터로 채워야 하는 것은 안내된 스크립트를 이어서 실행하세요
+(예: image_facet_counts -> reconcile_facets).
+
+사용법:
+    python -m app.scripts.upgrade_schema
+"""
+
+import asyncio
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn
+
+from app.core.database import engine, close_db
+from app.models.facet_count import FacetCount
+from app.models.image_color import ImageColorBucket
+from app.models.image_post import ImagePost
+from app.models.prompt_bucket import ImagePromptBucket
+from app.models.storage_object import StorageObject
+
+# 기존 DB에 없을 수 있는 테이블 (생성 순서대로)
+NEW_TABLES = [
+    StorageObject.__table__,  # 콘텐츠 주소 저장 참조 카운트
+    ImageColorBucket.__table__,  # 색상 검색 버킷
+    ImagePromptBucket.__table__,  # 비슷한 프롬프트 LSH 버킷
+    FacetCount.__table__,  # 갤러리 패싯 집계
+]
+
+# image_posts에 추가된 컬럼 (ImagePost 모델의 컬럼명)
+NEW_IMAGE_POST_COLUMNS: list[str] = [
+    "variant_urls",  # 크기별 축소 이미지 URL
+    "width",  # 이미지 메타데이터
+    "height",
+    "file_size",
+    "mime_type",
+    "dominant_color",
+    "placeholder",  # 로딩 전 표시용 LQIP
+    "original_url",  # 트랜스코딩 전 원본
+    "phash",  # 유사 이미지 탐지용 지각 해시
+    "palette",  # 주요 색상 팔레트
+    "prompt_signature",  # 프롬프트 MinHash 서명
+    "like_count",  # 좋아요 수 (NOT NULL DEFAULT 0, 값은 backfill_like_counts로 채움)
+]
+
+
+def upgrade_schema(conn: Connection) -> list[str]:
+    """
+    없는 테이블과 image_posts 컬럼을 추가합니다 (여러 번 실행해도 안전).
+
+    Returns:
+        list[str]: 이번에 추가한 테이블/컬럼 이름
+    """
+    added: list[str] = []
+    inspector = inspect(conn)
+
+    for table in NEW_TABLES:
+        if not inspector.has_table(table.name):
+            table.create(conn)
+            added.append(table.name)
+
+    existing = {column["name"] for column in inspector.get_columns(ImagePost.__tablename__)}
+    for name in NEW_IMAGE_POST_COLUMNS:
+        if name in existing:
+            continue
+        column_ddl = CreateColumn(ImagePost.__table__.c[name]).compile(dialect=conn.dialect)
+        conn.exec_driver_sql(f"ALTER TABLE {ImagePost.__tablename__} ADD COLUMN {column_ddl}")
+        added.append(f"{ImagePost.__tablename__}.{name}")
+
+    return added
+
+
+async def main() -> None:
+    try:
+        async with engine.begin() as conn:
+            added = await conn.run_sync(upgrade_schema)
+        if added:
+            print(f"✅ 스키마 업그레이드 완료: {', '.join(added)}")
+            if FacetCount.__tablename__ in added:
+                print("ℹ️  기존 이미지의 패싯 집계를 채우려면 python -m app.scripts.reconcile_facets 를 실행하세요")
+        else:
+            print("ℹ️  스키마가 이미 최신입니다")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+색상 검색 서비스 레이어
+
+이미지 팔레트를 색상 버킷 인덱스(image_color_buckets)에 기록하고,
+색상 필터를 인덱스 조회 조건으로 변환합니다.
+"""
+
+from sqlalchemy import select, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.image_color import ImageColorBucket
+from app.models.image_post import ImagePost
+from app.utils.image_processing import color_bucket
+
+
+class ColorService:
+    """색상 검색 비즈니스 로직을 처리하는 서비스 클래스"""
+
+    @staticmethod
+    async def index_palettes(
+        db: AsyncSession,
+        palettes: dict[int, list[str]]
+    ) -> None:
+        """
+        여러 이미지의 팔레트를 색상 버킷 인덱스에 기록합니다 (기존 버킷은 교체).
+
+        Args:
+            db: 데이터베이스 세션
+            palettes: {이미지 ID: 팔레트(#rrggbb 목록)}
+        """
+        if not palettes:
+            return
+
+        await db.execute(
+            delete(ImageColorBucket).where(ImageColorBucket.image_post_id.in_(list(palettes)))
+        )
+
+        rows = [
+            {"image_post_id": image_id, "bucket": bucket}
+            for image_id, palette in palettes.items()
+            for bucket in {color_bucket(color) for color in palette or []}
+        ]
+        if rows:
+            await db.execute(insert(ImageColorBucket), rows)
+
+    @staticmethod
+    async def index_palette(
+        db: AsyncSession,
+        image_id: int,
+        palette: list[str]
+    ) -> None:
+        """한 이미지의 팔레트를 색상 버킷 인덱스에 기록합니다."""
+        await ColorService.index_palettes(db, {image_id: palette})
+
+    @staticmethod
+    def color_filter(hex_color: str) -> ColumnElement[bool]:
+        """
+        주어진 색과 같은 버킷의 색을 팔레트에 가진 이미지만 고르는 조건을 반환합니다.
+
+        Args:
+            hex_color: 검색할 색상 ('#rrggbb' 또는 'rrggbb')
+
+        Returns:
+            ColumnElement[bool]: ImagePost 쿼리에 붙일 WHERE 조건
+        """
+        matching_ids = select(ImageColorBucket.image_post_id).where(
+            ImageColorBucket.bucket == color_bucket(hex_color)
+        )
+        return ImagePost.id.in_(matching_ids)
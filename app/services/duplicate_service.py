@@ -0,0 +1,144 @@
+"""
+유사(중복) 이미지 탐지 서비스 레이어
+
+지각 해시(dHash)를 메모리 내 해밍 거리 인덱스에 올려
+업로드 시 거의 같은 이미지를 빠르게 찾습니다.
+
+쓰기 경로의 인덱스 변경은 트랜잭션이 커밋된 뒤에 반영하고(add_on_commit/remove_on_commit),
+검색 결과는 DB에서 활성 이미지인지 다시 확인하므로 롤백된 ID가 결과에 남지 않습니다.
+"""
+
+import asyncio
+from typing import Optional
+from sqlalchemy import event, select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.image_post import ImagePost
+from app.utils.hamming_index import HammingIndex
+
+# 세션별로 커밋 후 인덱스에 반영할 변경 ((이미지 ID, 해시) — 해시가 None이면 제거)
+_PENDING_KEY = "duplicate_index_pending"
+
+
+class DuplicateService:
+    """유사 이미지 탐지 비즈니스 로직을 처리하는 서비스 클래스"""
+
+    # 워커 프로세스별 인덱스 (처음 사용할 때 DB에서 적재)
+    _index = HammingIndex()
+    _loaded = False
+    _lock = asyncio.Lock()
+
+    @staticmethod
+    async def ensure_loaded(db: AsyncSession) -> None:
+        """
+        인덱스가 비어 있으면 활성 이미지의 해시를 DB에서 적재합니다.
+
+        Args:
+            db: 데이터베이스 세션
+        """
+        if DuplicateService._loaded:
+            return
+
+        async with DuplicateService._lock:
+            if DuplicateService._loaded:
+                return
+
+            stmt = (
+                select(ImagePost.id, ImagePost.phash)
+                .where(
+                    and_(
+                        ImagePost.is_active == True,
+                        ImagePost.phash.is_not(None)
+                    )
+                )
+                .execution_options(yield_per=10000)
+            )
+            result = await db.stream(stmt)
+            async for partition in result.partitions():
+                DuplicateService._index.add_many(partition)
+
+            DuplicateService._loaded = True
+
+    @staticmethod
+    async def find_near_duplicates(
+        db: AsyncSession,
+        phash: int,
+        max_distance: int,
+        exclude_id: Optional[int] = None
+    ) -> list[tuple[int, int]]:
+        """
+        해밍 거리 max_distance 이내의 활성 이미지를 찾습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            phash: 기준 지각 해시
+            max_distance: 허용 해밍 거리 (0~64)
+            exclude_id: 결과에서 제외할 이미지 ID (자기 자신)
+
+        Returns:
+            list[tuple[int, int]]: (이미지 ID, 거리) 목록, 가까운 순
+        """
+        await DuplicateService.ensure_loaded(db)
+        matches = [
+            (image_id, distance)
+            for image_id, distance in DuplicateService._index.search(phash, max_distance)
+            if image_id != exclude_id
+        ]
+        if not matches:
+            return []
+
+        # 인덱스에만 남은 ID(다른 워커의 삭제가 아직 반영되지 않은 경우 등)는 제외하고 정리
+        stmt = select(ImagePost.id).where(
+            and_(
+                ImagePost.id.in_([image_id for image_id, _ in matches]),
+                ImagePost.is_active == True
+            )
+        )
+        active = set((await db.execute(stmt)).scalars().all())
+        for image_id, _ in matches:
+            if image_id not in active:
+                DuplicateService._index.remove(image_id)
+        return [(image_id, distance) for image_id, distance in matches if image_id in active]
+
+    @staticmethod
+    def add_on_commit(db: AsyncSession, image_id: int, phash: Optional[int]) -> None:
+        """세션이 커밋되면 새 이미지의 해시를 인덱스에 추가하도록 표시합니다 (롤백되면 취소)."""
+        if phash is not None:
+            db.sync_session.info.setdefault(_PENDING_KEY, []).append((image_id, phash))
+
+    @staticmethod
+    def remove_on_commit(db: AsyncSession, image_id: int) -> None:
+        """세션이 커밋되면 삭제된 이미지를 인덱스에서 제거하도록 표시합니다 (롤백되면 취소)."""
+        db.sync_session.info.setdefault(_PENDING_KEY, []).append((image_id, None))
+
+    @staticmethod
+    def add(image_id: int, phash: Optional[int]) -> None:
+        """새 이미지의 해시를 인덱스에 추가합니다 (같은 ID를 다시 추가해도 안전)."""
+        if phash is not None:
+            DuplicateService._index.add(image_id, phash)
+
+    @staticmethod
+    def remove(image_id: int) -> None:
+        """삭제된 이미지를 인덱스에서 제거합니다."""
+        DuplicateService._index.remove(image_id)
+
+    @staticmethod
+    def reset() -> None:
+        """인덱스를 비우고 다음 사용 시 DB에서 다시 적재하도록 표시합니다."""
+        DuplicateService._index = HammingIndex()
+        DuplicateService._loaded = False
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session) -> None:
+    for image_id, phash in session.info.pop(_PENDING_KEY, ()):
+        if phash is None:
+            DuplicateService.remove(image_id)
+        else:
+            DuplicateService.add(image_id, phash)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,115 @@
+"""
+갤러리 패싯 서비스 레이어
+
+모델명/토너먼트 참여 여부별 이미지 수를 집계 테이블(image_facet_counts)로 관리합니다.
+목록 화면마다 전체 활성 이미지를 GROUP BY 하지 않고, 작은 집계 테이블만 읽습니다.
+"""
+
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from app.models.facet_count import FacetCount
+from app.models.image_post import ImagePost
+from app.schemas.image import FacetValue, ImageFacetsResponse
+
+FACET_MODEL_NAME = "model_name"
+FACET_TOURNAMENT = "tournament_opt_in"
+
+
+class FacetService:
+    """패싯 집계 비즈니스 로직을 처리하는 서비스 클래스"""
+
+    @staticmethod
+    def facet_values(model_name: Optional[str], is_tournament_opt_in: bool) -> dict[str, str]:
+        """이미지 속성을 {패싯: 값}으로 변환합니다."""
+        return {
+            FACET_MODEL_NAME: model_name or "",
+            FACET_TOURNAMENT: "true" if is_tournament_opt_in else "false",
+        }
+
+    @staticmethod
+    def snapshot(image: ImagePost) -> dict[str, str]:
+        """이미지의 현재 패싯 값을 반환합니다 (수정 전 상태 기록용)."""
+        return FacetService.facet_values(image.model_name, image.is_tournament_opt_in)
+
+    @staticmethod
+    async def _adjust(db: AsyncSession, facet: str, value: str, delta: int) -> None:
+        """(facet, value)의 이미지 수를 delta만큼 원자적으로 증감합니다."""
+        stmt = (
+            update(FacetCount)
+            .where(FacetCount.facet == facet, FacetCount.value == value)
+            .values(count=FacetCount.count + delta)
+        )
+        result = await db.execute(stmt)
+        if result.rowcount or delta < 0:
+            return
+
+        # 처음 나온 값: 새 행 생성 (동시에 다른 요청이 먼저 만들었다면 증가로 재시도)
+        try:
+            async with db.begin_nested():
+                db.add(FacetCount(facet=facet, value=value, count=delta))
+        except IntegrityError:
+            await db.execute(stmt)
+
+    @staticmethod
+    async def apply_change(
+        db: AsyncSession,
+        before: Optional[dict[str, str]],
+        after: Optional[dict[str, str]]
+    ) -> None:
+        """
+        이미지의 패싯 값 변화를 집계에 반영합니다.
+
+        증감할 (facet, value) 행을 모아 키 순서대로 갱신합니다.
+        동시에 실행되는 트랜잭션들이 항상 같은 순서로 행 잠금을 잡으므로 교착 상태가 생기지 않습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            before: 변경 전 패싯 값 (생성 시 None)
+            after: 변경 후 패싯 값 (삭제 시 None)
+        """
+        deltas: dict[tuple[str, str], int] = {}
+        for facet in (FACET_MODEL_NAME, FACET_TOURNAMENT):
+            old = before.get(facet) if before else None
+            new = after.get(facet) if after else None
+            if old == new:
+                continue
+            if old is not None:
+                deltas[(facet, old)] = deltas.get((facet, old), 0) - 1
+            if new is not None:
+                deltas[(facet, new)] = deltas.get((facet, new), 0) + 1
+
+        for (facet, value), delta in sorted(deltas.items()):
+            if delta:
+                await FacetService._adjust(db, facet, value, delta)
+
+    @staticmethod
+    async def get_facets(db: AsyncSession) -> ImageFacetsResponse:
+        """
+        패싯별 이미지 수를 조회합니다 (많은 순).
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            ImageFacetsResponse: 모델명별, 토너먼트 참여 여부별 이미지 수
+        """
+        stmt = (
+            select(FacetCount.facet, FacetCount.value, FacetCount.count)
+            .where(FacetCount.count > 0)
+            .order_by(FacetCount.count.desc(), FacetCount.value)
+        )
+        rows = (await db.execute(stmt)).all()
+
+        facets: dict[str, list[FacetValue]] = {FACET_MODEL_NAME: [], FACET_TOURNAMENT: []}
+        for facet, value, count in rows:
+            if facet in facets:
+                facets[facet].append(FacetValue(value=value or None, count=count))
+
+        return ImageFacetsResponse(
+            model_name=facets[FACET_MODEL_NAME],
+            tournament_opt_in=facets[FACET_TOURNAMENT]
+        )
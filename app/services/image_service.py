@@ -4,13 +4,24 @@
 이미지 관련 비즈니스 로직을 처리합니다.
 """
 
-from typing import Optional
+from typing import Optional, Union
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from app.core.cache import CACHE_TOURNAMENT_POOL, IMAGE_NAMESPACES, response_cache
+from app.core.config import settings
 from app.models.image_post import ImagePost
-from app.schemas.image import ImageResponse, ImageListResponse
+from app.schemas.image import ImageResponse, ImageListResponse, ImageBatchResponse
+from app.services.color_service import ColorService
+from app.services.duplicate_service import DuplicateService
+from app.services.facet_service import FacetService
+from app.services.invalidation_service import InvalidationService
+from app.services.similar_service import SimilarService
+from app.services.storage_ref_service import StorageRefService
+from app.services.suggest_service import SuggestService
+from app.utils.fieldsets import rows_to_items, select_image_columns
+from app.utils.file_handler import object_key_from_url
 
 
 class ImageService:
@@ -23,7 +34,10 @@ class ImageService:
         image_url: str,
         prompt: str,
         model_name: Optional[str] = None,
-        is_tournament_opt_in: bool = False
+        is_tournament_opt_in: bool = False,
+        variant_urls: Optional[dict[str, str]] = None,
+        image_metadata: Optional[dict] = None,
+        original_url: Optional[str] = None
     ) -> ImagePost:
         """
         새로운 이미지 게시물을 생성합니다.
@@ -35,6 +49,9 @@ class ImageService:
             prompt: AI 생성 프롬프트
             model_name: 사용한 AI 모델명
             is_tournament_opt_in: 토너먼트 참여 여부
+            variant_urls: 크기별 축소 이미지 URL
+            image_metadata: 업로드 시 추출한 이미지 메타데이터 (width, height, file_size 등)
+            original_url: 트랜스코딩 전 원본 URL (보관 설정 시)
 
         Returns:
             ImagePost: 생성된 이미지 게시물
@@ -42,15 +59,42 @@ class ImageService:
         new_image = ImagePost(
             user_id=user_id,
             image_url=image_url,
+            original_url=original_url,
             prompt=prompt,
             model_name=model_name,
             is_tournament_opt_in=is_tournament_opt_in,
+            variant_urls=variant_urls or None,
+            **(image_metadata or {}),
         )
+        SimilarService.sign(new_image)
 
         db.add(new_image)
+
+        # 콘텐츠 주소 모드: 같은 파일을 공유하는 게시물 수를 기록
+        if settings.STORAGE_CONTENT_ADDRESSED:
+            await StorageRefService.acquire(db, object_key_from_url(image_url))
+
         await db.flush()
         await db.refresh(new_image)
 
+        # 색상 검색 인덱스에 팔레트 등록
+        if new_image.palette:
+            await ColorService.index_palette(db, new_image.id, new_image.palette)
+
+        # 비슷한 프롬프트 추천용 버킷 등록
+        await SimilarService.index_image(db, new_image)
+
+        # 패싯 집계 반영
+        await FacetService.apply_change(db, None, FacetService.snapshot(new_image))
+
+        # 유사 이미지 인덱스와 자동완성 트라이는 커밋 후 등록 (롤백되면 반영하지 않음)
+        DuplicateService.add_on_commit(db, new_image.id, new_image.phash)
+        SuggestService.add_on_commit(db, new_image.model_name, new_image.prompt)
+
+        # 목록/피드/랭킹 응답 캐시는 커밋 후 무효화 (다른 워커에는 NOTIFY로 전달)
+        response_cache.invalidate_on_commit(db, *IMAGE_NAMESPACES, CACHE_TOURNAMENT_POOL)
+        await InvalidationService.publish(db, "image", op="create", id=new_image.id)
+
         return new_image
 
     @staticmethod
@@ -78,14 +122,97 @@ class ImageService:
         result = await db.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_image_etag(
+        db: AsyncSession,
+        image_id: int
+    ) -> Optional[str]:
+        """
+        이미지 상세 응답의 강한 ETag를 수정일시와 카운터만 조회해 만듭니다.
+
+        좋아요/승리 횟수는 수정일시와 같은 초 안에 여러 번 바뀔 수 있어 함께 넣습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            image_id: 이미지 ID
+
+        Returns:
+            Optional[str]: ETag (따옴표 포함) 또는 None (이미지가 없거나 비활성)
+        """
+        stmt = select(
+            ImagePost.updated_at,
+            ImagePost.like_count,
+            ImagePost.tournament_win_count
+        ).where(ImagePost.id == image_id, ImagePost.is_active == True)
+        row = (await db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+
+        version = int(row.updated_at.timestamp() * 1_000_000)
+        return f'"{image_id}-{version:x}-{row.like_count}-{row.tournament_win_count}"'
+
+    @staticmethod
+    async def get_images_by_ids(
+        db: AsyncSession,
+        image_ids: list[int]
+    ) -> dict[int, ImagePost]:
+        """
+        여러 ID의 활성 이미지를 한 번의 쿼리로 조회합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            image_ids: 이미지 ID 목록
+
+        Returns:
+            dict[int, ImagePost]: {이미지 ID: 이미지 게시물} (없는 ID는 빠짐)
+        """
+        if not image_ids:
+            return {}
+
+        stmt = select(ImagePost).where(
+            and_(
+                ImagePost.id.in_(image_ids),
+                ImagePost.is_active == True
+            )
+        )
+        result = await db.execute(stmt)
+        return {image.id: image for image in result.scalars().all()}
+
+    @staticmethod
+    async def get_images_batch(
+        db: AsyncSession,
+        image_ids: list[int]
+    ) -> ImageBatchResponse:
+        """
+        여러 이미지를 한 번의 쿼리로 조회하여 요청 순서대로 반환합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            image_ids: 이미지 ID 목록 (중복 허용, 순서 유지)
+
+        Returns:
+            ImageBatchResponse: 요청 순서의 이미지 목록 (없는 ID는 null)과 없는 ID 목록
+        """
+        images = await ImageService.get_images_by_ids(db, list(dict.fromkeys(image_ids)))
+
+        items = [
+            ImageResponse.model_validate(images[image_id]) if image_id in images else None
+            for image_id in image_ids
+        ]
+        missing = [image_id for image_id in dict.fromkeys(image_ids) if image_id not in images]
+
+        return ImageBatchResponse(items=items, missing=missing)
+
     @staticmethod
     async def get_images(
         db: AsyncSession,
         page: int = 1,
         size: int = 20,
         user_id: Optional[int] = None,
-        tournament_only: bool = False
-    ) -> ImageListResponse:
+        tournament_only: bool = False,
+        color: Optional[str] = None,
+        fields: Optional[list[str]] = None
+    ) -> Union[ImageListResponse, dict]:
         """
         이미지 목록을 조회합니다.
 
@@ -95,12 +222,14 @@ class ImageService:
             size: 페이지 크기
             user_id: 특정 사용자의 이미지만 조회
             tournament_only: 토너먼트 참여 이미지만 조회
+            color: 이 색(#rrggbb)을 팔레트에 포함한 이미지만 조회
+            fields: 응답에 포함할 필드 (지정 시 해당 컬럼만 조회하여 dict로 반환)
 
         Returns:
-            ImageListResponse: 이미지 목록 응답
+            Union[ImageListResponse, dict]: 이미지 목록 응답 (fields 지정 시 같은 구조의 dict)
         """
-        # 기본 쿼리
-        stmt = select(ImagePost).where(ImagePost.is_active == True)
+        # 기본 쿼리 (ORM 객체 없이 필요한 컬럼만 조회)
+        stmt = select(*select_image_columns(fields)).where(ImagePost.is_active == True)
 
         # 필터 적용
         if user_id:
@@ -109,6 +238,9 @@ class ImageService:
         if tournament_only:
             stmt = stmt.where(ImagePost.is_tournament_opt_in == True)
 
+        if color:
+            stmt = stmt.where(ColorService.color_filter(color))
+
         # 전체 개수 조회
         count_stmt = select(func.count()).select_from(stmt.subquery())
         total_result = await db.execute(count_stmt)
@@ -119,16 +251,16 @@ class ImageService:
         stmt = stmt.order_by(ImagePost.created_at.desc()).offset(offset).limit(size)
 
         result = await db.execute(stmt)
-        images = result.scalars().all()
+        items = rows_to_items(result, fields)
 
-        # 응답 생성
-        items = [
-            ImageResponse(
-                **image.__dict__,
-                like_count=image.like_count
-            )
-            for image in images
-        ]
+        if fields:
+            return {
+                "items": items,
+                "total": total,
+                "page": page,
+                "size": size,
+                "has_next": (offset + size) < total,
+            }
 
         return ImageListResponse(
             items=items,
@@ -179,16 +311,24 @@ class ImageService:
                 detail="이미지를 수정할 권한이 없습니다."
             )
 
+        facets_before = FacetService.snapshot(image)
+
         # 필드 업데이트
-        if prompt is not None:
+        if prompt is not None and prompt != image.prompt:
             image.prompt = prompt
+            SimilarService.sign(image)
+            await SimilarService.index_image(db, image)
         if model_name is not None:
             image.model_name = model_name
         if is_tournament_opt_in is not None:
             image.is_tournament_opt_in = is_tournament_opt_in
 
+        await FacetService.apply_change(db, facets_before, FacetService.snapshot(image))
+
         await db.flush()
         await db.refresh(image)
+        response_cache.invalidate_on_commit(db, *IMAGE_NAMESPACES, CACHE_TOURNAMENT_POOL)
+        await InvalidationService.publish(db, "image", op="update", id=image.id)
 
         return image
 
@@ -229,52 +369,68 @@ class ImageService:
 
         # Soft Delete
         image.is_active = False
+        await FacetService.apply_change(db, FacetService.snapshot(image), None)
         await db.flush()
+        DuplicateService.remove_on_commit(db, image.id)
+        await SimilarService.remove(db, image.id)
+        response_cache.invalidate_on_commit(db, *IMAGE_NAMESPACES, CACHE_TOURNAMENT_POOL)
+        await InvalidationService.publish(db, "image", op="delete", id=image.id)
+
+        # 콘텐츠 주소 모드: 마지막 참조가 사라졌을 때만, 커밋된 뒤에 실제 파일 삭제
+        if settings.STORAGE_CONTENT_ADDRESSED:
+            object_key = object_key_from_url(image.image_url)
+            remaining = await StorageRefService.release(db, object_key)
+            if remaining == 0:
+                StorageRefService.delete_files_on_commit(db, object_key, image.file_urls)
 
         return True
 
     @staticmethod
     async def get_random_feed(
         db: AsyncSession,
-        limit: int = 20
-    ) -> list[ImagePost]:
+        limit: int = 20,
+        fields: Optional[list[str]] = None
+    ) -> Union[list[ImageResponse], list[dict]]:
         """
         랜덤 피드를 조회합니다.
 
         Args:
             db: 데이터베이스 세션
             limit: 조회할 이미지 개수
+            fields: 응답에 포함할 필드 (지정 시 해당 컬럼만 조회하여 dict로 반환)
 
         Returns:
-            list[ImagePost]: 랜덤 이미지 목록
+            Union[list[ImageResponse], list[dict]]: 랜덤 이미지 목록
         """
         from sqlalchemy import func as sql_func
 
         # 랜덤 정렬로 이미지 조회
         stmt = (
-            select(ImagePost)
+            select(*select_image_columns(fields))
             .where(ImagePost.is_active == True)
             .order_by(sql_func.random())
             .limit(limit)
         )
 
         result = await db.execute(stmt)
-        return result.scalars().all()
+        return rows_to_items(result, fields)
 
     @staticmethod
     async def get_top_images_24h(
         db: AsyncSession,
-        limit: int = 10
-    ) -> list[ImagePost]:
+        limit: int = 10,
+        fields: Optional[list[str]] = None
+    ) -> Union[list[ImageResponse], list[dict]]:
         """
         최근 24시간 내 좋아요가 많은 이미지 Top N을 조회합니다.
 
         Args:
             db: 데이터베이스 세션
             limit: 조회할 이미지 개수
+            fields: 응답에 포함할 필드 (지정 시 해당 컬럼만 조회하여 dict로 반환)
 
         Returns:
-            list[ImagePost]: 인기 이미지 목록
+            Union[list[ImageResponse], list[dict]]: 인기 이미지 목록
         """
         from datetime import datetime, timedelta
         from sqlalchemy import func as sql_func
@@ -285,7 +441,7 @@ class ImageService:
 
         # 최근 24시간 내 좋아요 수를 집계하여 정렬
         stmt = (
-            select(ImagePost)
+            select(*select_image_columns(fields))
             .outerjoin(ImageLike, ImagePost.id == ImageLike.image_post_id)
             .where(
                 and_(
@@ -299,4 +455,4 @@ class ImageService:
         )
 
         result = await db.execute(stmt)
-        return result.scalars().all()
+        return rows_to_items(result, fields)
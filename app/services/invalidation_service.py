@@ -0,0 +1,213 @@
+"""
+워커 간 캐시 무효화 버스 (PostgreSQL LISTEN/NOTIFY)
+
+`uvicorn --workers N`으로 띄우면 응답 캐시와 메모리 인덱스(유사 이미지, 비슷한 프롬프트,
+자동완성)가 워커마다 따로 있어, 한 워커의 쓰기가 다른 워커에는 반영되지 않습니다.
+
+- 쓰기 경로는 publish()로 짧은 변경 이벤트를 같은 트랜잭션 안에서 pg_notify 합니다.
+  NOTIFY는 커밋될 때만 전달되므로 롤백된 변경은 알려지지 않습니다.
+- 각 워커는 lifespan에서 start()로 전용 asyncpg 연결을 열어 LISTEN 하고,
+  받은 이벤트를 순서대로 로컬 캐시/인덱스에 반영합니다. 자기 워커가 보낸 이벤트는 무시합니다.
+- 연결이 끊기면 지수 백오프로 다시 연결하고, 그 사이 놓친 이벤트가 있을 수 있으므로
+  로컬 캐시를 비우고 인덱스는 다음 사용 시 DB에서 다시 적재하도록 표시합니다.
+- PostgreSQL이 아닌 DB(SQLite 개발 환경)에서는 아무 것도 하지 않습니다.
+
+이벤트 형식 (JSON, 키는 짧게):
+    {"e": "image", "op": "create" | "update" | "delete", "id": 12}
+    {"e": "like", "id": 12, "d": 1}
+    {"e": "vote", "w": 12, "l": 34}
+"""
+
+import asyncio
+import json
+import uuid
+from typing import Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import CACHE_TOURNAMENT_POOL, IMAGE_NAMESPACES, invalidate
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.core.metrics import metrics
+from app.models.image_post import ImagePost
+from app.services.duplicate_service import DuplicateService
+from app.services.similar_service import SimilarService
+from app.services.suggest_service import SuggestService
+
+# 이 워커 프로세스의 식별자 (자기 이벤트를 거르기 위함, 호스트가 달라도 겹치지 않도록 UUID)
+WORKER_ID = uuid.uuid4().hex[:12]
+
+# 연결 상태 확인 주기와 재연결 최대 대기 시간 (초)
+_HEALTH_CHECK_SECONDS = 30
+_MAX_BACKOFF_SECONDS = 30
+
+
+class InvalidationService:
+    """워커 간 캐시 무효화 이벤트를 발행/수신하는 서비스 클래스"""
+
+    _listener_task: Optional[asyncio.Task] = None
+    _consumer_task: Optional[asyncio.Task] = None
+    _queue: Optional[asyncio.Queue] = None
+
+    @staticmethod
+    def enabled() -> bool:
+        """무효화 버스를 사용할 수 있는지 (설정이 켜져 있고 PostgreSQL인지) 확인합니다."""
+        return settings.INVALIDATION_BUS_ENABLED and engine.dialect.name == "postgresql"
+
+    @staticmethod
+    async def publish(db: AsyncSession, event: str, **fields) -> None:
+        """
+        변경 이벤트를 현재 트랜잭션에 NOTIFY로 등록합니다 (커밋 시 전달).
+
+        Args:
+            db: 데이터베이스 세션 (쓰기와 같은 트랜잭션)
+            event: 이벤트 종류 ('image' | 'like' | 'vote')
+            **fields: 이벤트 필드 (모듈 docstring 참고)
+        """
+        if not InvalidationService.enabled():
+            return
+
+        payload = json.dumps({"e": event, **fields, "src": WORKER_ID}, separators=(",", ":"))
+        await db.execute(select(func.pg_notify(settings.INVALIDATION_CHANNEL, payload)))
+        metrics.inc("invalidation.published")
+
+    # ===== 수신 =====
+
+    @staticmethod
+    async def start() -> None:
+        """LISTEN 연결과 이벤트 처리 작업을 시작합니다 (lifespan 시작 시 호출)."""
+        if not InvalidationService.enabled() or InvalidationService._listener_task is not None:
+            return
+
+        InvalidationService._queue = asyncio.Queue()
+        InvalidationService._consumer_task = asyncio.create_task(InvalidationService._consume())
+        InvalidationService._listener_task = asyncio.create_task(InvalidationService._listen_forever())
+
+    @staticmethod
+    async def stop() -> None:
+        """LISTEN 연결과 처리 작업을 종료합니다 (lifespan 종료 시 호출)."""
+        for task in (InvalidationService._listener_task, InvalidationService._consumer_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        InvalidationService._listener_task = None
+        InvalidationService._consumer_task = None
+
+    @staticmethod
+    async def _listen_forever() -> None:
+        """LISTEN 연결을 유지하고, 끊기면 백오프 후 다시 연결합니다."""
+        import asyncpg
+
+        dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+        backoff = 1
+        connected_before = False
+
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(dsn)
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _: lost.set())
+                await conn.add_listener(settings.INVALIDATION_CHANNEL, InvalidationService._on_notify)
+                print(f"✅ 캐시 무효화 리스너 연결 (채널: {settings.INVALIDATION_CHANNEL})")
+
+                if connected_before:
+                    # 끊겨 있던 동안의 이벤트는 알 수 없으므로 로컬 상태를 통째로 무효화
+                    InvalidationService._reset_local()
+                connected_before = True
+                backoff = 1
+
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), timeout=_HEALTH_CHECK_SECONDS)
+                    except asyncio.TimeoutError:
+                        await conn.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️  캐시 무효화 리스너 연결 오류: {e}")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+            metrics.inc("invalidation.reconnects")
+            print(f"ℹ️  {backoff}초 후 캐시 무효화 리스너 재연결")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, _MAX_BACKOFF_SECONDS)
+
+    @staticmethod
+    def _on_notify(connection, pid: int, channel: str, payload: str) -> None:
+        """asyncpg 알림 콜백: 다른 워커의 이벤트만 처리 큐에 넣습니다."""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            return
+        if event.get("src") == WORKER_ID:
+            return
+        InvalidationService._queue.put_nowait(event)
+
+    @staticmethod
+    async def _consume() -> None:
+        """받은 이벤트를 도착 순서대로 적용합니다."""
+        while True:
+            event = await InvalidationService._queue.get()
+            try:
+                await InvalidationService.apply(event)
+                metrics.inc("invalidation.applied")
+            except Exception as e:
+                print(f"⚠️  캐시 무효화 이벤트 처리 실패 ({event}): {e}")
+
+    @staticmethod
+    async def apply(event: dict) -> None:
+        """
+        변경 이벤트를 이 워커의 캐시와 인덱스에 반영합니다.
+
+        Args:
+            event: 디코딩된 이벤트 dict
+        """
+        # 목록/피드/랭킹 응답에는 좋아요 수와 승리 횟수가 모두 담기므로 함께 무효화
+        if event.get("e") != "image":
+            invalidate(*IMAGE_NAMESPACES)
+            return
+
+        invalidate(*IMAGE_NAMESPACES, CACHE_TOURNAMENT_POOL)
+
+        image_id = event["id"]
+        if event.get("op") == "delete":
+            DuplicateService.remove(image_id)
+            SimilarService.apply_signature(image_id, None)
+            return
+
+        async with AsyncSessionLocal() as db:
+            stmt = select(
+                ImagePost.phash,
+                ImagePost.prompt_signature,
+                ImagePost.model_name,
+                ImagePost.prompt,
+                ImagePost.is_active,
+            ).where(ImagePost.id == image_id)
+            row = (await db.execute(stmt)).one_or_none()
+
+        if row is None or not row.is_active:
+            DuplicateService.remove(image_id)
+            SimilarService.apply_signature(image_id, None)
+            return
+
+        DuplicateService.add(image_id, row.phash)
+        SimilarService.apply_signature(image_id, row.prompt_signature)
+        if event.get("op") == "create":
+            SuggestService.add(row.model_name, row.prompt)
+
+    @staticmethod
+    def _reset_local() -> None:
+        """놓친 이벤트가 있을 수 있을 때 로컬 캐시를 비우고 인덱스를 다시 적재하도록 표시합니다."""
+        invalidate(*IMAGE_NAMESPACES, CACHE_TOURNAMENT_POOL)
+        DuplicateService.reset()
+        SimilarService.reset()
+        SuggestService.mark_stale()
+        print("ℹ️  재연결: 응답 캐시를 비우고 메모리 인덱스를 다시 적재하도록 표시")
@@ -4,13 +4,15 @@
 좋아요 관련 비즈니스 로직을 처리합니다.
 """
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
+from app.core.cache import IMAGE_NAMESPACES, response_cache
 from app.models.image_like import ImageLike
 from app.models.image_post import ImagePost
+from app.services.invalidation_service import InvalidationService
 
 
 class LikeService:
@@ -63,8 +65,6 @@ class LikeService:
         try:
             await db.flush()
             await db.refresh(new_like)
-            return new_like
-
         except IntegrityError:
             await db.rollback()
             raise HTTPException(
@@ -72,6 +72,29 @@ class LikeService:
                 detail="이미 좋아요를 눌렀습니다."
             )
 
+        # 저장된 좋아요 수를 DB에서 원자적으로 증가
+        await LikeService._adjust_like_count(db, image_post_id, 1)
+        return new_like
+
+    @staticmethod
+    async def _adjust_like_count(
+        db: AsyncSession,
+        image_post_id: int,
+        delta: int
+    ) -> None:
+        """이미지 게시물의 like_count를 delta만큼 증감합니다."""
+        stmt = (
+            update(ImagePost)
+            .where(ImagePost.id == image_post_id)
+            .values(like_count=ImagePost.like_count + delta)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+
+        # 좋아요 수가 담긴 목록/피드/랭킹 응답 캐시는 커밋 후 무효화 (다른 워커에는 NOTIFY로 전달)
+        response_cache.invalidate_on_commit(db, *IMAGE_NAMESPACES)
+        await InvalidationService.publish(db, "like", id=image_post_id, d=delta)
+
     @staticmethod
     async def remove_like(
         db: AsyncSession,
@@ -111,6 +134,7 @@ class LikeService:
         # 좋아요 삭제
         await db.delete(like)
         await db.flush()
+        await LikeService._adjust_like_count(db, image_post_id, -1)
 
         return True
 
@@ -148,7 +172,7 @@ class LikeService:
         image_post_id: int
     ) -> int:
         """
-        이미지의 좋아요 개수를 조회합니다.
+        이미지의 좋아요 개수를 조회합니다 (저장된 like_count 사용).
 
         Args:
             db: 데이터베이스 세션
@@ -157,12 +181,10 @@ class LikeService:
         Returns:
             int: 좋아요 개수
         """
-        from sqlalchemy import func
-
-        stmt = select(func.count(ImageLike.id)).where(
-            ImageLike.image_post_id == image_post_id
+        stmt = select(ImagePost.like_count).where(
+            ImagePost.id == image_post_id
         )
         result = await db.execute(stmt)
-        count = result.scalar_one()
+        count = result.scalar_one_or_none()
 
-        return count
+        return count or 0
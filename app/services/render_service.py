@@ -0,0 +1,94 @@
+"""
+온디맨드 리사이즈(render) 서비스 레이어
+
+미리 만들어 두지 않은 크기/포맷의 이미지를 요청 시 생성하고 디스크 LRU 캐시에 보관합니다.
+캐시 파일은 다른 워커가 언제든 정리(evict)할 수 있으므로 경로가 아닌 내용을 읽어 반환합니다.
+"""
+
+import asyncio
+import hashlib
+
+from fastapi import HTTPException, status
+from PIL import Image
+
+from app.core.config import settings
+from app.core.process_pool import run_in_process
+from app.utils.disk_cache import DiskLRUCache
+from app.utils.file_handler import read_file
+from app.utils.image_processing import FORMATS, resize_to_width
+from app.utils.singleflight import SingleFlight
+
+# 워커 프로세스마다 하나의 캐시 인스턴스 (디스크 디렉토리는 워커 간 공유)
+render_cache = DiskLRUCache(settings.RENDER_CACHE_DIR, settings.RENDER_CACHE_MAX_BYTES)
+
+
+class RenderService:
+    """온디맨드 리사이즈 비즈니스 로직을 처리하는 서비스 클래스"""
+
+    # 같은 변형에 대한 동시 요청을 하나의 렌더링 작업으로 합침
+    _flight = SingleFlight("render")
+
+    @staticmethod
+    def cache_key(image_url: str, width: int, fmt: str) -> str:
+        """
+        변형 이미지의 캐시 키를 만듭니다.
+
+        업로드 파일명은 UUID/콘텐츠 해시라서 같은 URL의 내용은 바뀌지 않으므로,
+        이 키는 그대로 강한 ETag로 사용할 수 있습니다.
+        """
+        raw = f"{image_url}|{width}|{fmt}|{settings.RENDER_QUALITY}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def media_type(fmt: str) -> str:
+        """출력 포맷의 Content-Type을 반환합니다."""
+        return FORMATS[fmt][1]
+
+    @staticmethod
+    async def render(
+        image_url: str,
+        width: int,
+        fmt: str
+    ) -> bytes:
+        """
+        변형 이미지를 만들거나 캐시에서 찾아 내용을 반환합니다.
+
+        같은 변형에 대한 동시 요청은 하나의 렌더링 작업을 함께 기다립니다.
+
+        Args:
+            image_url: 원본 이미지 URL
+            width: 목표 너비 (픽셀)
+            fmt: 출력 포맷 ('webp' | 'jpeg' | 'png')
+
+        Returns:
+            bytes: 인코딩된 변형 이미지
+
+        Raises:
+            HTTPException: 원본을 찾을 수 없거나(404) 이미지로 디코딩할 수 없는 경우(502)
+        """
+        key = RenderService.cache_key(image_url, width, fmt)
+
+        cached = await asyncio.to_thread(render_cache.read, key)
+        if cached is not None:
+            return cached
+
+        return await RenderService._flight.do(
+            key,
+            lambda: RenderService._render(key, image_url, width, fmt)
+        )
+
+    @staticmethod
+    async def _render(key: str, image_url: str, width: int, fmt: str) -> bytes:
+        """원본을 읽어 프로세스 풀에서 리사이즈하고 캐시에 저장합니다."""
+        content = await read_file(image_url)
+        try:
+            data = await run_in_process(resize_to_width, content, width, fmt, settings.RENDER_QUALITY)
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            # 손상되었거나 지원하지 않는 원본 (UnidentifiedImageError는 OSError의 하위 클래스)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"원본 이미지를 처리할 수 없습니다: {str(e)}"
+            )
+
+        await asyncio.to_thread(render_cache.put, key, data)
+        return data
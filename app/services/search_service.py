@@ -0,0 +1,144 @@
+"""
+프롬프트 검색 서비스 레이어
+
+프롬프트 전문 검색을 DB별 검색 인덱스(app.models.search_index)로 처리합니다.
+- PostgreSQL: prompt_tsv @@ websearch_to_tsquery, ts_rank_cd로 정렬
+- SQLite: FTS5 MATCH, bm25로 정렬
+
+결과는 (관련도, ID) 내림차순이며, 마지막 항목의 (관련도, ID)를 커서로 넘기는
+키셋 페이지네이션을 사용합니다 (OFFSET 없이 다음 페이지를 바로 찾음).
+"""
+
+import base64
+import json
+import re
+from typing import Optional
+
+from sqlalchemy import select, and_, or_, literal_column, func, text, Integer, Float
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Subquery
+from fastapi import HTTPException, status
+
+from app.models.image_post import ImagePost
+from app.models.search_index import TS_CONFIG
+from app.schemas.image import ImageResponse, ImageSearchResponse
+
+
+class SearchService:
+    """프롬프트 검색 비즈니스 로직을 처리하는 서비스 클래스"""
+
+    @staticmethod
+    def encode_cursor(rank: float, image_id: int) -> str:
+        """(관련도, 이미지 ID)를 URL에 안전한 커서 문자열로 만듭니다."""
+        raw = json.dumps([rank, image_id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[float, int]:
+        """커서 문자열을 (관련도, 이미지 ID)로 되돌립니다."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            rank, image_id = json.loads(base64.urlsafe_b64decode(padded))
+            return float(rank), int(image_id)
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잘못된 커서입니다."
+            )
+
+    @staticmethod
+    def _postgres_matches(query: str) -> Subquery:
+        """PostgreSQL: GIN 인덱스(prompt_tsv)로 일치하는 (id, rank)를 구합니다."""
+        ts_query = func.websearch_to_tsquery(literal_column(f"'{TS_CONFIG}'::regconfig"), query)
+        prompt_tsv = literal_column("image_posts.prompt_tsv")
+        return (
+            select(
+                ImagePost.id.label("id"),
+                func.ts_rank_cd(prompt_tsv, ts_query).label("rank"),
+            )
+            .where(prompt_tsv.op("@@")(ts_query))
+            .subquery("matches")
+        )
+
+    @staticmethod
+    def _sqlite_matches(query: str) -> Optional[Subquery]:
+        """SQLite: FTS5 테이블에서 일치하는 (id, rank)를 구합니다. 검색어가 없으면 None."""
+        # FTS5 쿼리 문법 오류를 피하기 위해 단어만 뽑아 각각 따옴표로 감쌈 (모든 단어 포함 = AND)
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return None
+        match = " ".join(f'"{term}"' for term in terms)
+        return (
+            text(
+                "SELECT rowid AS id, -bm25(image_posts_fts) AS rank "
+                "FROM image_posts_fts WHERE image_posts_fts MATCH :match"
+            )
+            .bindparams(match=match)
+            .columns(id=Integer, rank=Float)
+            .subquery("matches")
+        )
+
+    @staticmethod
+    async def search_prompts(
+        db: AsyncSession,
+        query: str,
+        size: int = 20,
+        cursor: Optional[str] = None
+    ) -> ImageSearchResponse:
+        """
+        프롬프트에 검색어가 포함된 활성 이미지를 관련도 순으로 조회합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            query: 검색어 (PostgreSQL은 "따옴표 구절", -제외어 등 웹 검색 문법 지원)
+            size: 페이지 크기
+            cursor: 이전 응답의 next_cursor (첫 페이지는 None)
+
+        Returns:
+            ImageSearchResponse: 검색 결과와 다음 페이지 커서
+        """
+        dialect = db.bind.dialect.name
+        if dialect == "postgresql":
+            matches = SearchService._postgres_matches(query)
+        elif dialect == "sqlite":
+            matches = SearchService._sqlite_matches(query)
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail="현재 데이터베이스에서는 검색을 지원하지 않습니다."
+            )
+
+        if matches is None:
+            return ImageSearchResponse(items=[], next_cursor=None)
+
+        stmt = (
+            select(ImagePost, matches.c.rank)
+            .join(matches, ImagePost.id == matches.c.id)
+            .where(ImagePost.is_active == True)
+        )
+
+        if cursor:
+            last_rank, last_id = SearchService.decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    matches.c.rank < last_rank,
+                    and_(matches.c.rank == last_rank, ImagePost.id < last_id)
+                )
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        stmt = stmt.order_by(matches.c.rank.desc(), ImagePost.id.desc()).limit(size + 1)
+        rows = (await db.execute(stmt)).all()
+
+        next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            last_image, last_rank = rows[-1]
+            next_cursor = SearchService.encode_cursor(last_rank, last_image.id)
+
+        items = [
+            ImageResponse.model_validate(image)
+            for image, _ in rows
+        ]
+
+        return ImageSearchResponse(items=items, next_cursor=next_cursor)
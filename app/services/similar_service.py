@@ -0,0 +1,177 @@
+"""
+비슷한 프롬프트 추천 서비스 레이어
+
+프롬프트 MinHash 서명을 LSH 버킷(image_prompt_buckets)에 기록하고,
+워커 프로세스별 메모리 인덱스로 같은 버킷의 후보만 비교해 추천합니다.
+
+쓰기 경로의 메모리 인덱스 변경은 트랜잭션이 커밋된 뒤에 반영합니다 (롤백되면 취소).
+"""
+
+import asyncio
+from typing import Optional
+
+from sqlalchemy import event, select, delete, insert, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.image_post import ImagePost
+from app.models.prompt_bucket import ImagePromptBucket
+from app.utils.minhash import (
+    MinHashLSHIndex,
+    band_keys,
+    signature,
+    signature_from_bytes,
+    signature_to_bytes,
+)
+
+# 세션별로 커밋 후 메모리 인덱스에 반영할 (이미지 ID, 서명 바이트) — 서명이 None이면 제거
+_PENDING_KEY = "similar_index_pending"
+
+
+class SimilarService:
+    """비슷한 프롬프트 추천 비즈니스 로직을 처리하는 서비스 클래스"""
+
+    # 워커 프로세스별 인덱스 (처음 사용할 때 DB에서 적재)
+    _index = MinHashLSHIndex()
+    _loaded = False
+    _lock = asyncio.Lock()
+
+    @staticmethod
+    async def ensure_loaded(db: AsyncSession) -> None:
+        """
+        인덱스가 비어 있으면 저장된 서명과 버킷 키를 DB에서 적재합니다.
+
+        Args:
+            db: 데이터베이스 세션
+        """
+        if SimilarService._loaded:
+            return
+
+        async with SimilarService._lock:
+            if SimilarService._loaded:
+                return
+
+            keys: dict[int, list[int]] = {}
+            bucket_stmt = (
+                select(ImagePromptBucket.image_post_id, ImagePromptBucket.band, ImagePromptBucket.bucket)
+                .order_by(ImagePromptBucket.image_post_id, ImagePromptBucket.band)
+                .execution_options(yield_per=20000)
+            )
+            result = await db.stream(bucket_stmt)
+            async for partition in result.partitions():
+                for image_id, _, bucket in partition:
+                    keys.setdefault(image_id, []).append(bucket)
+
+            signature_stmt = (
+                select(ImagePost.id, ImagePost.prompt_signature)
+                .where(
+                    and_(
+                        ImagePost.is_active == True,
+                        ImagePost.prompt_signature.is_not(None)
+                    )
+                )
+                .execution_options(yield_per=10000)
+            )
+            result = await db.stream(signature_stmt)
+            async for partition in result.partitions():
+                for image_id, data in partition:
+                    sig = signature_from_bytes(data)
+                    # 버킷 행이 빠진 이미지(재구성 도중 등)는 서명으로 다시 계산
+                    SimilarService._index.add(image_id, sig, keys.get(image_id))
+
+            SimilarService._loaded = True
+
+    @staticmethod
+    def sign(image: ImagePost) -> None:
+        """이미지 프롬프트의 MinHash 서명을 계산해 prompt_signature에 설정합니다."""
+        sig = signature(image.prompt)
+        image.prompt_signature = signature_to_bytes(sig) if sig else None
+
+    @staticmethod
+    async def index_image(db: AsyncSession, image: ImagePost) -> None:
+        """
+        sign()으로 설정한 서명의 버킷을 기록합니다 (기존 버킷은 교체, 메모리 인덱스는 커밋 후 반영).
+
+        Args:
+            db: 데이터베이스 세션
+            image: 이미지 게시물 (id가 부여된 상태)
+        """
+        sig = signature_from_bytes(image.prompt_signature) if image.prompt_signature else None
+
+        await db.execute(delete(ImagePromptBucket).where(ImagePromptBucket.image_post_id == image.id))
+        if sig is not None:
+            await db.execute(
+                insert(ImagePromptBucket),
+                [{"image_post_id": image.id, "band": band, "bucket": key} for band, key in enumerate(band_keys(sig))]
+            )
+        SimilarService._apply_on_commit(db, image.id, image.prompt_signature)
+
+    @staticmethod
+    def _apply_on_commit(db: AsyncSession, image_id: int, data: Optional[bytes]) -> None:
+        """세션이 커밋되면 apply_signature()를 실행하도록 표시합니다 (롤백되면 취소)."""
+        db.sync_session.info.setdefault(_PENDING_KEY, []).append((image_id, data))
+
+    @staticmethod
+    def apply_signature(image_id: int, data: Optional[bytes]) -> None:
+        """
+        메모리 인덱스에만 이미지의 서명을 반영합니다 (None이면 제거).
+
+        다른 워커에서 바뀐 이미지를 반영할 때도 사용합니다.
+        """
+        if data is None:
+            SimilarService._index.remove(image_id)
+        elif SimilarService._loaded:
+            sig = signature_from_bytes(data)
+            SimilarService._index.add(image_id, sig, band_keys(sig))
+
+    @staticmethod
+    async def remove(db: AsyncSession, image_id: int) -> None:
+        """삭제된 이미지의 버킷을 지우고, 커밋되면 메모리 인덱스에서도 제거합니다."""
+        await db.execute(delete(ImagePromptBucket).where(ImagePromptBucket.image_post_id == image_id))
+        SimilarService._apply_on_commit(db, image_id, None)
+
+    @staticmethod
+    def reset() -> None:
+        """인덱스를 비우고 다음 사용 시 DB에서 다시 적재하도록 표시합니다."""
+        SimilarService._index = MinHashLSHIndex()
+        SimilarService._loaded = False
+
+    @staticmethod
+    async def find_similar(
+        db: AsyncSession,
+        image: ImagePost,
+        limit: int = 10,
+        min_similarity: float = 0.2
+    ) -> list[tuple[int, float]]:
+        """
+        프롬프트가 비슷한 활성 이미지를 찾습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            image: 기준 이미지
+            limit: 최대 개수
+            min_similarity: 최소 추정 유사도 (0~1)
+
+        Returns:
+            list[tuple[int, float]]: (이미지 ID, 추정 유사도) 목록, 유사도 내림차순
+        """
+        await SimilarService.ensure_loaded(db)
+
+        sig: Optional[tuple[int, ...]] = SimilarService._index.get(image.id)
+        if sig is None:
+            sig = signature_from_bytes(image.prompt_signature) if image.prompt_signature else signature(image.prompt)
+        if sig is None:
+            return []
+
+        return SimilarService._index.query(sig, limit, exclude=[image.id], min_similarity=min_similarity)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session) -> None:
+    for image_id, data in session.info.pop(_PENDING_KEY, ()):
+        SimilarService.apply_signature(image_id, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,164 @@
+"""
+저장 객체 참조 카운트 서비스 레이어
+
+콘텐츠 주소 저장 모드에서 파일 공유 여부를 관리합니다.
+
+마지막 참조가 사라진 파일은 트랜잭션이 커밋된 뒤에만 지웁니다 (delete_files_on_commit).
+커밋이 실패하면 게시물이 그대로 남으므로 파일도 남겨야 합니다.
+
+삭제와 새 참조(acquire)는 참조 행의 잠금으로 직렬화합니다.
+- release는 ref_count가 0이 되어도 행을 남겨 둡니다 (삭제 대기 표시).
+- 삭제 작업은 ref_count=0인 행을 지운 트랜잭션 안에서 파일을 지우고 커밋합니다.
+  그 사이 acquire는 같은 행에서 기다리므로, 아직 커밋되지 않은 업로드가 올린 참조도
+  삭제 작업이 보게 됩니다 (ref_count > 0이면 행도 파일도 남김).
+- 삭제 작업이 먼저 끝났다면 acquire는 새 행을 만들고, 업로드 쪽이 restore_upload로
+  재사용하려던 파일을 다시 기록합니다.
+"""
+
+import asyncio
+from typing import Optional
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.database import AsyncSessionLocal
+from app.models.storage_object import StorageObject
+from app.utils.file_handler import delete_file
+
+# 세션별로 커밋 후 삭제할 (저장 키, 파일 URL 목록)
+_PENDING_DELETE_KEY = "storage_pending_deletes"
+
+# 실행 중인 삭제 작업 (GC로 사라지지 않도록 참조 보관)
+_delete_tasks: set[asyncio.Task] = set()
+
+
+class StorageRefService:
+    """저장 객체 참조 카운트를 관리하는 서비스 클래스"""
+
+    @staticmethod
+    async def acquire(
+        db: AsyncSession,
+        object_key: str
+    ) -> None:
+        """
+        저장 객체의 참조 카운트를 1 증가시킵니다.
+
+        처음 참조되는 객체라면 ref_count=1로 새 행을 만듭니다.
+
+        Args:
+            db: 데이터베이스 세션
+            object_key: 저장 키 (파일명)
+        """
+        # 기존 행이 있으면 DB에서 원자적으로 증가
+        stmt = (
+            update(StorageObject)
+            .where(StorageObject.object_key == object_key)
+            .values(ref_count=StorageObject.ref_count + 1)
+        )
+        result = await db.execute(stmt)
+        if result.rowcount:
+            return
+
+        # 첫 참조: 새 행 생성 (동시에 다른 요청이 먼저 만들었다면 증가로 재시도)
+        try:
+            async with db.begin_nested():
+                db.add(StorageObject(object_key=object_key, ref_count=1))
+        except IntegrityError:
+            await db.execute(stmt)
+
+    @staticmethod
+    async def release(
+        db: AsyncSession,
+        object_key: str
+    ) -> Optional[int]:
+        """
+        저장 객체의 참조 카운트를 1 감소시킵니다.
+
+        Args:
+            db: 데이터베이스 세션
+            object_key: 저장 키 (파일명)
+
+        Returns:
+            Optional[int]: 남은 참조 수. 추적하지 않는 객체라면 None
+        """
+        stmt = (
+            select(StorageObject)
+            .where(StorageObject.object_key == object_key)
+            .with_for_update()
+        )
+        result = await db.execute(stmt)
+        obj = result.scalar_one_or_none()
+
+        if obj is None:
+            return None
+
+        obj.ref_count = max(obj.ref_count - 1, 0)
+        remaining = obj.ref_count
+
+        # 마지막 참조가 사라져도 행은 남김 (커밋 후 삭제 작업이 잠그고 정리)
+        await db.flush()
+        return remaining
+
+    @staticmethod
+    def delete_files_on_commit(
+        db: AsyncSession,
+        object_key: str,
+        file_urls: list[str]
+    ) -> None:
+        """
+        세션이 커밋되면 저장 객체의 파일들을 삭제하도록 표시합니다 (롤백되면 취소).
+
+        Args:
+            db: 데이터베이스 세션
+            object_key: 저장 키 (파일명)
+            file_urls: 삭제할 파일 URL 목록 (원본, 보관 원본, 변형)
+        """
+        db.sync_session.info.setdefault(_PENDING_DELETE_KEY, []).append((object_key, list(file_urls)))
+
+    @staticmethod
+    async def delete_if_unreferenced(
+        object_key: str,
+        file_urls: list[str]
+    ) -> bool:
+        """
+        저장 객체의 참조 수가 0일 때만 행과 파일을 삭제합니다.
+
+        ref_count=0인 행을 지운 뒤 커밋하기 전에 파일을 지우므로, 그동안 같은 객체를
+        acquire하는 업로드는 행 잠금에서 기다렸다가 새 행을 만들고 파일을 다시 기록합니다.
+
+        Returns:
+            bool: 파일을 삭제했는지 여부 (다시 참조되어 건너뛰면 False)
+        """
+        async with AsyncSessionLocal() as db:
+            stmt = (
+                delete(StorageObject)
+                .where(StorageObject.object_key == object_key, StorageObject.ref_count == 0)
+                .execution_options(synchronize_session=False)
+            )
+            if not (await db.execute(stmt)).rowcount:
+                print(f"ℹ️  다시 참조된 저장 객체라 파일을 유지합니다: {object_key}")
+                return False
+
+            for file_url in file_urls:
+                await delete_file(file_url)
+            await db.commit()
+        return True
+
+
+@event.listens_for(Session, "after_commit")
+def _delete_files_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_DELETE_KEY, None)
+    if not pending:
+        return
+
+    loop = asyncio.get_running_loop()
+    for object_key, file_urls in pending:
+        task = loop.create_task(StorageRefService.delete_if_unreferenced(object_key, file_urls))
+        _delete_tasks.add(task)
+        task.add_done_callback(_delete_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_deletes(session: Session) -> None:
+    session.info.pop(_PENDING_DELETE_KEY, None)
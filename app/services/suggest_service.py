@@ -0,0 +1,203 @@
+"""
+자동완성 서비스 레이어
+
+model_name 값과 자주 쓰이는 프롬프트 조각(쉼표로 구분된 구절)을
+워커 프로세스별 메모리 트라이에 올려 접두사 자동완성을 DB 조회 없이 처리합니다.
+
+- 새 이미지가 등록되면 트랜잭션이 커밋된 뒤 트라이에 반영합니다 (증분 갱신, 롤백되면 취소).
+- SUGGEST_REBUILD_SECONDS마다 DB에서 다시 집계해 교체합니다 (삭제/수정 반영).
+  재구성은 백그라운드에서 실행되며, 그동안에는 기존 트라이로 응답합니다.
+- 트라이 생성(구절 분리/집계/삽입)은 순수 파이썬 CPU 작업이므로 DB에서 행을 읽은 뒤
+  스레드에서 실행해 이벤트 루프를 막지 않습니다.
+- 메모리 상한: 빈도 상위 SUGGEST_MAX_FRAGMENTS개 구절만 넣고, 노드 수는 SUGGEST_MAX_NODES로 제한합니다.
+"""
+
+import asyncio
+import re
+import time
+from collections import Counter
+from typing import Optional
+
+from sqlalchemy import event, select, func, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.image_post import ImagePost
+from app.utils.prefix_trie import PrefixTrie
+
+# 프롬프트 조각 분리 기준과 길이 제한
+_FRAGMENT_SPLIT = re.compile(r"[,.\n;|]+")
+_FRAGMENT_MIN_LENGTH = 2
+_FRAGMENT_MAX_WORDS = 6
+
+# 세션별로 커밋 후 트라이에 반영할 (모델명, 프롬프트)
+_PENDING_KEY = "suggest_trie_pending"
+
+
+class SuggestService:
+    """자동완성 비즈니스 로직을 처리하는 서비스 클래스"""
+
+    _models = PrefixTrie(top_k=settings.SUGGEST_TOP_K)
+    _fragments = PrefixTrie(top_k=settings.SUGGEST_TOP_K, max_nodes=settings.SUGGEST_MAX_NODES)
+    _built_at: Optional[float] = None
+    _lock = asyncio.Lock()
+    _rebuild_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def prompt_fragments(prompt: str) -> list[str]:
+        """프롬프트를 자동완성 후보 구절 목록으로 나눕니다 (한 프롬프트 안의 중복은 제거)."""
+        fragments: list[str] = []
+        for part in _FRAGMENT_SPLIT.split(prompt):
+            words = part.split()
+            if not words or len(words) > _FRAGMENT_MAX_WORDS:
+                continue
+            fragment = " ".join(words)
+            if len(fragment) >= _FRAGMENT_MIN_LENGTH and fragment.lower() not in (f.lower() for f in fragments):
+                fragments.append(fragment)
+        return fragments
+
+    @staticmethod
+    def build_tries(
+        model_counts: list[tuple[str, int]],
+        prompts: list[str]
+    ) -> tuple[PrefixTrie, PrefixTrie]:
+        """
+        모델명 빈도와 프롬프트 목록으로 새 트라이를 만듭니다 (CPU 작업, 스레드에서 호출).
+
+        구절 빈도를 먼저 센 뒤 상위 SUGGEST_MAX_FRAGMENTS개만 빈도 내림차순으로 한 번씩 넣습니다.
+        """
+        models = PrefixTrie.from_counts(model_counts, top_k=settings.SUGGEST_TOP_K)
+
+        counts: Counter[str] = Counter()
+        display: dict[str, str] = {}
+        for prompt in prompts:
+            for fragment in SuggestService.prompt_fragments(prompt):
+                key = PrefixTrie.normalize(fragment)
+                counts[key] += 1
+                display.setdefault(key, fragment)
+
+        fragments = PrefixTrie.from_counts(
+            ((display[key], count) for key, count in counts.most_common(settings.SUGGEST_MAX_FRAGMENTS)),
+            top_k=settings.SUGGEST_TOP_K,
+            max_nodes=settings.SUGGEST_MAX_NODES,
+        )
+        return models, fragments
+
+    @staticmethod
+    async def _build(db: AsyncSession) -> tuple[PrefixTrie, PrefixTrie]:
+        """DB에서 모델명 빈도와 최근 프롬프트를 읽고, 스레드에서 새 트라이를 만듭니다."""
+        model_stmt = (
+            select(ImagePost.model_name, func.count(ImagePost.id))
+            .where(and_(ImagePost.is_active == True, ImagePost.model_name.is_not(None)))
+            .group_by(ImagePost.model_name)
+        )
+        model_counts = [(model_name, count) for model_name, count in (await db.execute(model_stmt)).all()]
+
+        # 프롬프트 조각은 최근 게시물 일부만 집계 (전체 테이블 스캔 방지)
+        prompt_stmt = (
+            select(ImagePost.prompt)
+            .where(ImagePost.is_active == True)
+            .order_by(ImagePost.id.desc())
+            .limit(settings.SUGGEST_PROMPT_SAMPLE)
+        )
+        prompts = list((await db.execute(prompt_stmt)).scalars().all())
+
+        return await asyncio.to_thread(SuggestService.build_tries, model_counts, prompts)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> None:
+        """트라이를 DB 기준으로 다시 만들어 교체합니다."""
+        started = time.monotonic()
+        models, fragments = await SuggestService._build(db)
+        SuggestService._models = models
+        SuggestService._fragments = fragments
+        SuggestService._built_at = time.monotonic()
+        print(
+            f"✅ 자동완성 트라이 재구성: 모델 {len(models)}개, 구절 {len(fragments)}개 "
+            f"(노드 {fragments.node_count:,}개) "
+            f"({(SuggestService._built_at - started) * 1000:.0f}ms)"
+        )
+
+    @staticmethod
+    async def _rebuild_in_background() -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                await SuggestService.rebuild(db)
+        except Exception as e:
+            print(f"⚠️  자동완성 트라이 재구성 실패: {e}")
+        finally:
+            SuggestService._rebuild_task = None
+
+    @staticmethod
+    async def ensure_fresh(db: AsyncSession) -> None:
+        """
+        트라이가 준비되어 있는지 확인합니다.
+
+        처음에는 요청 세션으로 직접 만들고(생성은 스레드에서 실행), 이후 오래되면 백그라운드 재구성을 시작합니다.
+        """
+        if SuggestService._built_at is None:
+            async with SuggestService._lock:
+                if SuggestService._built_at is None:
+                    await SuggestService.rebuild(db)
+            return
+
+        age = time.monotonic() - SuggestService._built_at
+        if age > settings.SUGGEST_REBUILD_SECONDS and SuggestService._rebuild_task is None:
+            SuggestService._rebuild_task = asyncio.create_task(SuggestService._rebuild_in_background())
+
+    @staticmethod
+    async def suggest(
+        db: AsyncSession,
+        prefix: str,
+        field: str = "model_name",
+        limit: int = 10
+    ) -> list[tuple[str, int]]:
+        """
+        접두사로 시작하는 자동완성 후보를 빈도 순으로 반환합니다.
+
+        Args:
+            db: 데이터베이스 세션 (최초 트라이 생성 시에만 사용)
+            prefix: 입력 중인 접두사
+            field: 'model_name' | 'prompt'
+            limit: 최대 후보 수
+
+        Returns:
+            list[tuple[str, int]]: (후보 문자열, 빈도) 목록
+        """
+        await SuggestService.ensure_fresh(db)
+        trie = SuggestService._models if field == "model_name" else SuggestService._fragments
+        return trie.suggest(prefix, limit)
+
+    @staticmethod
+    def mark_stale() -> None:
+        """다음 조회 때 백그라운드 재구성이 시작되도록 트라이를 오래된 것으로 표시합니다."""
+        if SuggestService._built_at is not None:
+            SuggestService._built_at = float("-inf")
+
+    @staticmethod
+    def add_on_commit(db: AsyncSession, model_name: Optional[str], prompt: str) -> None:
+        """세션이 커밋되면 새 이미지의 모델명과 프롬프트 조각을 트라이에 반영하도록 표시합니다 (롤백되면 취소)."""
+        db.sync_session.info.setdefault(_PENDING_KEY, []).append((model_name, prompt))
+
+    @staticmethod
+    def add(model_name: Optional[str], prompt: str) -> None:
+        """새 이미지의 모델명과 프롬프트 조각을 트라이에 반영합니다."""
+        if SuggestService._built_at is None:
+            return  # 아직 트라이가 없으면 최초 생성 시 DB에서 함께 집계됨
+        if model_name:
+            SuggestService._models.add(model_name)
+        for fragment in SuggestService.prompt_fragments(prompt):
+            SuggestService._fragments.add(fragment)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session) -> None:
+    for model_name, prompt in session.info.pop(_PENDING_KEY, ()):
+        SuggestService.add(model_name, prompt)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
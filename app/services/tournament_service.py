@@ -4,13 +4,20 @@
 토너먼트 관련 비즈니스 로직을 처리합니다.
 """
 
-from typing import Tuple, Optional
+import random
+from array import array
+from typing import Tuple, Optional, Union
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
+from app.core.cache import CACHE_TOURNAMENT_POOL, IMAGE_NAMESPACES, get_or_load_shared, response_cache
+from app.core.database import run_in_session
 from app.models.image_post import ImagePost
 from app.models.tournament_vote import TournamentVote
+from app.schemas.image import ImageResponse
+from app.services.invalidation_service import InvalidationService
+from app.utils.fieldsets import rows_to_items, select_image_columns
 
 
 class TournamentService:
@@ -32,7 +39,26 @@ class TournamentService:
         Raises:
             HTTPException: 토너먼트 참여 이미지가 2개 미만인 경우
         """
-        # 토너먼트 참여 이미지 중 랜덤으로 2개 선택
+        # 참여 이미지 ID 목록(int64 배열)은 워커 간 공유 캐시에 두고, 그중 2개만 조회
+        # (목록 조회는 여러 요청이 함께 기다리므로 요청 세션이 아닌 별도 세션으로 실행)
+        pool = memoryview(await get_or_load_shared(
+            CACHE_TOURNAMENT_POOL, "ids", lambda: run_in_session(TournamentService._load_candidate_ids)
+        )).cast("q")
+        if len(pool) >= 2:
+            picked = random.sample(range(len(pool)), 2)
+            stmt = select(ImagePost).where(
+                and_(
+                    ImagePost.id.in_([pool[picked[0]], pool[picked[1]]]),
+                    ImagePost.is_active == True,
+                    ImagePost.is_tournament_opt_in == True
+                )
+            )
+            images = (await db.execute(stmt)).scalars().all()
+            if len(images) == 2:
+                random.shuffle(images)
+                return images[0], images[1]
+
+        # 목록이 비었거나 캐시 이후 바뀐 이미지를 뽑았으면 DB에서 직접 랜덤 선택
         stmt = (
             select(ImagePost)
             .where(
@@ -56,6 +82,18 @@ class TournamentService:
 
         return images[0], images[1]
 
+    @staticmethod
+    async def _load_candidate_ids(db: AsyncSession) -> bytes:
+        """토너먼트 참여 이미지 ID 목록을 int64 배열 바이트로 조회합니다."""
+        stmt = select(ImagePost.id).where(
+            and_(
+                ImagePost.is_active == True,
+                ImagePost.is_tournament_opt_in == True
+            )
+        )
+        result = await db.execute(stmt)
+        return array("q", result.scalars().all()).tobytes()
+
     @staticmethod
     async def record_vote(
         db: AsyncSession,
@@ -133,25 +171,35 @@ class TournamentService:
         await db.flush()
         await db.refresh(vote)
 
+        # 승리 횟수가 담긴 랭킹/목록/피드 응답 캐시는 커밋 후 무효화 (다른 워커에는 NOTIFY로 전달)
+        response_cache.invalidate_on_commit(db, *IMAGE_NAMESPACES)
+        await InvalidationService.publish(db, "vote", w=winner_image_id, l=loser_image_id)
+
         return vote, winner_image.tournament_win_count
 
     @staticmethod
     async def get_rankings(
         db: AsyncSession,
-        limit: int = 50
-    ) -> list[ImagePost]:
+        limit: int = 50,
+        fields: Optional[list[str]] = None
+    ) -> Union[list[ImageResponse], list[dict]]:
         """
         토너먼트 랭킹을 조회합니다.
 
         Args:
             db: 데이터베이스 세션
             limit: 조회할 랭킹 개수
+            fields: 응답에 포함할 필드 (지정 시 해당 컬럼과 승리 횟수만 조회하여 dict로 반환)
 
         Returns:
-            list[ImagePost]: 승리 횟수 기준 정렬된 이미지 목록
+            Union[list[ImageResponse], list[dict]]: 승리 횟수 기준 정렬된 이미지 목록
         """
+        # 필드 지정 시에도 win_count 표시를 위해 승리 횟수는 항상 조회
+        if fields:
+            fields = list(dict.fromkeys([*fields, "tournament_win_count"]))
+
         stmt = (
-            select(ImagePost)
+            select(*select_image_columns(fields))
             .where(
                 and_(
                     ImagePost.is_active == True,
@@ -163,4 +211,4 @@ class TournamentService:
         )
 
         result = await db.execute(stmt)
-        return result.scalars().all()
+        return rows_to_items(result, fields)
@@ -0,0 +1,151 @@
+"""
+크기 제한이 있는 디스크 LRU 캐시
+
+렌더링 결과나 S3 원본처럼 다시 만들거나 받아올 수 있는 파일을 디스크에 캐시합니다.
+
+동작 방식
+- 키마다 하나의 파일로 저장합니다 ('<디렉토리>/<키 앞 2자리>/<키>').
+- 쓰기는 같은 디렉토리의 임시 파일에 기록한 뒤 os.replace로 교체하므로,
+  읽는 쪽이 덜 쓰인 파일을 보는 일이 없습니다.
+- 조회할 때마다 파일의 mtime을 갱신하고, 전체 크기가 max_bytes를 넘으면
+  mtime이 오래된 파일부터 삭제합니다 (LRU).
+- 디스크 상태만으로 동작하므로 여러 워커 프로세스가 같은 디렉토리를 공유해도 됩니다.
+
+모든 메서드는 블로킹 파일 I/O를 하므로 비동기 코드에서는 asyncio.to_thread로 호출하세요.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from typing import Optional
+
+
+class DiskLRUCache:
+    """크기 제한이 있는 디스크 LRU 캐시"""
+
+    # 정리할 때 max_bytes의 이 비율까지 줄여서, 한계 근처에서 매번 정리하지 않도록 합니다
+    LOW_WATERMARK = 0.9
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._current_bytes: Optional[int] = None  # 처음 사용할 때 디렉토리를 스캔해 계산
+
+    def path_for(self, key: str) -> str:
+        """키에 해당하는 캐시 파일 경로를 반환합니다."""
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 파일 경로를 반환합니다. 없으면 None.
+
+        최근 사용 시각을 기록하기 위해 mtime을 갱신합니다.
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def read(self, key: str) -> Optional[bytes]:
+        """캐시된 파일 내용을 반환합니다. 없거나 읽는 사이 삭제되었으면 None."""
+        path = self.get(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def remove(self, key: str) -> None:
+        """캐시 파일을 삭제합니다 (없으면 무시)."""
+        try:
+            size = os.stat(self.path_for(key)).st_size
+            os.remove(self.path_for(key))
+        except FileNotFoundError:
+            return
+
+        with self._lock:
+            if self._current_bytes is not None:
+                self._current_bytes -= size
+
+    def put(self, key: str, data: bytes) -> str:
+        """데이터를 원자적으로 저장하고 파일 경로를 반환합니다."""
+        path = self.path_for(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            if self._current_bytes is None:
+                self._current_bytes = self._scan_size()
+            else:
+                self._current_bytes += len(data)
+            over_limit = self._current_bytes > self.max_bytes
+
+        if over_limit:
+            self.evict()
+        return path
+
+    def evict(self) -> None:
+        """오래 사용되지 않은 파일부터 삭제하여 LOW_WATERMARK 이하로 줄입니다."""
+        entries = []
+        total = 0
+        for path, stat in self._iter_files():
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        target = int(self.max_bytes * self.LOW_WATERMARK)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                # 다른 워커가 먼저 지운 경우
+                total -= size
+
+        with self._lock:
+            self._current_bytes = total
+
+    def _scan_size(self) -> int:
+        """캐시 디렉토리의 전체 크기를 계산합니다."""
+        return sum(stat.st_size for _, stat in self._iter_files())
+
+    def _iter_files(self):
+        """캐시 파일의 (경로, stat) 목록을 순회합니다 (쓰는 중인 임시 파일 중 오래된 것은 정리)."""
+        if not os.path.isdir(self.directory):
+            return
+        now = time.time()
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.startswith(".tmp-"):
+                    # 쓰기 도중 종료된 프로세스가 남긴 임시 파일
+                    if now - stat.st_mtime > 3600:
+                        try:
+                            os.remove(entry.path)
+                        except FileNotFoundError:
+                            pass
+                    continue
+                yield entry.path, stat
@@ -0,0 +1,80 @@
+"""
+응답 필드 선택 (sparse fieldsets)과 Core 조회 fast path
+
+목록/피드/랭킹 API는 ORM 객체 없이 Core select로 필요한 컬럼만 조회합니다.
+- `fields=` 지정 시: 요청한 필드의 컬럼만 조회하고, 그 필드만 담긴 dict로 응답합니다.
+- 미지정 시: ImageResponse의 모든 컬럼을 조회하고, 행마다 pydantic 검증 없이
+  model_construct로 응답 객체를 만듭니다 (DB에서 온 값이므로 타입이 이미 보장됨).
+
+사용 예: `GET /images/?fields=id,image_url,like_count`
+"""
+
+from typing import Any, Optional, Union
+
+from fastapi import HTTPException, status
+from sqlalchemy import Column
+from sqlalchemy.engine import Result
+
+from app.core.responses import ORJSONResponse
+from app.models.image_post import ImagePost
+from app.schemas.image import ImageResponse
+
+# 선택할 수 있는 필드 (ImageResponse 필드 순서, 모두 image_posts 컬럼)
+IMAGE_FIELDS: tuple[str, ...] = tuple(ImageResponse.model_fields)
+
+
+def parse_image_fields(fields: Optional[str]) -> Optional[list[str]]:
+    """
+    `fields=` 값을 필드 목록으로 해석합니다.
+
+    id는 항상 포함하며, 순서는 ImageResponse 필드 순서를 따릅니다.
+
+    Args:
+        fields: 쉼표로 구분한 필드명 (None이나 빈 문자열이면 전체 필드)
+
+    Returns:
+        Optional[list[str]]: 선택한 필드 목록, 전체 필드면 None
+
+    Raises:
+        HTTPException: 알 수 없는 필드가 포함된 경우
+    """
+    if not fields:
+        return None
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(IMAGE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 필드입니다: {', '.join(sorted(unknown))} (사용 가능: {', '.join(IMAGE_FIELDS)})"
+        )
+
+    requested.add("id")
+    return [name for name in IMAGE_FIELDS if name in requested]
+
+
+def image_columns(fields: list[str]) -> list[Column]:
+    """필드 목록에 해당하는 image_posts 컬럼을 반환합니다."""
+    return [ImagePost.__table__.c[name] for name in fields]
+
+
+def select_image_columns(fields: Optional[list[str]]) -> list[Column]:
+    """조회할 컬럼 목록을 반환합니다 (fields가 없으면 ImageResponse 전체 필드)."""
+    return image_columns(fields or list(IMAGE_FIELDS))
+
+
+def rows_to_items(result: Result, fields: Optional[list[str]]) -> Union[list[ImageResponse], list[dict]]:
+    """
+    select_image_columns로 조회한 결과를 응답 항목으로 변환합니다.
+
+    Returns:
+        Union[list[ImageResponse], list[dict]]: fields 지정 시 dict 목록, 아니면 ImageResponse 목록
+    """
+    if fields:
+        return [dict(row) for row in result.mappings()]
+    return [ImageResponse.model_construct(**row) for row in result.mappings()]
+
+
+def sparse_response(payload: Any) -> ORJSONResponse:
+    """선택한 필드만 담긴 dict/list를 그대로 JSON 응답으로 만듭니다 (response_model 검증 생략)."""
+    return ORJSONResponse(content=payload)
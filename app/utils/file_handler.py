@@ -14,13 +14,32 @@
 - 반환되는 URL은 프론트엔드에서 바로 사용할 수 있는 공개 URL입니다.
   - CloudFront/CDN을 쓰는 경우 AWS_S3_PUBLIC_URL을 세팅하세요.
   - 아니면 표준 S3 URL을 자동으로 만듭니다.
+- STORAGE_CONTENT_ADDRESSED가 켜져 있으면 파일명 대신 내용의 SHA-256 해시를 저장 키로 씁니다.
+  같은 내용이 이미 저장되어 있으면 쓰기를 건너뜁니다(중복 업로드 제거).
+- UPLOAD_SHARDING이 켜져 있으면 로컬 파일을 'ab/cd/<파일명>' 형태의 하위 디렉토리에 나눠 저장합니다.
+  (한 디렉토리에 수백만 개의 파일이 쌓이는 것을 방지). 읽기/삭제는 기존 평면 구조도 함께 지원합니다.
+- 업로드 후 크기별 변형 이미지(예: 256/512/1024 WebP)를 프로세스 풀에서 만들어 같은 저장소에 저장합니다.
+- TRANSCODE_ENABLED가 켜져 있으면 저장 전에 EXIF를 제거하고 WebP/JPEG로 다시 인코딩합니다.
+- S3 저장소를 쓰면 원본을 로컬 디스크 LRU 캐시(STORAGE_CACHE_DIR, 워커 간 공유)에 함께 둡니다.
+  업로드할 때 채우고, read_file은 캐시를 먼저 보며 없을 때만 S3에서 받아 캐시에 넣습니다.
+  (업로드 파일명은 UUID/콘텐츠 해시라 같은 키의 내용이 바뀌지 않으므로 캐시를 무효화할 필요가 없습니다.)
 """
 
+import asyncio
+import hashlib
+import mimetypes
 import os
 import uuid
+from dataclasses import dataclass
+
 import aiofiles
 from fastapi import UploadFile, HTTPException, status
 from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.process_pool import run_in_process
+from app.utils.disk_cache import DiskLRUCache
+from app.utils.image_processing import FORMATS, analyze_image, generate_variants, transcode_image
+from app.utils.singleflight import SingleFlight
 
 CHUNK_SIZE = 1024 * 1024  # 1MB
 
@@ -31,13 +50,34 @@ except Exception:  # 로컬에서 즉시 boto3가 없을 수 있으므로 임포
     boto3 = None
     BotoCoreError = ClientError = Exception
 
+# S3 원본의 로컬 디스크 캐시 (디렉토리는 워커 간 공유)
+object_cache = DiskLRUCache(settings.STORAGE_CACHE_DIR, settings.STORAGE_CACHE_MAX_BYTES)
+
+# 같은 오브젝트에 대한 동시 다운로드를 하나로 합침 (업로드 직후 변형/분석/렌더가 겹치는 경우)
+_download_flight = SingleFlight("s3_download")
+
+
+@dataclass
+class StoredFile:
+    """저장된 업로드 파일 정보"""
+    url: str  # 프론트엔드에서 접근할 공개 URL
+    filename: str  # 저장 키(파일명)
+    content: bytes  # 파일 내용
+    digest: str  # 내용의 SHA-256 해시(hex)
+    created: bool  # 이번 요청에서 새로 저장했는지 (False면 기존 파일 재사용)
+    original_url: str | None = None  # 트랜스코딩 전 원본 URL (TRANSCODE_KEEP_ORIGINAL일 때만)
+    original_content: bytes | None = None  # 트랜스코딩 전 원본 내용 (원본을 보관할 때만, 복구용)
+
 
-async def _read_and_validate(file: UploadFile) -> tuple[str, bytes]:
+async def _read_and_validate(file: UploadFile) -> tuple[str, bytes, str]:
     """
     업로드 파일을 읽으면서 확장자/크기를 검증하고, 안전한 파일명을 생성합니다.
 
+    읽는 동안 SHA-256 해시를 함께 계산합니다.
+    콘텐츠 주소 모드에서는 해시가 파일명이 되고, 아니면 UUID를 사용합니다.
+
     Returns:
-        (safe_filename, content_bytes)
+        (safe_filename, content_bytes, sha256_hex)
     """
     # 1) 파일명/확장자 검증
     if not file.filename:
@@ -53,10 +93,8 @@ async def _read_and_validate(file: UploadFile) -> tuple[str, bytes]:
             detail=f"허용되지 않는 파일 형식입니다. 허용: {', '.join(settings.ALLOWED_EXTENSIONS)}"
         )
 
-    # 2) 안전한 파일명 생성 (UUID 사용)
-    safe_filename = f"{uuid.uuid4().hex}.{ext}"
-
-    # 3) 크기 검증을 하며 메모리에 적재 (10MB 기본 제한)
+    # 2) 크기 검증을 하며 메모리에 적재 (10MB 기본 제한)
+    hasher = hashlib.sha256()
     total_size = 0
     chunks: list[bytes] = []
     while True:
@@ -70,10 +108,19 @@ async def _read_and_validate(file: UploadFile) -> tuple[str, bytes]:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"파일 크기가 {max_size_mb}MB를 초과했습니다."
             )
+        hasher.update(chunk)
         chunks.append(chunk)
 
     content = b"".join(chunks)
-    return safe_filename, content
+    digest = hasher.hexdigest()
+
+    # 3) 안전한 파일명 생성 (콘텐츠 주소 모드면 해시, 아니면 UUID 사용)
+    if settings.STORAGE_CONTENT_ADDRESSED:
+        safe_filename = f"{digest}.{ext}"
+    else:
+        safe_filename = f"{uuid.uuid4().hex}.{ext}"
+
+    return safe_filename, content, digest
 
 
 def _build_s3_key(filename: str) -> str:
@@ -107,21 +154,123 @@ def _build_s3_url(key: str) -> str:
     return f"https://{settings.AWS_S3_BUCKET}.s3.{region}.amazonaws.com/{key}"
 
 
-async def validate_and_save_file(file: UploadFile) -> str:
+def _get_s3_client():
+    """S3 클라이언트를 생성합니다 (EC2에선 IAM Role 사용, 로컬은 환경변수 키 사용)."""
+    return boto3.client(
+        "s3",
+        region_name=settings.AWS_REGION or None,
+        endpoint_url=(settings.AWS_S3_ENDPOINT_URL or None) or None,
+    )
+
+
+def _object_cache_key(s3_key: str) -> str:
+    """S3 키를 디스크 캐시 키(파일명으로 쓸 수 있는 해시)로 바꿉니다."""
+    return hashlib.sha256(s3_key.encode("utf-8")).hexdigest()[:32]
+
+
+async def _cache_object(s3_key: str, content: bytes) -> None:
+    """S3 오브젝트 내용을 디스크 캐시에 넣습니다 (실패해도 요청은 계속 진행)."""
+    if not settings.STORAGE_CACHE_ENABLED:
+        return
+    try:
+        await asyncio.to_thread(object_cache.put, _object_cache_key(s3_key), content)
+    except OSError as e:
+        print(f"⚠️  저장소 캐시 기록 실패 ({s3_key}): {e}")
+
+
+def shard_relpath(filename: str) -> str:
     """
-    파일을 검증하고 저장합니다.
+    샤딩 레이아웃에서 파일의 상대 경로를 반환합니다.
+
+    파일명 해시의 앞 4자리로 2단계 디렉토리를 만듭니다.
+    예: 'abc.jpg' -> '90/01/abc.jpg'
+    파일명만으로 위치가 결정되므로 URL/DB 없이도 경로를 계산할 수 있습니다.
+    """
+    h = hashlib.md5(filename.encode("utf-8")).hexdigest()
+    return f"{h[:2]}/{h[2:4]}/{filename}"
+
+
+def _local_relpath(filename: str) -> str:
+    """새로 저장할 파일의 UPLOAD_DIR 기준 상대 경로를 반환합니다."""
+    return shard_relpath(filename) if settings.UPLOAD_SHARDING else filename
+
+
+def _local_path(filename: str) -> str:
+    """로컬 저장소에서 파일명이 저장될 경로를 반환합니다."""
+    return os.path.join(settings.UPLOAD_DIR, *_local_relpath(filename).split("/"))
+
+
+def find_local_file(filename: str) -> str | None:
+    """
+    로컬 저장소에서 파일의 실제 경로를 찾습니다.
+
+    샤딩 레이아웃과 기존 평면 레이아웃을 모두 확인하며, 없으면 None을 반환합니다.
+    """
+    filename = os.path.basename(filename)  # Path Traversal 방어
+    candidates = (
+        os.path.join(settings.UPLOAD_DIR, *shard_relpath(filename).split("/")),
+        os.path.join(settings.UPLOAD_DIR, filename),
+    )
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _local_url(filename: str) -> str:
+    """로컬 저장소 파일의 정적 경로(URL)를 반환합니다 (StaticFiles로 서빙됨)."""
+    return f"/uploads/images/{_local_relpath(filename)}"
+
+
+def _local_url_for_path(file_path: str) -> str:
+    """로컬 파일 경로를 정적 경로(URL)로 변환합니다."""
+    rel = os.path.relpath(file_path, settings.UPLOAD_DIR)
+    return f"/uploads/images/{rel.replace(os.sep, '/')}"
+
+
+def object_key_from_url(file_url: str) -> str:
+    """
+    이미지 URL에서 저장 키(파일명)를 추출합니다.
+
+    로컬/S3 모두 URL의 마지막 경로 조각이 파일명입니다.
+    참조 카운트 테이블의 키로 사용합니다.
+    """
+    return file_url.rsplit("/", 1)[-1]
+
+
+async def _object_exists(filename: str) -> bool:
+    """저장소에 같은 키의 파일이 이미 있는지 확인합니다."""
+    backend = settings.STORAGE_BACKEND.lower()
+
+    if backend == "local":
+        return find_local_file(filename) is not None
+
+    if backend == "s3":
+        if boto3 is None:
+            return False
+        s3 = _get_s3_client()
+        try:
+            s3.head_object(Bucket=settings.AWS_S3_BUCKET, Key=_build_s3_key(filename))
+            return True
+        except (BotoCoreError, ClientError):
+            return False
+
+    return False
+
+
+async def _write_object(filename: str, content: bytes, content_type: str | None = None) -> str:
+    """
+    파일 내용을 설정된 저장소에 기록하고 공개 URL을 반환합니다.
 
     - STORAGE_BACKEND == 'local': ./uploads/images 에 저장하고 '/uploads/images/...' URL을 반환합니다.
     - STORAGE_BACKEND == 's3': S3 버킷에 업로드하고 공개 URL을 반환합니다.
     """
-    # 공통: 파일 검증 + 메모리에 적재
-    safe_filename, content = await _read_and_validate(file)
-
     # 로컬 저장소
     if settings.STORAGE_BACKEND.lower() == "local":
-        file_path = os.path.join(settings.UPLOAD_DIR, safe_filename)
+        file_path = _local_path(filename)
         try:
-            # 비동기 파일 저장
+            # 샤드 디렉토리 생성 후 비동기 파일 저장
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
             async with aiofiles.open(file_path, "wb") as out_file:
                 await out_file.write(content)
         except Exception as e:
@@ -134,7 +283,7 @@ async def validate_and_save_file(file: UploadFile) -> str:
             )
 
         # 정적 경로(URL) 반환 (StaticFiles로 서빙됨)
-        return f"/uploads/images/{safe_filename}"
+        return _local_url(filename)
 
     # S3 저장소
     if settings.STORAGE_BACKEND.lower() == "s3":
@@ -144,18 +293,13 @@ async def validate_and_save_file(file: UploadFile) -> str:
                 detail="boto3가 설치되어 있지 않습니다. requirements.txt를 확인하세요."
             )
 
-        # S3 클라이언트 생성 (EC2에선 IAM Role 사용, 로컬은 환경변수 키 사용)
-        s3 = boto3.client(
-            "s3",
-            region_name=settings.AWS_REGION or None,
-            endpoint_url=(settings.AWS_S3_ENDPOINT_URL or None) or None,
-        )
+        s3 = _get_s3_client()
 
-        key = _build_s3_key(safe_filename)
+        key = _build_s3_key(filename)
         # ExtraArgs 구성: ContentType은 있으면 추가
         extra: dict = {}
-        if getattr(file, "content_type", None):
-            extra["ContentType"] = file.content_type
+        if content_type:
+            extra["ContentType"] = content_type
 
         # 버킷에서 ACL이 금지(Bucket owner enforced)된 경우가 있으므로,
         # 값이 비어있지 않을 때만 ACL을 넣고, 실패 시 ACL 없이 재시도합니다.
@@ -190,6 +334,9 @@ async def validate_and_save_file(file: UploadFile) -> str:
                 detail=f"S3 업로드 실패: {str(e)}"
             )
 
+        # 방금 올린 원본은 곧 변형/분석에 쓰이므로 로컬 캐시에도 기록
+        await _cache_object(key, content)
+
         # 최종 접근 가능한 URL 구성
         return _build_s3_url(key)
 
@@ -200,6 +347,300 @@ async def validate_and_save_file(file: UploadFile) -> str:
     )
 
 
+def _build_url(filename: str) -> str:
+    """저장 키(파일명)에 해당하는 공개 URL을 만듭니다 (쓰기 없이)."""
+    if settings.STORAGE_BACKEND.lower() == "s3":
+        return _build_s3_url(_build_s3_key(filename))
+    existing = find_local_file(filename)
+    return _local_url_for_path(existing) if existing else _local_url(filename)
+
+
+async def save_upload(file: UploadFile) -> StoredFile:
+    """
+    파일을 검증하고 저장한 뒤 저장 정보를 반환합니다.
+
+    콘텐츠 주소 모드에서 같은 내용의 파일이 이미 있으면 쓰기를 건너뛰고
+    created=False로 기존 파일의 URL을 반환합니다.
+    """
+    # 공통: 파일 검증 + 메모리에 적재
+    safe_filename, content, digest = await _read_and_validate(file)
+    content_type = getattr(file, "content_type", None)
+
+    # 선택: 최적화 포맷으로 트랜스코딩 (원본은 설정 시에만 별도 보관)
+    original: tuple[str, bytes, str | None] | None = None
+    if settings.TRANSCODE_ENABLED:
+        transcoded = await _transcode(safe_filename, content)
+        if transcoded is not None:
+            original = (safe_filename, content, content_type)
+            safe_filename, content, digest, content_type = transcoded
+
+    original_filename = _original_filename(safe_filename, original[0]) if original else None
+    keep_original = original is not None and settings.TRANSCODE_KEEP_ORIGINAL
+
+    # 중복 업로드: 이미 저장된 객체를 그대로 재사용
+    if settings.STORAGE_CONTENT_ADDRESSED and await _object_exists(safe_filename):
+        original_url = None
+        if keep_original and await _object_exists(original_filename):
+            original_url = _build_url(original_filename)
+        return StoredFile(
+            url=_build_url(safe_filename),
+            filename=safe_filename,
+            content=content,
+            digest=digest,
+            created=False,
+            original_url=original_url,
+            original_content=original[1] if original_url else None,
+        )
+
+    url = await _write_object(safe_filename, content, content_type)
+
+    original_url = None
+    if keep_original:
+        try:
+            original_url = await _write_object(original_filename, original[1], original[2])
+        except HTTPException:
+            await delete_file(url)
+            raise
+
+    return StoredFile(
+        url=url,
+        filename=safe_filename,
+        content=content,
+        digest=digest,
+        created=True,
+        original_url=original_url,
+    )
+
+
+async def restore_upload(stored: StoredFile, variant_urls: dict[str, str]) -> None:
+    """
+    재사용한 콘텐츠 주소 파일이 그 사이 삭제되었으면 다시 기록합니다.
+
+    중복 업로드는 파일이 있는 것을 확인하고 쓰기를 건너뛰지만, 그 직후 마지막 참조가
+    삭제되어 커밋 후 삭제 작업이 파일을 지웠을 수 있습니다. 참조 카운트를 올린(acquire) 뒤에
+    호출해야 합니다 (이후의 삭제 작업은 이 참조를 보고 파일을 남김).
+
+    Args:
+        stored: save_upload 결과 (새로 저장한 파일이면 아무것도 하지 않음)
+        variant_urls: 게시물에 기록할 변형 이미지 URL
+    """
+    if stored.created:
+        return
+
+    if not await _object_exists(stored.filename):
+        await _write_object(stored.filename, stored.content, mimetypes.guess_type(stored.filename)[0])
+        print(f"ℹ️  삭제된 저장 객체를 다시 기록했습니다: {stored.filename}")
+
+    if stored.original_url and stored.original_content is not None:
+        original_filename = object_key_from_url(stored.original_url)
+        if not await _object_exists(original_filename):
+            await _write_object(
+                original_filename, stored.original_content, mimetypes.guess_type(original_filename)[0]
+            )
+
+    missing = [
+        int(size) for size in variant_urls
+        if not await _object_exists(_variant_filename(stored.filename, int(size)))
+    ]
+    if not missing:
+        return
+    try:
+        variants = await run_in_process(
+            generate_variants,
+            stored.content,
+            missing,
+            settings.IMAGE_VARIANT_FORMAT,
+            settings.IMAGE_VARIANT_QUALITY,
+        )
+    except Exception as e:
+        print(f"변형 이미지 복구 실패: {e}")
+        return
+    _, content_type = FORMATS[settings.IMAGE_VARIANT_FORMAT]
+    for size, data in variants.items():
+        await _write_object(_variant_filename(stored.filename, size), data, content_type)
+
+
+def _original_filename(filename: str, source_filename: str) -> str:
+    """트랜스코딩 전 원본을 보관할 파일명을 만듭니다. 예: ('abc.webp', 'x.png') -> 'abc_original.png'"""
+    stem = filename.rsplit(".", 1)[0]
+    ext = source_filename.rsplit(".", 1)[-1]
+    return f"{stem}_original.{ext}"
+
+
+async def _transcode(filename: str, content: bytes) -> tuple[str, bytes, str, str] | None:
+    """
+    업로드 원본을 프로세스 풀에서 다시 인코딩합니다.
+
+    절감한 바이트 수는 메트릭(transcode_bytes_saved 등)으로 기록합니다.
+    변환에 실패하거나 이득이 없으면 None을 반환하여 원본을 그대로 사용합니다.
+
+    Returns:
+        (새 파일명, 변환된 바이트, SHA-256 해시, Content-Type) 또는 None
+    """
+    try:
+        result = await run_in_process(
+            transcode_image,
+            content,
+            settings.TRANSCODE_FORMAT,
+            settings.TRANSCODE_QUALITY,
+        )
+    except Exception as e:
+        metrics.inc("transcode_failed")
+        print(f"트랜스코딩 실패 (원본 유지): {e}")
+        return None
+
+    if result is None:
+        metrics.inc("transcode_skipped")
+        return None
+
+    data, ext = result
+    digest = hashlib.sha256(data).hexdigest()
+    stem = digest if settings.STORAGE_CONTENT_ADDRESSED else filename.rsplit(".", 1)[0]
+
+    metrics.inc("transcode_count")
+    metrics.inc("transcode_bytes_in", len(content))
+    metrics.inc("transcode_bytes_out", len(data))
+    metrics.inc("transcode_bytes_saved", len(content) - len(data))
+
+    return f"{stem}.{ext}", data, digest, FORMATS[ext][1]
+
+
+def _variant_filename(filename: str, size: int) -> str:
+    """원본 파일명에 대응하는 변형 이미지 파일명을 만듭니다. 예: 'abc.png' -> 'abc_256.webp'"""
+    stem = filename.rsplit(".", 1)[0]
+    return f"{stem}_{size}.{settings.IMAGE_VARIANT_FORMAT}"
+
+
+async def save_variants(stored: StoredFile) -> dict[str, str]:
+    """
+    업로드된 원본으로부터 크기별 변형 이미지를 생성해 저장합니다.
+
+    리사이즈/인코딩은 프로세스 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+    변형 생성 실패는 업로드 실패로 취급하지 않고 빈 결과를 반환합니다.
+
+    Returns:
+        dict[str, str]: {크기(문자열): 변형 이미지 URL}
+    """
+    if not settings.IMAGE_VARIANTS_ENABLED or not settings.IMAGE_VARIANT_SIZES:
+        return {}
+
+    # 중복 업로드(기존 파일 재사용)라면 이미 만들어 둔 변형을 그대로 사용
+    if not stored.created:
+        existing = {
+            str(size): _build_url(_variant_filename(stored.filename, size))
+            for size in settings.IMAGE_VARIANT_SIZES
+            if await _object_exists(_variant_filename(stored.filename, size))
+        }
+        if existing:
+            return existing
+
+    try:
+        variants = await run_in_process(
+            generate_variants,
+            stored.content,
+            settings.IMAGE_VARIANT_SIZES,
+            settings.IMAGE_VARIANT_FORMAT,
+            settings.IMAGE_VARIANT_QUALITY,
+        )
+    except Exception as e:
+        print(f"변형 이미지 생성 실패: {e}")
+        return {}
+
+    _, content_type = FORMATS[settings.IMAGE_VARIANT_FORMAT]
+    urls: dict[str, str] = {}
+    for size, data in variants.items():
+        urls[str(size)] = await _write_object(_variant_filename(stored.filename, size), data, content_type)
+    return urls
+
+
+async def analyze_upload(stored: StoredFile) -> dict:
+    """
+    업로드된 원본의 메타데이터(크기, 포맷, 대표 색상 등)를 프로세스 풀에서 추출합니다.
+
+    분석 실패는 업로드 실패로 취급하지 않고 파일 크기만 담아 반환합니다.
+    """
+    try:
+        return await run_in_process(analyze_image, stored.content)
+    except Exception as e:
+        print(f"이미지 메타데이터 추출 실패: {e}")
+        return {"file_size": len(stored.content)}
+
+
+async def validate_and_save_file(file: UploadFile) -> str:
+    """
+    파일을 검증하고 저장합니다.
+
+    - STORAGE_BACKEND == 'local': ./uploads/images 에 저장하고 '/uploads/images/...' URL을 반환합니다.
+    - STORAGE_BACKEND == 's3': S3 버킷에 업로드하고 공개 URL을 반환합니다.
+    """
+    stored = await save_upload(file)
+    return stored.url
+
+
+async def read_file(file_url: str) -> bytes:
+    """
+    저장소에서 파일 내용을 읽어 옵니다 (리사이즈 등 서버 측 이미지 처리용).
+
+    - 로컬: URL의 파일명으로 샤딩/평면 위치를 찾아 읽습니다.
+    - S3: 공개 URL에서 오브젝트 키를 추출해 다운로드합니다.
+
+    Raises:
+        HTTPException: 파일을 찾을 수 없거나 읽지 못한 경우
+    """
+    backend = settings.STORAGE_BACKEND.lower()
+
+    if backend == "local" or file_url.startswith("/uploads/"):
+        file_path = find_local_file(file_url)
+        if not file_path:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="원본 이미지 파일을 찾을 수 없습니다."
+            )
+        async with aiofiles.open(file_path, "rb") as f:
+            return await f.read()
+
+    if backend == "s3":
+        key = _extract_s3_key_from_url(file_url)
+        if boto3 is None or not key:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="원본 이미지 파일을 찾을 수 없습니다."
+            )
+
+        if settings.STORAGE_CACHE_ENABLED:
+            cached = await asyncio.to_thread(object_cache.read, _object_cache_key(key))
+            if cached is not None:
+                metrics.inc("storage_cache.hits")
+                return cached
+            metrics.inc("storage_cache.misses")
+
+        return await _download_flight.do(key, lambda: _download_s3_object(key))
+
+    raise HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail="올바르지 않은 STORAGE_BACKEND 값입니다. 'local' 또는 's3'로 설정하세요."
+    )
+
+
+async def _download_s3_object(key: str) -> bytes:
+    """S3에서 오브젝트를 받아 디스크 캐시에 넣고 내용을 반환합니다."""
+    def _download() -> bytes:
+        response = _get_s3_client().get_object(Bucket=settings.AWS_S3_BUCKET, Key=key)
+        return response["Body"].read()
+
+    try:
+        # boto3는 블로킹 I/O이므로 스레드에서 실행
+        content = await asyncio.to_thread(_download)
+    except (BotoCoreError, ClientError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"S3 다운로드 실패: {str(e)}"
+        )
+
+    await _cache_object(key, content)
+    return content
+
+
 async def delete_file(file_url: str) -> bool:
     """
     파일을 삭제합니다.
@@ -212,11 +653,10 @@ async def delete_file(file_url: str) -> bool:
     try:
         backend = settings.STORAGE_BACKEND.lower()
 
-        # 1) 로컬 파일 삭제
+        # 1) 로컬 파일 삭제 (샤딩/평면 레이아웃 모두 확인)
         if backend == "local" or file_url.startswith("/uploads/"):
-            filename = os.path.basename(file_url)  # Path Traversal 방어
-            file_path = os.path.join(settings.UPLOAD_DIR, filename)
-            if os.path.exists(file_path):
+            file_path = find_local_file(file_url)
+            if file_path:
                 os.remove(file_path)
                 return True
             return False
@@ -231,13 +671,11 @@ async def delete_file(file_url: str) -> bool:
             if not key:
                 return False
 
-            s3 = boto3.client(
-                "s3",
-                region_name=settings.AWS_REGION or None,
-                endpoint_url=(settings.AWS_S3_ENDPOINT_URL or None) or None,
-            )
+            s3 = _get_s3_client()
             try:
                 s3.delete_object(Bucket=settings.AWS_S3_BUCKET, Key=key)
+                # 이 호스트의 캐시에서도 제거 (다른 호스트의 캐시는 LRU로 밀려남)
+                await asyncio.to_thread(object_cache.remove, _object_cache_key(key))
                 return True
             except (BotoCoreError, ClientError):
                 return False
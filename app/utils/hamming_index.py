@@ -0,0 +1,116 @@
+"""
+해밍 거리 검색 인덱스 (Multi-Index Hashing)
+
+64비트 지각 해시 집합에서 "거리 r 이내"인 항목을 전체 스캔 없이 찾습니다.
+
+원리 (비둘기집 원리)
+- 64비트를 m개의 조각(기본 4개 x 16비트)으로 나누고, 조각마다 해시 테이블을 둡니다.
+- 두 해시의 거리가 r 이하이면, 적어도 한 조각은 거리 r // m 이하입니다.
+- 따라서 각 조각 값에서 r // m 비트 이내로 바꾼 값들만 테이블에서 찾아 후보를 모으고,
+  후보에 대해서만 실제 거리를 계산합니다.
+
+조각 테이블의 버킷 크기는 평균 N / 2^16 이므로, 100만 개에서도 후보 수가 작게 유지됩니다.
+"""
+
+from itertools import combinations
+from typing import Iterable
+
+_MASK_64 = (1 << 64) - 1
+
+
+class HammingIndex:
+    """64비트 해시용 Multi-Index Hashing 인덱스"""
+
+    def __init__(self, bits: int = 64, chunks: int = 4):
+        if bits % chunks:
+            raise ValueError("bits는 chunks로 나누어떨어져야 합니다.")
+        self.bits = bits
+        self.chunks = chunks
+        self.chunk_bits = bits // chunks
+        self._chunk_mask = (1 << self.chunk_bits) - 1
+        self._tables: list[dict[int, list[int]]] = [{} for _ in range(chunks)]
+        self._hashes: dict[int, int] = {}
+        # 조각 반경별로 뒤집을 비트 마스크 목록을 캐시
+        self._flip_masks: dict[int, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._hashes
+
+    def _split(self, value: int) -> list[int]:
+        """해시를 조각 값 목록으로 나눕니다."""
+        return [
+            (value >> (i * self.chunk_bits)) & self._chunk_mask
+            for i in range(self.chunks)
+        ]
+
+    def add(self, item_id: int, value: int) -> None:
+        """항목을 추가합니다 (이미 있으면 해시를 교체)."""
+        value &= _MASK_64  # DB의 부호 있는 BIGINT 값을 부호 없는 값으로
+        if item_id in self._hashes:
+            self.remove(item_id)
+        self._hashes[item_id] = value
+        for table, part in zip(self._tables, self._split(value)):
+            table.setdefault(part, []).append(item_id)
+
+    def add_many(self, items: Iterable[tuple[int, int]]) -> None:
+        """(id, 해시) 목록을 한 번에 추가합니다."""
+        for item_id, value in items:
+            self.add(item_id, value)
+
+    def remove(self, item_id: int) -> None:
+        """항목을 제거합니다 (없으면 무시)."""
+        value = self._hashes.pop(item_id, None)
+        if value is None:
+            return
+        for table, part in zip(self._tables, self._split(value)):
+            bucket = table.get(part)
+            if bucket is None:
+                continue
+            bucket.remove(item_id)
+            if not bucket:
+                del table[part]
+
+    def _masks(self, radius: int) -> list[int]:
+        """조각 안에서 radius 비트 이하를 뒤집는 모든 마스크를 반환합니다."""
+        masks = self._flip_masks.get(radius)
+        if masks is None:
+            masks = [0]
+            for k in range(1, radius + 1):
+                for positions in combinations(range(self.chunk_bits), k):
+                    mask = 0
+                    for p in positions:
+                        mask |= 1 << p
+                    masks.append(mask)
+            self._flip_masks[radius] = masks
+        return masks
+
+    def search(self, value: int, max_distance: int) -> list[tuple[int, int]]:
+        """
+        거리 max_distance 이내의 항목을 찾습니다.
+
+        Returns:
+            list[tuple[int, int]]: (id, 거리) 목록, 거리 오름차순
+        """
+        value &= _MASK_64
+        masks = self._masks(max_distance // self.chunks)
+
+        seen: set[int] = set()
+        results: list[tuple[int, int]] = []
+        for table, part in zip(self._tables, self._split(value)):
+            for mask in masks:
+                bucket = table.get(part ^ mask)
+                if not bucket:
+                    continue
+                for item_id in bucket:
+                    if item_id in seen:
+                        continue
+                    seen.add(item_id)
+                    distance = (self._hashes[item_id] ^ value).bit_count()
+                    if distance <= max_distance:
+                        results.append((item_id, distance))
+
+        results.sort(key=lambda pair: (pair[1], pair[0]))
+        return results
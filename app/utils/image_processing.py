@@ -0,0 +1,286 @@
+"""
+이미지 처리 함수 (프로세스 풀 작업용)
+
+이 모듈의 함수는 app.core.process_pool의 워커 프로세스에서 실행됩니다.
+- 인자와 반환값은 피클 가능한 기본 타입(bytes, int, dict 등)만 사용합니다.
+- 앱 설정/DB에 의존하지 않도록 Pillow만 import합니다.
+"""
+
+import base64
+import io
+
+from typing import Optional
+
+from PIL import Image, ImageOps, ImageSequence
+
+# Pillow 저장 포맷 이름과 Content-Type
+FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+    "png": ("PNG", "image/png"),
+}
+
+# 로딩 전 표시용 플레이스홀더(LQIP)의 긴 변 크기와 품질
+PLACEHOLDER_SIZE = 16
+PLACEHOLDER_QUALITY = 30
+
+# 팔레트: 최대 색 수와 포함할 최소 면적 비율
+PALETTE_COLORS = 5
+PALETTE_MIN_RATIO = 0.05
+
+# 색상 검색 버킷: 채널별 단계 수 (4단계 -> 4^3 = 64개 버킷)
+COLOR_BUCKET_LEVELS = 4
+
+
+def _to_rgb(img: Image.Image, fmt: str) -> Image.Image:
+    """저장 포맷에 맞게 색상 모드를 변환합니다 (JPEG는 알파 채널 미지원)."""
+    if fmt == "jpeg":
+        return img.convert("RGB")
+    if img.mode not in ("RGB", "RGBA"):
+        return img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+    return img
+
+
+def encode_image(img: Image.Image, fmt: str, quality: int, icc_profile: Optional[bytes] = None) -> bytes:
+    """
+    이미지를 지정한 포맷으로 인코딩합니다 (EXIF 등 메타데이터는 포함하지 않음).
+
+    icc_profile을 넘기면 색 공간 정보만 유지합니다 (넓은 색역 이미지의 색 틀어짐 방지).
+    """
+    pil_format, _ = FORMATS[fmt]
+    extra = {"icc_profile": icc_profile} if icc_profile else {}
+    buf = io.BytesIO()
+    if pil_format == "PNG":
+        img.save(buf, pil_format, optimize=True, **extra)
+    elif pil_format == "WEBP":
+        img.save(buf, pil_format, quality=quality, method=4, **extra)
+    else:
+        img.save(buf, pil_format, quality=quality, optimize=True, progressive=True, **extra)
+    return buf.getvalue()
+
+
+def generate_variants(content: bytes, sizes: list[int], fmt: str = "webp", quality: int = 80) -> dict[int, bytes]:
+    """
+    원본 이미지로부터 크기별 변형 이미지를 생성합니다.
+
+    긴 변이 size 이하가 되도록 비율을 유지해 축소하며, 원본보다 큰 크기는 만들지 않습니다.
+    애니메이션 이미지는 첫 프레임만 사용합니다.
+
+    Args:
+        content: 원본 이미지 바이트
+        sizes: 생성할 크기 목록 (긴 변 기준 픽셀)
+        fmt: 출력 포맷 ('webp' | 'jpeg' | 'png')
+        quality: 손실 압축 품질 (1~100)
+
+    Returns:
+        dict[int, bytes]: {크기: 인코딩된 이미지 바이트}
+    """
+    with Image.open(io.BytesIO(content)) as src:
+        largest = max(sizes, default=0)
+        # JPEG는 디코딩 단계에서 축소(draft)하여 큰 원본의 디코딩 비용을 줄임
+        src.draft("RGB", (largest, largest))
+        base = _to_rgb(src, fmt)
+        base.load()
+
+    variants: dict[int, bytes] = {}
+    # 큰 크기부터 만들고, 그 결과를 다시 축소하여 리샘플링 비용을 줄임
+    current = base
+    for size in sorted(set(sizes), reverse=True):
+        if max(base.size) <= size:
+            continue
+        current = current.copy()
+        current.thumbnail((size, size), Image.Resampling.LANCZOS)
+        variants[size] = encode_image(current, fmt, quality)
+
+    return variants
+
+
+def _palette(img: Image.Image) -> list[str]:
+    """
+    작은 썸네일을 PALETTE_COLORS색으로 양자화하여 팔레트를 '#rrggbb' 목록으로 반환합니다.
+
+    면적이 넓은 색부터 정렬하며, PALETTE_MIN_RATIO 미만인 색은 제외합니다.
+    첫 번째 색이 대표 색상입니다 (단순 평균색은 서로 다른 색이 섞여 탁해지므로 사용하지 않음).
+    """
+    small = img.convert("RGB")
+    small.thumbnail((64, 64))
+    quantized = small.quantize(colors=PALETTE_COLORS)
+    palette = quantized.getpalette() or []
+    counts = sorted(quantized.getcolors() or [], reverse=True)
+    total = sum(count for count, _ in counts) or 1
+
+    colors: list[str] = []
+    for count, index in counts:
+        if colors and count / total < PALETTE_MIN_RATIO:
+            break
+        r, g, b = palette[index * 3:index * 3 + 3] or (0, 0, 0)
+        hex_color = f"#{r:02x}{g:02x}{b:02x}"
+        if hex_color not in colors:
+            colors.append(hex_color)
+    return colors or ["#000000"]
+
+
+def color_bucket(hex_color: str) -> int:
+    """
+    '#rrggbb' 색을 채널별 COLOR_BUCKET_LEVELS 단계로 양자화한 버킷 번호로 변환합니다.
+
+    색상 검색은 이 버킷 번호의 일치 여부로 판단하므로 인덱스 조회만으로 처리됩니다.
+    """
+    value = int(hex_color.lstrip("#"), 16)
+    step = 256 // COLOR_BUCKET_LEVELS
+    r, g, b = (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+    return ((r // step) * COLOR_BUCKET_LEVELS + g // step) * COLOR_BUCKET_LEVELS + b // step
+
+
+def _placeholder(img: Image.Image) -> str:
+    """
+    아주 작은 WebP 썸네일을 base64 data URI로 만듭니다 (보통 200바이트 내외).
+
+    클라이언트는 추가 요청 없이 이 값을 <img src>나 배경으로 바로 그린 뒤,
+    CSS blur를 적용해 원본이 로딩될 때까지 보여줄 수 있습니다.
+    """
+    small = _to_rgb(img, "webp").copy()
+    small.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    data = encode_image(small, "webp", PLACEHOLDER_QUALITY)
+    return "data:image/webp;base64," + base64.b64encode(data).decode("ascii")
+
+
+def _dhash(img: Image.Image) -> int:
+    """
+    64비트 dHash(차이 해시)를 계산합니다.
+
+    9x8 흑백으로 줄인 뒤 가로로 이웃한 픽셀의 밝기 비교 결과를 비트로 만듭니다.
+    재인코딩/리사이즈/약한 보정에는 거의 변하지 않아 해밍 거리로 유사 이미지를 찾을 수 있습니다.
+    DB(BIGINT)에 저장할 수 있도록 부호 있는 64비트 정수로 반환합니다.
+    """
+    gray = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS)
+    pixels = list(gray.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def extract_palette(content: bytes) -> list[str]:
+    """이미지 바이트로부터 팔레트를 추출합니다 (색상 인덱스 백필용)."""
+    with Image.open(io.BytesIO(content)) as src:
+        src.draft("RGB", (64, 64))
+        thumb = _to_rgb(src, "webp")
+        thumb.load()
+    return _palette(thumb)
+
+
+def make_placeholder(content: bytes) -> str:
+    """이미지 바이트로부터 플레이스홀더 data URI를 생성합니다 (일괄 생성 스크립트용)."""
+    with Image.open(io.BytesIO(content)) as src:
+        src.draft("RGB", (PLACEHOLDER_SIZE * 4, PLACEHOLDER_SIZE * 4))
+        return _placeholder(src)
+
+
+def analyze_image(content: bytes) -> dict:
+    """
+    업로드 이미지의 메타데이터를 추출합니다.
+
+    너비/높이/포맷은 전체 디코딩 없이 헤더만 읽어서 얻고,
+    대표 색상과 플레이스홀더는 축소 디코딩(JPEG draft)한 썸네일 하나로 계산합니다.
+
+    Args:
+        content: 이미지 바이트
+
+    Returns:
+        dict: width, height, file_size, mime_type, dominant_color, palette, placeholder, phash
+    """
+    with Image.open(io.BytesIO(content)) as src:
+        # Image.open은 헤더만 읽으므로 여기까지는 픽셀 디코딩이 일어나지 않습니다
+        metadata = {
+            "width": src.width,
+            "height": src.height,
+            "file_size": len(content),
+            "mime_type": Image.MIME.get(src.format or "", "application/octet-stream"),
+        }
+        src.draft("RGB", (64, 64))
+        thumb = _to_rgb(src, "webp")
+        thumb.load()
+        thumb.thumbnail((64, 64))
+
+    palette = _palette(thumb)
+    metadata["dominant_color"] = palette[0]
+    metadata["palette"] = palette
+    metadata["placeholder"] = _placeholder(thumb)
+    metadata["phash"] = _dhash(thumb)
+    return metadata
+
+
+def transcode_image(content: bytes, fmt: str = "webp", quality: int = 80) -> Optional[tuple[bytes, str]]:
+    """
+    업로드 원본을 최적화된 포맷으로 다시 인코딩합니다.
+
+    - EXIF/XMP 메타데이터(촬영 위치 등)를 제거합니다. EXIF 회전 정보는 픽셀에 먼저 반영합니다.
+    - 정지 이미지는 fmt('webp' | 'jpeg')로, 애니메이션 GIF 등은 애니메이션 WebP로 변환합니다.
+    - 변환 결과가 원본보다 크고 제거할 메타데이터도 없으면 None을 반환합니다 (원본 유지).
+
+    Args:
+        content: 원본 이미지 바이트
+        fmt: 정지 이미지 출력 포맷
+        quality: 손실 압축 품질 (1~100)
+
+    Returns:
+        Optional[tuple[bytes, str]]: (변환된 바이트, 확장자) 또는 None
+    """
+    with Image.open(io.BytesIO(content)) as src:
+        has_metadata = any(key in src.info for key in ("exif", "xmp", "XML:com.adobe.xmp"))
+        icc_profile = src.info.get("icc_profile")
+
+        if getattr(src, "n_frames", 1) > 1:
+            # 애니메이션: 모든 프레임을 애니메이션 WebP로 저장 (프레임별 간격/반복 유지)
+            durations = [frame.info.get("duration", 100) for frame in ImageSequence.Iterator(src)]
+            src.seek(0)
+            buf = io.BytesIO()
+            src.save(
+                buf,
+                "WEBP",
+                save_all=True,
+                quality=quality,
+                method=4,
+                loop=src.info.get("loop", 0),
+                duration=durations,
+            )
+            data, ext = buf.getvalue(), "webp"
+        else:
+            img = _to_rgb(ImageOps.exif_transpose(src), fmt)
+            data, ext = encode_image(img, fmt, quality, icc_profile), fmt
+
+    if len(data) >= len(content) and not has_metadata:
+        return None
+    return data, ext
+
+
+def resize_to_width(content: bytes, width: int, fmt: str = "webp", quality: int = 80) -> bytes:
+    """
+    이미지를 지정한 너비로 비율을 유지해 축소한 뒤 인코딩합니다.
+
+    원본보다 넓게 확대하지는 않습니다 (원본 너비 그대로 재인코딩).
+
+    Args:
+        content: 원본 이미지 바이트
+        width: 목표 너비 (픽셀)
+        fmt: 출력 포맷 ('webp' | 'jpeg' | 'png')
+        quality: 손실 압축 품질 (1~100)
+
+    Returns:
+        bytes: 인코딩된 이미지 바이트
+    """
+    with Image.open(io.BytesIO(content)) as src:
+        if src.width > width:
+            src.draft("RGB", (width, max(1, src.height * width // src.width)))
+        img = _to_rgb(src, fmt)
+        img.load()
+
+    if img.width > width:
+        height = max(1, round(img.height * width / img.width))
+        img = img.resize((width, height), Image.Resampling.LANCZOS)
+
+    return encode_image(img, fmt, quality)
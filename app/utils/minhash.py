@@ -0,0 +1,143 @@
+"""
+MinHash 서명과 LSH(Locality Sensitive Hashing) 버킷 인덱스
+
+프롬프트의 단어/단어쌍 집합을 MinHash 서명으로 요약하고,
+서명을 밴드로 나눠 같은 밴드 값을 가진 항목끼리만 후보로 비교합니다.
+
+- NUM_PERM=64, BANDS=16 x ROWS=4 기준으로 Jaccard 유사도 약 0.5 이상인 쌍이 높은 확률로 후보가 됩니다.
+- 해시는 프로세스/재시작과 무관하게 같은 값이 나오도록 blake2b를 사용합니다 (Python hash()는 실행마다 달라짐).
+"""
+
+import random
+import re
+from array import array
+from hashlib import blake2b
+from typing import Iterable, Optional
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+_PRIME = (1 << 61) - 1
+_MASK_32 = (1 << 32) - 1
+_rng = random.Random(20240601)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def shingles(text: str) -> set[str]:
+    """프롬프트를 소문자 단어와 인접 단어쌍의 집합으로 나눕니다."""
+    words = re.findall(r"\w+", text.lower())
+    result = set(words)
+    result.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return result
+
+
+def signature(text: str) -> Optional[tuple[int, ...]]:
+    """텍스트의 MinHash 서명(NUM_PERM개의 32비트 값)을 계산합니다. 단어가 없으면 None."""
+    hashes = [_hash64(shingle) for shingle in shingles(text)]
+    if not hashes:
+        return None
+    return tuple(
+        min((a * h + b) % _PRIME for h in hashes) & _MASK_32
+        for a, b in _PERMUTATIONS
+    )
+
+
+def signature_to_bytes(sig: tuple[int, ...]) -> bytes:
+    """DB 저장용으로 서명을 바이트로 변환합니다 (NUM_PERM x 4바이트)."""
+    return array("I", sig).tobytes()
+
+
+def signature_from_bytes(data: bytes) -> tuple[int, ...]:
+    """DB에 저장된 바이트를 서명으로 되돌립니다."""
+    values = array("I")
+    values.frombytes(data)
+    return tuple(values)
+
+
+def band_keys(sig: tuple[int, ...]) -> list[int]:
+    """서명을 BANDS개의 밴드로 나눠 밴드별 버킷 키(부호 있는 64비트)를 반환합니다."""
+    keys = []
+    for band in range(BANDS):
+        chunk = array("I", sig[band * ROWS:(band + 1) * ROWS]).tobytes()
+        digest = blake2b(chunk, digest_size=8, person=band.to_bytes(2, "little")).digest()
+        keys.append(int.from_bytes(digest, "little", signed=True))
+    return keys
+
+
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """두 서명의 일치 비율 (Jaccard 유사도의 추정치)."""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+
+class MinHashLSHIndex:
+    """밴드별 버킷으로 유사 후보를 찾는 메모리 인덱스"""
+
+    def __init__(self):
+        self._buckets: dict[tuple[int, int], set[int]] = {}
+        self._signatures: dict[int, tuple[int, ...]] = {}
+        self._keys: dict[int, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._signatures
+
+    def get(self, item_id: int) -> Optional[tuple[int, ...]]:
+        return self._signatures.get(item_id)
+
+    def add(self, item_id: int, sig: tuple[int, ...], keys: Optional[list[int]] = None) -> None:
+        """항목을 추가합니다 (이미 있으면 교체). keys를 주면 밴드 키 계산을 생략합니다."""
+        if item_id in self._signatures:
+            self.remove(item_id)
+        keys = keys if keys is not None else band_keys(sig)
+        self._signatures[item_id] = sig
+        self._keys[item_id] = keys
+        for band, key in enumerate(keys):
+            self._buckets.setdefault((band, key), set()).add(item_id)
+
+    def remove(self, item_id: int) -> None:
+        """항목을 제거합니다 (없으면 무시)."""
+        self._signatures.pop(item_id, None)
+        for band, key in enumerate(self._keys.pop(item_id, [])):
+            bucket = self._buckets.get((band, key))
+            if bucket is None:
+                continue
+            bucket.discard(item_id)
+            if not bucket:
+                del self._buckets[(band, key)]
+
+    def candidates(self, sig: tuple[int, ...]) -> set[int]:
+        """어느 한 밴드라도 같은 버킷에 들어간 항목 ID를 모읍니다."""
+        found: set[int] = set()
+        for band, key in enumerate(band_keys(sig)):
+            found |= self._buckets.get((band, key), set())
+        return found
+
+    def query(
+        self,
+        sig: tuple[int, ...],
+        limit: int = 10,
+        exclude: Iterable[int] = (),
+        min_similarity: float = 0.0,
+    ) -> list[tuple[int, float]]:
+        """
+        후보만 서명 비교하여 유사도 상위 항목을 반환합니다.
+
+        Returns:
+            list[tuple[int, float]]: (id, 추정 유사도) 목록, 유사도 내림차순
+        """
+        excluded = set(exclude)
+        scored = [
+            (item_id, similarity(sig, self._signatures[item_id]))
+            for item_id in self.candidates(sig)
+            if item_id not in excluded
+        ]
+        scored = [pair for pair in scored if pair[1] >= min_similarity]
+        scored.sort(key=lambda pair: (-pair[1], -pair[0]))
+        return scored[:limit]
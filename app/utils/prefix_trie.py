@@ -0,0 +1,115 @@
+"""
+빈도 기반 접두사 트라이 (자동완성용)
+
+노드마다 그 접두사로 시작하는 항목 중 빈도 상위 top_k개를 미리 들고 있어,
+조회는 접두사 길이만큼 노드를 따라간 뒤 목록을 복사하는 것으로 끝납니다 (항목 수와 무관).
+
+- 키는 소문자로 정규화해 대소문자 구분 없이 찾고, 표시 문자열은 처음 추가된 형태를 유지합니다.
+- 빈도는 증가만 반영합니다. 감소(삭제)는 주기적인 전체 재구성으로 반영합니다.
+- max_nodes를 넘으면 새 노드를 만들지 않습니다. 그 뒤에 추가된 항목은 이미 있는 노드(짧은 접두사)까지만
+  후보로 올라가므로, 빈도가 높은 항목부터 추가하면(from_counts) 메모리 상한 안에서 중요한 항목이 남습니다.
+"""
+
+from typing import Iterable, Optional
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        # (빈도, 키) 목록, 빈도 내림차순
+        self.top: list[tuple[int, str]] = []
+
+
+class PrefixTrie:
+    """접두사별 상위 top_k 항목을 유지하는 트라이"""
+
+    def __init__(self, top_k: int = 10, max_key_length: int = 64, max_nodes: Optional[int] = None):
+        self.top_k = top_k
+        self.max_key_length = max_key_length
+        self.max_nodes = max_nodes
+        self._root = _Node()
+        self._nodes = 1
+        self._counts: dict[str, int] = {}
+        self._display: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @property
+    def node_count(self) -> int:
+        """트라이 노드 수 (루트 포함)"""
+        return self._nodes
+
+    @classmethod
+    def from_counts(cls, items: Iterable[tuple[str, int]], **kwargs) -> "PrefixTrie":
+        """
+        (문자열, 빈도) 목록으로 트라이를 만듭니다.
+
+        빈도 내림차순으로 넣어야 상위 목록 갱신이 대부분 바로 끝나고,
+        max_nodes에 걸렸을 때 빈도가 높은 항목이 남습니다.
+        """
+        trie = cls(**kwargs)
+        for text, count in items:
+            trie.add(text, count)
+        return trie
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """검색 키로 쓰도록 공백을 정리하고 소문자로 바꿉니다."""
+        return " ".join(text.split()).lower()
+
+    def add(self, text: str, count: int = 1) -> None:
+        """항목의 빈도를 count만큼 늘립니다 (없으면 추가)."""
+        key = self.normalize(text)[:self.max_key_length]
+        if not key or count <= 0:
+            return
+
+        total = self._counts.get(key, 0) + count
+        self._counts[key] = total
+        self._display.setdefault(key, " ".join(text.split())[:self.max_key_length])
+
+        node = self._root
+        self._update_top(node, key, total)
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                if self.max_nodes is not None and self._nodes >= self.max_nodes:
+                    break
+                child = node.children[char] = _Node()
+                self._nodes += 1
+            node = child
+            self._update_top(node, key, total)
+
+    def _update_top(self, node: _Node, key: str, total: int) -> None:
+        """노드의 상위 목록에 key의 새 빈도를 반영합니다."""
+        top = node.top
+        for i, (_, existing) in enumerate(top):
+            if existing == key:
+                del top[i]
+                break
+        else:
+            if len(top) >= self.top_k and total <= top[-1][0]:
+                return
+
+        # 빈도 내림차순, 같은 빈도는 키 오름차순
+        position = 0
+        while position < len(top) and (top[position][0] > total or (top[position][0] == total and top[position][1] < key)):
+            position += 1
+        top.insert(position, (total, key))
+        del top[self.top_k:]
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> list[tuple[str, int]]:
+        """
+        접두사로 시작하는 항목을 빈도 순으로 반환합니다.
+
+        Returns:
+            list[tuple[str, int]]: (표시 문자열, 빈도) 목록
+        """
+        node = self._root
+        for char in self.normalize(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [(self._display[key], count) for count, key in node.top[:limit or self.top_k]]
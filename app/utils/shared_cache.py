@@ -0,0 +1,222 @@
+"""
+워커 간 공유 캐시 (mmap 파일)
+
+같은 호스트의 uvicorn 워커들이 하나의 캐시를 함께 읽습니다. 항목마다 파일 하나를
+tmpfs(/dev/shm)에 두고 mmap으로 읽으므로, 페이지 캐시를 공유해 메모리를 한 번만 쓰고
+읽을 때 복사하지 않습니다 (memoryview 반환).
+
+- 항목 파일: 헤더(매직, 만료 시각, 길이) + 페이로드(직렬화된 JSON, int64 ID 배열 등)
+- 쓰기: 임시 파일에 쓴 뒤 os.replace로 교체하므로 읽는 쪽은 항상 완전한 항목만 봅니다.
+  이미 mmap한 이전 파일은 교체된 뒤에도 유효합니다.
+- 갱신: 만료된 항목은 flock을 잡은 워커 하나만 다시 만들고, 나머지 워커는 그동안
+  만료된 값을 그대로 돌려줍니다 (값이 아예 없으면 갱신이 끝날 때까지 기다림).
+- 무효화: 네임스페이스의 항목 파일을 지우고 세대 파일을 바꿔, 무효화 전에 시작된
+  갱신 결과가 다시 기록되지 않게 합니다.
+- 용량: 항목 수에 제한이 없으므로 키 종류가 적은 항목만 넣어야 합니다 (tmpfs는 기본 64MB).
+  기록에 실패하면(ENOSPC 등) 공유하지 않고 방금 만든 값을 그대로 반환합니다.
+- fcntl이 없는 환경(Windows)에서는 사용할 수 없습니다 (enabled=False).
+"""
+
+import asyncio
+import hashlib
+import mmap
+import os
+import struct
+import time
+import uuid
+from typing import Awaitable, Callable, Hashable, Optional, Union
+
+from app.core.metrics import metrics
+from app.utils.singleflight import SingleFlight
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# 매직(4바이트), 만료 시각(epoch 초, double), 페이로드 길이(uint32) → 16바이트 (ID 배열 정렬 유지)
+_HEADER = struct.Struct("<4sdI")
+_MAGIC = b"AIC1"
+_SUFFIX = ".bin"
+
+Buffer = Union[bytes, memoryview]
+
+
+class SharedCache:
+    """mmap 파일 기반 워커 간 공유 캐시"""
+
+    def __init__(self, directory: str, enabled: bool = True):
+        self.directory = directory
+        self.enabled = enabled and fcntl is not None
+        # 경로 → ((inode, mtime_ns), mmap) : 파일이 교체되면 다시 매핑
+        self._maps: dict[str, tuple[tuple[int, int], mmap.mmap]] = {}
+        self._flight = SingleFlight("shared_cache")
+        if self.enabled:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, namespace: str, key: Hashable) -> str:
+        digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=12).hexdigest()
+        return os.path.join(self.directory, f"{namespace}--{digest}{_SUFFIX}")
+
+    def _generation(self, namespace: str) -> bytes:
+        try:
+            with open(os.path.join(self.directory, f"{namespace}.gen"), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return b""
+
+    def read(self, namespace: str, key: Hashable) -> Optional[tuple[float, memoryview]]:
+        """
+        항목을 읽습니다 (만료 여부와 관계없이).
+
+        Returns:
+            Optional[tuple[float, memoryview]]: (만료 시각, 페이로드 뷰) 또는 None
+        """
+        path = self._path(namespace, key)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._maps.pop(path, None)
+            return None
+
+        cached = self._maps.get(path)
+        if cached is None or cached[0] != (st.st_ino, st.st_mtime_ns):
+            try:
+                with open(path, "rb") as f:
+                    opened = os.fstat(f.fileno())
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (FileNotFoundError, ValueError):
+                return None
+            # 이전 mmap은 닫지 않음 (응답 중인 memoryview가 남아 있을 수 있어 GC에 맡김)
+            cached = ((opened.st_ino, opened.st_mtime_ns), mapped)
+            self._maps[path] = cached
+
+        mapped = cached[1]
+        if len(mapped) < _HEADER.size:
+            return None
+        magic, expires_at, length = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC or len(mapped) < _HEADER.size + length:
+            return None
+        return expires_at, memoryview(mapped)[_HEADER.size:_HEADER.size + length]
+
+    def write(self, namespace: str, key: Hashable, payload: bytes, ttl_seconds: float) -> None:
+        """
+        항목을 원자적으로 기록합니다 (임시 파일 → os.replace).
+
+        Raises:
+            OSError: 기록 실패 (공간 부족 등). 임시 파일은 지우고 다시 발생시킵니다.
+        """
+        path = self._path(namespace, key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, time.time() + ttl_seconds, len(payload)))
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def invalidate(self, *namespaces: str) -> None:
+        """네임스페이스의 항목을 모든 워커에서 지웁니다."""
+        if not self.enabled:
+            return
+
+        for namespace in namespaces:
+            # 세대 파일을 먼저 바꿔, 진행 중인 갱신이 지운 뒤에 다시 쓰지 않도록 함
+            gen_path = os.path.join(self.directory, f"{namespace}.gen")
+            tmp_path = f"{gen_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(uuid.uuid4().bytes)
+                os.replace(tmp_path, gen_path)
+            except OSError as e:
+                # 세대를 못 바꿔도 항목 파일은 지워 오래된 값이 남지 않게 함
+                print(f"⚠️  공유 캐시 세대 갱신 실패 ({namespace}): {e}")
+
+            prefix = f"{namespace}--"
+            for name in os.listdir(self.directory):
+                if name.startswith(prefix) and name.endswith(_SUFFIX):
+                    try:
+                        os.unlink(os.path.join(self.directory, name))
+                    except FileNotFoundError:
+                        pass
+            metrics.inc(f"shared_cache.{namespace}.invalidations")
+
+    async def get_or_refresh(
+        self,
+        namespace: str,
+        key: Hashable,
+        ttl_seconds: float,
+        loader: Callable[[], Awaitable[bytes]]
+    ) -> Buffer:
+        """
+        유효한 항목을 반환하고, 없거나 만료되었으면 갱신합니다.
+
+        Args:
+            namespace: 네임스페이스 (무효화 단위)
+            key: 네임스페이스 안의 키
+            ttl_seconds: 새 항목의 유효 시간(초)
+            loader: 페이로드 바이트를 만드는 비동기 함수
+
+        Returns:
+            Buffer: 페이로드 (공유 파일의 memoryview 또는 방금 만든 bytes)
+        """
+        entry = self.read(namespace, key)
+        if entry is not None and entry[0] > time.time():
+            metrics.inc(f"shared_cache.{namespace}.hits")
+            return entry[1]
+
+        metrics.inc(f"shared_cache.{namespace}.misses")
+        generation = self._generation(namespace)
+        return await self._flight.do(
+            (namespace, key, generation),
+            lambda: self._refresh(namespace, key, ttl_seconds, loader, generation)
+        )
+
+    async def _refresh(
+        self,
+        namespace: str,
+        key: Hashable,
+        ttl_seconds: float,
+        loader: Callable[[], Awaitable[bytes]],
+        generation: bytes
+    ) -> Buffer:
+        """flock으로 워커 하나만 갱신하고, 나머지는 만료된 값을 주거나 갱신을 기다립니다."""
+        try:
+            fd = os.open(f"{self._path(namespace, key)}.lock", os.O_CREAT | os.O_RDWR, 0o644)
+        except OSError as e:
+            # 락 파일을 만들 수 없으면 공유하지 않고 이 워커에서만 만들어 반환
+            print(f"⚠️  공유 캐시 락 생성 실패 ({namespace}): {e}")
+            return await loader()
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # 다른 워커가 갱신 중: 만료된 값이라도 있으면 바로 반환
+                stale = self.read(namespace, key)
+                if stale is not None:
+                    metrics.inc(f"shared_cache.{namespace}.stale")
+                    return stale[1]
+                await asyncio.to_thread(fcntl.flock, fd, fcntl.LOCK_EX)
+
+            # 락을 기다리는 동안 다른 워커가 갱신했을 수 있음
+            entry = self.read(namespace, key)
+            if entry is not None and entry[0] > time.time():
+                return entry[1]
+
+            payload = await loader()
+            if self._generation(namespace) == generation:
+                try:
+                    self.write(namespace, key, payload, ttl_seconds)
+                except OSError as e:
+                    # 공간 부족 등으로 공유하지 못해도 요청에는 방금 만든 값을 응답
+                    metrics.inc(f"shared_cache.{namespace}.write_errors")
+                    print(f"⚠️  공유 캐시 기록 실패 ({namespace}): {e}")
+            metrics.inc(f"shared_cache.{namespace}.refreshes")
+            return payload
+        finally:
+            os.close(fd)  # flock 해제
@@ -0,0 +1,54 @@
+"""
+요청 합치기 (singleflight)
+
+같은 키로 동시에 들어온 비동기 호출을 하나로 합칩니다.
+먼저 들어온 호출이 작업을 시작하고, 끝나기 전에 들어온 같은 키의 호출은
+새로 실행하지 않고 그 결과(또는 예외)를 함께 받습니다. 작업이 끝나면 키는 비워지므로
+결과를 보관하는 캐시가 아니라, 캐시 만료 직후 같은 쿼리가 한꺼번에 몰리는 것을 막는 용도입니다.
+
+- 워커 프로세스(이벤트 루프) 안에서만 합쳐집니다.
+- 작업은 Task로 실행되어, 기다리던 요청 하나가 취소되어도 나머지 요청의 작업은 계속됩니다.
+- 작업은 처음 호출한 요청보다 오래 실행될 수 있으므로 요청 범위의 DB 세션을 쓰면 안 됩니다.
+  DB를 조회하는 작업은 run_in_session으로 자체 세션을 여세요.
+- 결과 객체는 모든 호출자가 공유하므로 호출자는 결과를 수정하지 않아야 합니다.
+- 쓰기 이후의 호출이 쓰기 전에 시작된 작업에 합쳐지지 않도록, 데이터 버전(캐시 세대 등)을
+  키에 포함하세요.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from app.core.metrics import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """키별로 진행 중인 작업을 공유하는 헬퍼"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        key로 진행 중인 작업이 있으면 그 결과를 기다리고, 없으면 fn()을 실행합니다.
+
+        Args:
+            key: 합칠 호출을 구분하는 키 (메서드 인자 튜플 등)
+            fn: 실제 작업을 만드는 함수 (진행 중인 작업이 없을 때만 호출)
+
+        Returns:
+            T: 작업 결과
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            metrics.inc(f"singleflight.{self.name}.calls")
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            metrics.inc(f"singleflight.{self.name}.shared")
+
+        # 한 요청이 취소되어도 다른 요청이 기다리는 작업은 계속 진행
+        return await asyncio.shield(task)
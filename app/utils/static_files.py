@@ -0,0 +1,235 @@
+"""
+업로드 파일 정적 서빙 헬퍼
+
+로컬 저장소의 샤딩 레이아웃('images/ab/cd/<파일명>')과
+기존 평면 레이아웃('images/<파일명>')을 모두 서빙합니다.
+
+업로드 파일은 UUID/해시 이름이라 한 번 저장되면 내용이 바뀌지 않으므로,
+UploadStaticFiles는 다음과 같이 서빙합니다.
+- `Cache-Control: public, max-age=<1년>, immutable`과 inode/mtime/크기 기반 강한 ETag
+- If-None-Match / If-Modified-Since → 304, 단일 Range → 206 (If-Range 확인, 다중 Range는 전체 응답)
+- 자주 요청되는 파일은 열린 fd와 stat을 LRU로 보관해 요청마다 경로 확인/stat/open을 반복하지 않음
+  (TTL이 지나면 다시 확인하므로 삭제된 파일도 최대 TTL 동안만 서빙됨)
+- 복사 없는 전송: accel_redirect_prefix가 있으면 nginx에 X-Accel-Redirect로 넘겨 sendfile로 보내고,
+  서버가 ASGI pathsend 확장을 지원하면 경로만 넘깁니다. 둘 다 아니면 pread로 나눠 읽어 보냅니다.
+"""
+
+import os
+import stat
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from mimetypes import guess_type
+from typing import Optional
+
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Receive, Scope, Send
+
+from app.core.metrics import metrics
+from app.utils.file_handler import shard_relpath
+
+# 한 번에 읽어 보내는 크기 (대부분의 이미지/변형은 한 번에 전송)
+_CHUNK_SIZE = 256 * 1024
+
+
+class ShardedStaticFiles(StaticFiles):
+    """
+    평면 경로 요청을 샤딩 경로로 폴백하는 StaticFiles
+
+    마이그레이션 도중에는 파일이 샤드 디렉토리로 이동했지만
+    DB의 image_url은 아직 평면 경로일 수 있습니다.
+    이 경우 요청 경로에서 파일명을 꺼내 샤드 위치를 한 번 더 찾습니다.
+    """
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None:
+            return full_path, stat_result
+
+        # 'images/<파일명>' 형태일 때만 샤드 위치를 확인 (이미 샤드 경로면 폴백 없음)
+        parent, filename = os.path.split(path)
+        if not filename or os.path.dirname(parent):
+            return full_path, stat_result
+
+        sharded = os.path.join(parent, *shard_relpath(filename).split("/"))
+        return super().lookup_path(sharded)
+
+
+class _OpenFile:
+    """열어 둔 업로드 파일 (fd, stat, 응답 헤더)"""
+
+    __slots__ = ("file", "size", "relpath", "headers", "expires_at")
+
+    def __init__(self, file, st: os.stat_result, relpath: str, cache_control: str, expires_at: float):
+        # 캐시에서 밀려나도 전송 중인 응답이 참조하는 동안은 닫히지 않음 (마지막 참조가 사라질 때 닫힘)
+        self.file = file
+        self.size = st.st_size
+        self.relpath = relpath
+        self.headers = Headers(headers={
+            "content-type": guess_type(relpath)[0] or "application/octet-stream",
+            "etag": f'"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"',
+            "last-modified": formatdate(st.st_mtime, usegmt=True),
+            "cache-control": cache_control,
+            "accept-ranges": "bytes",
+        })
+        self.expires_at = expires_at
+
+
+class UploadStaticFiles(ShardedStaticFiles):
+    """
+    업로드 디렉토리 전용 StaticFiles (불변 캐시 헤더, Range, fd/stat 캐시)
+
+    GET/HEAD 외의 요청, 없는 파일, 디렉토리는 StaticFiles의 기본 처리(404/405)를 따릅니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str,
+        max_age: int = 31536000,
+        cache_size: int = 256,
+        cache_ttl_seconds: float = 60.0,
+        accel_redirect_prefix: str = "",
+        **kwargs
+    ):
+        super().__init__(directory=directory, **kwargs)
+        self.cache_control = f"public, max-age={max_age}, immutable"
+        self.cache_size = cache_size
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.accel_redirect_prefix = accel_redirect_prefix.rstrip("/")
+        self._root = os.path.realpath(directory)
+        self._files: OrderedDict[str, _OpenFile] = OrderedDict()
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        entry = self._files.get(path)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._files.move_to_end(path)
+            metrics.inc("uploads.file_cache.hits")
+        else:
+            metrics.inc("uploads.file_cache.misses")
+            entry = await anyio.to_thread.run_sync(self._open, path)
+            if entry is None:
+                self._files.pop(path, None)
+                # 없는 파일/디렉토리/잘못된 경로는 기본 처리로 (404 등)
+                return await super().get_response(path, scope)
+            self._files[path] = entry
+            self._files.move_to_end(path)
+            while len(self._files) > self.cache_size:
+                self._files.popitem(last=False)
+
+        if self.is_not_modified(entry.headers, Headers(scope=scope)):
+            return NotModifiedResponse(entry.headers)
+        return _UploadFileResponse(entry, self.accel_redirect_prefix)
+
+    def _open(self, path: str) -> Optional[_OpenFile]:
+        try:
+            full_path, st = self.lookup_path(path)
+            if st is None or not stat.S_ISREG(st.st_mode):
+                return None
+            file = open(full_path, "rb", buffering=0)
+        except (OSError, ValueError):
+            return None
+
+        # 경로 확인 후 파일이 교체되었을 수 있으므로 실제로 연 파일의 stat 사용
+        st = os.fstat(file.fileno())
+        relpath = os.path.relpath(os.path.realpath(full_path), self._root).replace(os.sep, "/")
+        return _OpenFile(file, st, relpath, self.cache_control, time.monotonic() + self.cache_ttl_seconds)
+
+
+class _UploadFileResponse(Response):
+    """캐시된 fd로 업로드 파일을 보내는 응답 (전체 또는 단일 Range)"""
+
+    def __init__(self, entry: _OpenFile, accel_redirect_prefix: str):
+        self.entry = entry
+        self.accel_redirect_prefix = accel_redirect_prefix
+        self.background = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        entry = self.entry
+        headers = MutableHeaders(raw=list(entry.headers.raw))
+
+        if self.accel_redirect_prefix:
+            # nginx가 내부 location에서 Range/sendfile을 처리
+            headers["x-accel-redirect"] = f"{self.accel_redirect_prefix}/{entry.relpath}"
+            headers["content-length"] = "0"
+            await send({"type": "http.response.start", "status": 200, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        request_headers = Headers(scope=scope)
+        start, end = 0, entry.size
+        status_code = 200
+        byte_range = self._parse_range(request_headers, entry)
+        if byte_range == "unsatisfiable":
+            await Response(status_code=416, headers={"content-range": f"bytes */{entry.size}"})(scope, receive, send)
+            return
+        if byte_range is not None:
+            start, end = byte_range
+            status_code = 206
+            headers["content-range"] = f"bytes {start}-{end - 1}/{entry.size}"
+        headers["content-length"] = str(end - start)
+
+        await send({"type": "http.response.start", "status": status_code, "headers": headers.raw})
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if status_code == 200 and "http.response.pathsend" in scope.get("extensions", {}):
+            await send({"type": "http.response.pathsend", "path": entry.file.name})
+            return
+
+        fd = entry.file.fileno()
+        while True:
+            chunk = await anyio.to_thread.run_sync(os.pread, fd, min(_CHUNK_SIZE, end - start), start)
+            start += len(chunk)
+            more_body = bool(chunk) and start < end
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            if not more_body:
+                return
+
+    @staticmethod
+    def _parse_range(request_headers: Headers, entry: _OpenFile):
+        """
+        단일 bytes Range를 (start, end) 반열린 구간으로 해석합니다.
+
+        Returns:
+            (start, end) | None (전체 응답) | "unsatisfiable" (416)
+        """
+        http_range = request_headers.get("range")
+        if not http_range:
+            return None
+        if_range = request_headers.get("if-range")
+        if if_range is not None and if_range not in (entry.headers["etag"], entry.headers["last-modified"]):
+            return None
+
+        units, _, spec = http_range.partition("=")
+        if units.strip().lower() != "bytes" or "," in spec:
+            return None  # 다중 Range나 알 수 없는 단위는 전체 응답
+
+        first, sep, last = spec.strip().partition("-")
+        try:
+            if not sep:
+                return None
+            if not first:
+                # 'bytes=-N' : 마지막 N바이트
+                length = int(last)
+                if length <= 0:
+                    return "unsatisfiable"
+                return max(entry.size - length, 0), entry.size
+            start = int(first)
+            end = int(last) + 1 if last else entry.size
+        except ValueError:
+            return None
+
+        if start >= entry.size:
+            return "unsatisfiable"
+        if end <= start:
+            return None  # 'bytes=5-2' 같은 잘못된 Range는 무시
+        return start, min(end, entry.size)
@@ -0,0 +1,90 @@
+"""
+해밍 거리 인덱스 벤치마크
+
+무작위 64비트 해시 N개(기본 100만 개)를 HammingIndex에 넣고,
+허용 거리별 검색 지연(p50/p99)을 단순 선형 탐색과 비교합니다.
+
+실행:
+    python -m benchmarks.bench_hamming_index
+    python -m benchmarks.bench_hamming_index --size 200000 --queries 500
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.utils.hamming_index import HammingIndex
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _flip_bits(value: int, count: int, rng: random.Random) -> int:
+    """임의의 비트 count개를 뒤집어 '살짝 바뀐' 해시를 만듭니다."""
+    for bit in rng.sample(range(64), count):
+        value ^= 1 << bit
+    return value
+
+
+def _linear_scan(hashes: list[tuple[int, int]], value: int, max_distance: int) -> list[tuple[int, int]]:
+    return [
+        (item_id, distance)
+        for item_id, item_value in hashes
+        if (distance := (item_value ^ value).bit_count()) <= max_distance
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="해밍 거리 인덱스 벤치마크")
+    parser.add_argument("--size", type=int, default=1_000_000, help="인덱스에 넣을 해시 개수")
+    parser.add_argument("--queries", type=int, default=1000, help="거리별 검색 횟수")
+    parser.add_argument("--distances", type=int, nargs="+", default=[0, 4, 6, 8, 12], help="허용 해밍 거리 목록")
+    parser.add_argument("--linear-queries", type=int, default=20, help="선형 탐색 비교 횟수 (0이면 생략)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    hashes = [(i, rng.getrandbits(64)) for i in range(args.size)]
+
+    index = HammingIndex()
+    started = time.perf_counter()
+    index.add_many(hashes)
+    print(f"📦 {args.size:,}개 적재: {time.perf_counter() - started:.2f}초")
+
+    print(f"{'거리':>4} | {'p50(ms)':>9} | {'p99(ms)':>9} | {'평균 결과 수':>10}")
+    for max_distance in args.distances:
+        timings: list[float] = []
+        found: list[int] = []
+        for _ in range(args.queries):
+            # 절반은 기존 해시의 변형(적중), 절반은 완전히 새로운 해시(미적중)
+            if rng.random() < 0.5:
+                _, base = rng.choice(hashes)
+                query = _flip_bits(base, rng.randint(0, max_distance), rng)
+            else:
+                query = rng.getrandbits(64)
+
+            started = time.perf_counter()
+            results = index.search(query, max_distance)
+            timings.append((time.perf_counter() - started) * 1000)
+            found.append(len(results))
+
+        print(
+            f"{max_distance:>4} | {_percentile(timings, 0.5):>9.3f} | "
+            f"{_percentile(timings, 0.99):>9.3f} | {statistics.mean(found):>10.2f}"
+        )
+
+    if args.linear_queries:
+        timings = []
+        for _ in range(args.linear_queries):
+            query = rng.getrandbits(64)
+            started = time.perf_counter()
+            _linear_scan(hashes, query, max(args.distances))
+            timings.append((time.perf_counter() - started) * 1000)
+        print(f"선형 탐색 (거리 {max(args.distances)}): p50 {_percentile(timings, 0.5):.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+JSON 응답 직렬화 벤치마크
+
+긴 프롬프트가 담긴 100개 항목 목록/랭킹 응답을 세 가지 방식으로 직렬화해 비교합니다.
+- stdlib: jsonable_encoder + json.dumps (FastAPI JSONResponse 기본 렌더링, 이전 sparse 경로)
+- pydantic: TypeAdapter.dump_json (response_model이 있는 엔드포인트에서 FastAPI가 쓰는 경로)
+- orjson: app.core.responses.dumps (sparse fieldsets 등 dict 응답 경로)
+
+직렬화 결과가 stdlib와 같은 JSON인지도 함께 확인합니다 (datetime 형식 호환성).
+
+실행:
+    python -m benchmarks.bench_json_serialization
+    python -m benchmarks.bench_json_serialization --items 20 --repeat 2000
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.responses import dumps
+from app.schemas.image import ImageListResponse, ImageResponse
+from app.schemas.tournament import TournamentRankingItem, TournamentRankingResponse
+from benchmarks.bench_prompt_search import _prompt
+
+
+def _row(rng: random.Random, image_id: int) -> dict:
+    created = datetime(2026, 1, 1) + timedelta(seconds=rng.randint(0, 10_000_000), microseconds=rng.randint(0, 999_999))
+    return {
+        "id": image_id,
+        "user_id": rng.randint(1, 5000),
+        "image_url": f"/uploads/images/ab/cd/{image_id:032x}.png",
+        "original_url": None,
+        "prompt": ", ".join(_prompt(rng) for _ in range(6)),
+        "model_name": rng.choice(["sdxl", "midjourney-v6", "dall-e-3", "flux-dev"]),
+        "variant_urls": {str(w): f"/uploads/images/ab/cd/{image_id:032x}_{w}.webp" for w in (256, 512, 1024)},
+        "width": 1024,
+        "height": 1024,
+        "file_size": rng.randint(100_000, 4_000_000),
+        "mime_type": "image/png",
+        "dominant_color": "#e61414",
+        "palette": ["#e61414", "#0a14f0", "#fafafa"],
+        "placeholder": "data:image/webp;base64," + "A" * 180,
+        "phash": rng.getrandbits(63),
+        "is_tournament_opt_in": True,
+        "tournament_win_count": rng.randint(0, 300),
+        "is_active": True,
+        "created_at": created,
+        "updated_at": created,
+        "like_count": rng.randint(0, 500),
+    }
+
+
+def _per_call_ms(fn: Callable[[], Any], repeat: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON 응답 직렬화 벤치마크")
+    parser.add_argument("--items", type=int, default=100, help="응답 항목 수")
+    parser.add_argument("--repeat", type=int, default=500, help="방식별 반복 횟수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    rows = [_row(rng, i + 1) for i in range(args.items)]
+    items = [ImageResponse.model_construct(**row) for row in rows]
+
+    payloads = {
+        "ImageListResponse": (
+            ImageListResponse,
+            ImageListResponse(items=items, total=10_000, page=1, size=args.items, has_next=True),
+            {"items": rows, "total": 10_000, "page": 1, "size": args.items, "has_next": True},
+        ),
+        "TournamentRankingResponse": (
+            TournamentRankingResponse,
+            TournamentRankingResponse(
+                rankings=[TournamentRankingItem(rank=i + 1, image=item, win_count=item.tournament_win_count)
+                          for i, item in enumerate(items)],
+                total=len(items),
+            ),
+            {"rankings": [{"rank": i + 1, "image": row, "win_count": row["tournament_win_count"]}
+                          for i, row in enumerate(rows)], "total": len(rows)},
+        ),
+    }
+
+    print(f"{'응답':<26} | {'크기':>8} | {'stdlib':>9} | {'pydantic':>9} | {'orjson':>9} | 호환")
+    for name, (model, instance, plain) in payloads.items():
+        adapter = TypeAdapter(model)
+        stdlib = lambda: json.dumps(jsonable_encoder(instance), separators=(",", ":")).encode()
+        baseline = json.loads(stdlib())
+        compatible = json.loads(adapter.dump_json(instance)) == baseline == json.loads(dumps(plain))
+
+        stdlib_ms = _per_call_ms(stdlib, args.repeat)
+        pydantic_ms = _per_call_ms(lambda: adapter.dump_json(instance), args.repeat)
+        orjson_ms = _per_call_ms(lambda: dumps(plain), args.repeat)
+        print(
+            f"{name:<26} | {len(stdlib()) / 1024:>6.0f}KB | {stdlib_ms:>7.2f}ms | "
+            f"{pydantic_ms:>7.2f}ms | {orjson_ms:>7.2f}ms | {'✅' if compatible else '❌'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
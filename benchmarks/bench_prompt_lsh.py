@@ -0,0 +1,90 @@
+"""
+프롬프트 MinHash LSH 벤치마크
+
+합성 프롬프트 N개(기본 10만 개)로 MinHashLSHIndex를 만든 뒤,
+- 지연: LSH 후보 조회 vs 전체 서명 비교(브루트포스)의 p50/p99
+- 재현율: 실제 Jaccard 유사도 기준 상위 항목 중 LSH 결과에 포함된 비율
+을 측정합니다. DB 없이 메모리에서만 실행됩니다.
+
+실행:
+    python -m benchmarks.bench_prompt_lsh
+    python -m benchmarks.bench_prompt_lsh --size 20000 --queries 200
+"""
+
+import argparse
+import random
+import time
+
+from app.utils.minhash import MinHashLSHIndex, shingles, signature, similarity
+from benchmarks.bench_prompt_search import _percentile, _prompt
+
+
+def _jaccard(a: set[str], b: set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="프롬프트 MinHash LSH 벤치마크")
+    parser.add_argument("--size", type=int, default=100_000, help="인덱스에 넣을 프롬프트 수")
+    parser.add_argument("--queries", type=int, default=300, help="측정할 질의 수")
+    parser.add_argument("--brute-queries", type=int, default=30, help="브루트포스/재현율 측정 질의 수")
+    parser.add_argument("--top", type=int, default=10, help="상위 몇 개를 비교할지")
+    parser.add_argument("--threshold", type=float, default=0.5, help="재현율 계산에 포함할 최소 Jaccard 유사도")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    prompts = [_prompt(rng) for _ in range(args.size)]
+
+    index = MinHashLSHIndex()
+    started = time.perf_counter()
+    signatures = [signature(prompt) for prompt in prompts]
+    for item_id, sig in enumerate(signatures):
+        index.add(item_id, sig)
+    print(f"📦 {args.size:,}개 서명 생성/적재: {time.perf_counter() - started:.1f}초")
+
+    # 지연 (LSH)
+    timings, candidate_counts = [], []
+    for _ in range(args.queries):
+        item_id = rng.randrange(args.size)
+        started = time.perf_counter()
+        index.query(signatures[item_id], args.top, exclude=[item_id])
+        timings.append((time.perf_counter() - started) * 1000)
+        candidate_counts.append(len(index.candidates(signatures[item_id])))
+    print(
+        f"LSH 조회: p50 {_percentile(timings, 0.5):.2f}ms, p99 {_percentile(timings, 0.99):.2f}ms, "
+        f"평균 후보 {sum(candidate_counts) / len(candidate_counts):,.0f}개 / 전체 {args.size:,}개"
+    )
+
+    # 지연 (브루트포스) + 재현율
+    brute_timings = []
+    hits = total = 0
+    prompt_shingles = [shingles(prompt) for prompt in prompts]
+    for _ in range(args.brute_queries):
+        item_id = rng.randrange(args.size)
+        sig = signatures[item_id]
+
+        started = time.perf_counter()
+        sorted(
+            ((other, similarity(sig, other_sig)) for other, other_sig in enumerate(signatures) if other != item_id),
+            key=lambda pair: -pair[1],
+        )[:args.top]
+        brute_timings.append((time.perf_counter() - started) * 1000)
+
+        # 정답: 실제 Jaccard 유사도 상위 top (threshold 이상만)
+        exact = sorted(
+            ((other, _jaccard(prompt_shingles[item_id], prompt_shingles[other])) for other in range(args.size) if other != item_id),
+            key=lambda pair: -pair[1],
+        )[:args.top]
+        expected = {other for other, score in exact if score >= args.threshold}
+        found = {other for other, _ in index.query(sig, args.top * 3, exclude=[item_id])}
+        hits += len(expected & found)
+        total += len(expected)
+
+    print(f"브루트포스 조회: p50 {_percentile(brute_timings, 0.5):.1f}ms")
+    if total:
+        print(f"재현율 (Jaccard >= {args.threshold}, 상위 {args.top}): {hits / total:.3f} ({hits}/{total})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+프롬프트 검색 벤치마크
+
+별도 DB에 합성 프롬프트 N개(기본 100만 개)를 넣고,
+검색 인덱스(SearchService)와 단순 ILIKE 스캔의 조회 지연(p50/p99)을 비교합니다.
+
+운영 DB가 아닌 벤치마크 전용 DB를 지정하세요 (테이블을 생성하고 행을 추가합니다).
+
+실행:
+    python -m benchmarks.bench_prompt_search
+    python -m benchmarks.bench_prompt_search --database-url postgresql+asyncpg://user:pw@localhost/bench
+    python -m benchmarks.bench_prompt_search --size 100000 --skip-seed
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import select, func, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import Base
+from app.models.image_post import ImagePost
+from app.services.search_service import SearchService
+
+SUBJECTS = ["cat", "dog", "dragon", "robot", "castle", "forest", "city", "astronaut", "ocean", "mountain",
+            "samurai", "wizard", "flower", "spaceship", "portrait", "village", "desert", "tiger", "whale", "garden"]
+STYLES = ["neon", "watercolor", "cyberpunk", "oil painting", "pixel art", "photorealistic", "anime", "baroque",
+          "minimalist", "surreal", "isometric", "vaporwave", "ukiyo-e", "low poly", "noir"]
+DETAILS = ["at night", "in the rain", "golden hour", "volumetric lighting", "highly detailed", "8k", "misty",
+           "sunset", "dramatic clouds", "soft focus", "wide angle", "studio lighting", "under the stars"]
+
+QUERIES = ["neon city", "watercolor cat", "cyberpunk samurai at night", "dragon", "ukiyo-e whale", "baroque portrait"]
+
+
+def _prompt(rng: random.Random) -> str:
+    parts = [rng.choice(STYLES), rng.choice(SUBJECTS), rng.choice(DETAILS)]
+    if rng.random() < 0.5:
+        parts += [rng.choice(SUBJECTS), rng.choice(DETAILS)]
+    return " ".join(parts)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _seed(session_factory: async_sessionmaker, size: int, rng: random.Random) -> None:
+    chunk = 10_000
+    started = time.perf_counter()
+    async with session_factory() as db:
+        for offset in range(0, size, chunk):
+            rows = [
+                {"user_id": rng.randint(1, 5000), "image_url": f"/uploads/images/bench_{offset + i}.png", "prompt": _prompt(rng)}
+                for i in range(min(chunk, size - offset))
+            ]
+            await db.execute(insert(ImagePost), rows)
+            await db.commit()
+    print(f"📦 {size:,}개 프롬프트 적재: {time.perf_counter() - started:.1f}초")
+
+
+async def _time(fn, repeat: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return _percentile(timings, 0.5), _percentile(timings, 0.99)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="프롬프트 검색 벤치마크")
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///./bench_search.db", help="벤치마크 전용 DB URL")
+    parser.add_argument("--size", type=int, default=1_000_000, help="적재할 프롬프트 수")
+    parser.add_argument("--skip-seed", action="store_true", help="이미 적재된 DB를 그대로 사용")
+    parser.add_argument("--repeat", type=int, default=20, help="쿼리별 반복 횟수")
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        if not args.skip_seed:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            await _seed(session_factory, args.size, random.Random(42))
+
+        print(f"{'검색어':<28} | {'인덱스 p50':>10} | {'p99':>8} | {'2페이지 p50':>11} | {'ILIKE p50':>9}")
+        async with session_factory() as db:
+            for query in QUERIES:
+                first = await SearchService.search_prompts(db, query, size=args.page_size)
+
+                async def search_first():
+                    await SearchService.search_prompts(db, query, size=args.page_size)
+
+                async def search_next():
+                    await SearchService.search_prompts(db, query, size=args.page_size, cursor=first.next_cursor)
+
+                async def ilike_scan():
+                    # 비교 기준: 인덱스 없이 전체 행을 훑는 부분 문자열 검색
+                    stmt = (
+                        select(ImagePost.id)
+                        .where(ImagePost.prompt.ilike(f"%{query}%"), ImagePost.is_active == True)
+                        .order_by(ImagePost.id.desc())
+                        .limit(args.page_size)
+                    )
+                    await db.execute(stmt)
+
+                p50, p99 = await _time(search_first, args.repeat)
+                next_p50 = (await _time(search_next, args.repeat))[0] if first.next_cursor else 0.0
+                ilike_p50 = (await _time(ilike_scan, max(args.repeat // 4, 1)))[0]
+                print(f"{query:<28} | {p50:>8.2f}ms | {p99:>6.2f}ms | {next_p50:>9.2f}ms | {ilike_p50:>7.2f}ms")
+
+            total = (await db.execute(select(func.count(ImagePost.id)))).scalar_one()
+            print(f"ℹ️  전체 행 수: {total:,}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+목록 조회 경로 벤치마크
+
+같은 페이지를 두 가지 방식으로 읽어 초당 처리 행 수를 비교합니다.
+- ORM: select(ImagePost) → ORM 객체 → ImageResponse.model_validate (이전 경로)
+- Core: 명시적 컬럼 select → row mapping → ImageResponse.model_construct (현재 fast path)
+
+두 경로 모두 응답 JSON 직렬화까지 포함하며, 최신순 첫 페이지를 반복 조회합니다
+(OFFSET 스캔 비용이 아니라 행당 변환 비용을 비교하기 위함).
+
+실행:
+    python -m benchmarks.bench_read_path
+    python -m benchmarks.bench_read_path --page-size 100 --pages 2000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import Base
+from app.models.image_post import ImagePost
+from app.schemas.image import ImageResponse
+from app.utils.fieldsets import rows_to_items, select_image_columns
+from benchmarks.bench_prompt_search import _prompt
+
+_ITEMS = TypeAdapter(list[ImageResponse])
+
+
+async def _seed(session_factory: async_sessionmaker, rows: int, rng: random.Random) -> None:
+    chunk = 10_000
+    async with session_factory() as db:
+        for offset in range(0, rows, chunk):
+            await db.execute(insert(ImagePost), [
+                {
+                    "user_id": rng.randint(1, 5000),
+                    "image_url": f"/uploads/images/bench_{offset + i}.png",
+                    "prompt": _prompt(rng),
+                    "model_name": rng.choice(["sdxl", "midjourney-v6", "dall-e-3", "flux-dev"]),
+                    "variant_urls": {"256": f"/uploads/images/bench_{offset + i}_256.webp"},
+                    "width": 1024,
+                    "height": 1024,
+                    "palette": ["#e61414", "#0a14f0"],
+                    "dominant_color": "#e61414",
+                    "like_count": rng.randint(0, 500),
+                }
+                for i in range(min(chunk, rows - offset))
+            ])
+            await db.commit()
+
+
+async def _orm_page(db: AsyncSession, size: int) -> int:
+    stmt = select(ImagePost).order_by(ImagePost.id.desc()).limit(size)
+    images = (await db.execute(stmt)).scalars().all()
+    items = [ImageResponse.model_validate(image) for image in images]
+    _ITEMS.dump_json(items)
+    db.expunge_all()
+    return len(items)
+
+
+async def _core_page(db: AsyncSession, size: int) -> int:
+    stmt = select(*select_image_columns(None)).order_by(ImagePost.id.desc()).limit(size)
+    items = rows_to_items(await db.execute(stmt), None)
+    _ITEMS.dump_json(items)
+    return len(items)
+
+
+async def _rows_per_second(session_factory: async_sessionmaker, page, pages: int, size: int) -> float:
+    async with session_factory() as db:
+        await page(db, size)  # 워밍업
+        read = 0
+        started = time.perf_counter()
+        for _ in range(pages):
+            read += await page(db, size)
+        return read / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="목록 조회 경로 벤치마크")
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:", help="벤치마크 전용 DB URL")
+    parser.add_argument("--rows", type=int, default=10_000, help="적재할 행 수")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=1000, help="경로별 조회 페이지 수")
+    parser.add_argument("--rounds", type=int, default=3, help="경로별 반복 횟수 (최댓값 사용)")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await _seed(session_factory, args.rows, random.Random(42))
+
+        results = {}
+        for name, page in (("ORM + model_validate", _orm_page), ("Core + model_construct", _core_page)):
+            results[name] = max([
+                await _rows_per_second(session_factory, page, args.pages, args.page_size)
+                for _ in range(args.rounds)
+            ])
+            print(f"{name:<24} | {results[name]:>10,.0f} rows/s")
+
+        orm, core = results.values()
+        print(f"ℹ️  Core 경로 {core / orm:.2f}배 (페이지 크기 {args.page_size}, {args.pages:,}회)")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
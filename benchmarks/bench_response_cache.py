@@ -0,0 +1,158 @@
+"""
+응답 캐시 동시 부하 벤치마크
+
+별도 DB에 이미지/좋아요를 적재한 뒤, 동시 요청 N개가 랭킹과 인기 피드(24시간)를
+반복 조회할 때의 처리량, 지연(p50/p99), 실행된 쿼리 수를 비교합니다.
+- 직접 조회: 매 요청 서비스 메서드 호출
+- singleflight: 캐시 비활성 (동시에 같은 조회만 합침)
+- 캐시: TTL/LRU 캐시 + singleflight
+--write-ratio 비율만큼의 요청은 쓰기로 간주해 캐시를 무효화합니다.
+
+마지막으로 캐시를 비운 직후 같은 랭킹 요청 N개를 동시에 보내,
+singleflight로 쿼리가 한 번만 실행되는지 확인합니다.
+
+실행:
+    python -m benchmarks.bench_response_cache
+    python -m benchmarks.bench_response_cache --concurrency 64 --requests 5000 --write-ratio 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.cache import CACHE_RANKINGS, CACHE_TOP_24H, IMAGE_NAMESPACES, ResponseCache
+from app.models import Base
+from app.models.image_like import ImageLike
+from app.models.image_post import ImagePost
+from app.services.image_service import ImageService
+from app.services.tournament_service import TournamentService
+from benchmarks.bench_prompt_search import _percentile, _prompt
+
+
+async def _seed(session_factory: async_sessionmaker, images: int, likes: int, rng: random.Random) -> None:
+    now = datetime.now()
+    async with session_factory() as db:
+        await db.execute(insert(ImagePost), [
+            {
+                "user_id": rng.randint(1, 5000),
+                "image_url": f"/uploads/images/bench_{i}.png",
+                "prompt": _prompt(rng),
+                "is_tournament_opt_in": rng.random() < 0.5,
+                "tournament_win_count": rng.randint(0, 300),
+            }
+            for i in range(images)
+        ])
+        pairs = {(rng.randint(1, 20_000), rng.randint(1, images)) for _ in range(likes)}
+        await db.execute(insert(ImageLike), [
+            {"user_id": user_id, "image_post_id": image_id, "created_at": now - timedelta(hours=rng.random() * 48)}
+            for user_id, image_id in pairs
+        ])
+        await db.commit()
+
+
+async def _in_session(session_factory: async_sessionmaker, fn, *args):
+    async with session_factory() as db:
+        return await fn(db, *args)
+
+
+async def _run(session_factory: async_sessionmaker, cache: Optional[ResponseCache], args) -> tuple[float, list[float]]:
+    rng = random.Random(7)
+    remaining = args.requests
+    latencies: list[float] = []
+
+    async def load(namespace: str, key: tuple, loader):
+        if cache is None:
+            return await loader()
+        return await cache.get_or_load(namespace, key, loader)
+
+    async def request() -> None:
+        if cache is not None and rng.random() < args.write_ratio:
+            cache.invalidate(*IMAGE_NAMESPACES)
+        # 로더는 동시 요청이 공유하므로 요청 세션이 아닌 자체 세션으로 조회 (API 라우터와 동일)
+        if rng.random() < 0.5:
+            await load(CACHE_RANKINGS, (50, ()), lambda: _in_session(session_factory, TournamentService.get_rankings, 50))
+        else:
+            await load(CACHE_TOP_24H, (10, ()), lambda: _in_session(session_factory, ImageService.get_top_images_24h, 10))
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            await request()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return args.requests / (time.perf_counter() - started), latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="응답 캐시 동시 부하 벤치마크")
+    parser.add_argument("--database-url", default=None, help="벤치마크 전용 DB URL (기본: 임시 sqlite 파일)")
+    parser.add_argument("--images", type=int, default=5_000)
+    parser.add_argument("--likes", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=2000, help="방식별 총 요청 수")
+    parser.add_argument("--write-ratio", type=float, default=0.01, help="캐시를 무효화하는 쓰기 요청 비율")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_cache_")
+    database_url = args.database_url or f"sqlite+aiosqlite:///{os.path.join(workdir, 'bench.db')}"
+    engine = create_async_engine(database_url, pool_size=args.concurrency, max_overflow=0)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    queries = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_query(*_):
+        nonlocal queries
+        queries += 1
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await _seed(session_factory, args.images, args.likes, random.Random(42))
+
+        print(f"{'방식':<12} | {'req/s':>8} | {'p50':>8} | {'p99':>8} | {'쿼리 수':>7}")
+        modes = (
+            ("직접 조회", None),
+            ("singleflight", ResponseCache(max_entries=1024, ttl_seconds=30, enabled=False)),
+            ("캐시", ResponseCache(max_entries=1024, ttl_seconds=30)),
+        )
+        for name, cache in modes:
+            queries = 0
+            throughput, latencies = await _run(session_factory, cache, args)
+            print(
+                f"{name:<12} | {throughput:>8,.0f} | {_percentile(latencies, 0.5):>6.2f}ms | "
+                f"{_percentile(latencies, 0.99):>6.2f}ms | {queries:>7,}"
+            )
+        print(f"ℹ️  동시 요청 {args.concurrency}, 요청 {args.requests:,}회, 쓰기 비율 {args.write_ratio:.0%}")
+
+        # 캐시가 빈 상태에서 같은 요청이 동시에 몰릴 때 쿼리 수
+        cache = ResponseCache(max_entries=1024, ttl_seconds=30)
+
+        async def rankings() -> None:
+            await cache.get_or_load(
+                CACHE_RANKINGS, (50, ()), lambda: _in_session(session_factory, TournamentService.get_rankings, 50)
+            )
+
+        queries = 0
+        await asyncio.gather(*(rankings() for _ in range(args.concurrency)))
+        print(f"ℹ️  빈 캐시에 동시 랭킹 요청 {args.concurrency}건 → 쿼리 {queries}회")
+    finally:
+        await engine.dispose()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
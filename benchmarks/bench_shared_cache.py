@@ -0,0 +1,138 @@
+"""
+워커 간 공유 캐시 벤치마크
+
+uvicorn 워커처럼 프로세스 W개를 띄우고, 같은 캐시 값(토너먼트 후보 ID 배열 + 랭킹 JSON)을
+- 워커별: 각 프로세스가 직접 만들어 워커별 응답 캐시(ResponseCache)에 보관
+- 공유: 한 프로세스가 만든 값을 모든 프로세스가 mmap 공유 캐시(SharedCache)로 읽음
+했을 때의 프로세스별 메모리(PSS, 공유 페이지는 나눠서 계산)와 캐시 조회 지연(p50/p99)을 비교합니다.
+PSS는 /proc/self/smaps_rollup을 읽으므로 Linux에서만 측정됩니다.
+
+실행:
+    python -m benchmarks.bench_shared_cache
+    python -m benchmarks.bench_shared_cache --workers 8 --ids 2000000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import random
+import shutil
+import tempfile
+import time
+from array import array
+
+from app.core.cache import CACHE_RANKINGS, CACHE_TOURNAMENT_POOL, ResponseCache
+from app.utils.shared_cache import SharedCache
+from benchmarks.bench_prompt_search import _percentile, _prompt
+
+
+def _pss_kb() -> int:
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _payloads(ids: int) -> dict[str, bytes]:
+    rng = random.Random(42)
+    rankings = [
+        {"rank": i + 1, "image": {"id": i, "prompt": _prompt(rng), "like_count": rng.randint(0, 500)}, "win_count": 100 - i}
+        for i in range(100)
+    ]
+    return {
+        CACHE_TOURNAMENT_POOL: array("q", range(1, ids + 1)).tobytes(),
+        CACHE_RANKINGS: json.dumps({"rankings": rankings, "total": len(rankings)}).encode(),
+    }
+
+
+async def _lookups(get, rounds: int) -> list[float]:
+    latencies: list[float] = []
+    for i in range(rounds):
+        namespace = CACHE_RANKINGS if i % 2 else CACHE_TOURNAMENT_POOL
+        started = time.perf_counter()
+        await get(namespace)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return latencies
+
+
+def _worker(mode: str, directory: str, ids: int, rounds: int, barrier, results) -> None:
+    async def run() -> tuple[int, list[float]]:
+        before = _pss_kb()
+        if mode == "shared":
+            cache = SharedCache(directory)
+
+            async def load(namespace: str) -> bytes:
+                return _payloads(ids)[namespace]
+
+            async def get(namespace: str):
+                return await cache.get_or_refresh(namespace, "bench", 300, lambda: load(namespace))
+        else:
+            cache = ResponseCache(max_entries=16, ttl_seconds=300)
+            payloads = _payloads(ids)
+
+            async def load(namespace: str) -> bytes:
+                return payloads[namespace]
+
+            async def get(namespace: str):
+                return await cache.get_or_load(namespace, "bench", lambda: load(namespace))
+
+        # 캐시 값 전체를 한 번 읽어 페이지를 실제로 올림 (mmap은 접근해야 PSS에 잡힘)
+        for namespace in (CACHE_TOURNAMENT_POOL, CACHE_RANKINGS):
+            hashlib.blake2b(await get(namespace))
+        # 모든 워커가 값을 올린 뒤, 아무도 종료하기 전에 측정 (공유 페이지가 W로 나뉨)
+        barrier.wait()
+        pss_delta = _pss_kb() - before
+        barrier.wait()
+        return pss_delta, await _lookups(get, rounds)
+
+    pss_delta, latencies = asyncio.run(run())
+    results.put((pss_delta, latencies))
+
+
+def _run(mode: str, args) -> tuple[list[int], list[float]]:
+    directory = tempfile.mkdtemp(prefix="bench_shared_", dir="/dev/shm" if args.dev_shm else None)
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(args.workers)
+    results = ctx.Queue()
+    try:
+        procs = [
+            ctx.Process(target=_worker, args=(mode, directory, args.ids, args.rounds, barrier, results))
+            for _ in range(args.workers)
+        ]
+        for proc in procs:
+            proc.start()
+        collected = [results.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return [pss for pss, _ in collected], [lat for _, lats in collected for lat in lats]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="워커 간 공유 캐시 벤치마크")
+    parser.add_argument("--workers", type=int, default=4, help="워커 프로세스 수")
+    parser.add_argument("--ids", type=int, default=1_000_000, help="후보 ID 배열 길이 (int64)")
+    parser.add_argument("--rounds", type=int, default=20_000, help="워커별 캐시 조회 횟수")
+    parser.add_argument("--no-dev-shm", dest="dev_shm", action="store_false", help="/dev/shm 대신 임시 디렉토리 사용")
+    args = parser.parse_args()
+
+    print(f"{'방식':<8} | {'워커별 PSS':>11} | {'전체 PSS':>10} | {'p50':>8} | {'p99':>8}")
+    for name, mode in (("워커별", "local"), ("공유", "shared")):
+        pss, latencies = _run(mode, args)
+        print(
+            f"{name:<8} | {sum(pss) / len(pss) / 1024:>8.1f} MB | {sum(pss) / 1024:>7.1f} MB | "
+            f"{_percentile(latencies, 0.5):>6.1f}us | {_percentile(latencies, 0.99):>6.1f}us"
+        )
+    print(f"ℹ️  워커 {args.workers}개, ID {args.ids:,}개 ({args.ids * 8 / 1024 / 1024:.1f} MB), 조회 {args.rounds:,}회/워커")
+
+
+if __name__ == "__main__":
+    main()
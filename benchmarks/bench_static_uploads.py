@@ -0,0 +1,84 @@
+"""
+업로드 정적 서빙 벤치마크
+
+임시 디렉토리에 이미지 크기의 파일 N개를 만들고, 동시 요청으로 반복 조회할 때
+StaticFiles(요청마다 경로 확인/stat/open)와 UploadStaticFiles(fd/stat 캐시)의
+처리량과 지연(p50/p99)을 비교합니다. 서버 없이 ASGI로 직접 호출하므로 앱 내부 비용만 측정합니다.
+
+실행:
+    python -m benchmarks.bench_static_uploads
+    python -m benchmarks.bench_static_uploads --files 50 --size 200000 --requests 20000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import tempfile
+import time
+
+import httpx
+from fastapi.staticfiles import StaticFiles
+from starlette.applications import Starlette
+
+from app.utils.static_files import UploadStaticFiles
+from benchmarks.bench_prompt_search import _percentile
+
+
+async def _run(app: Starlette, names: list[str], args) -> tuple[float, list[float]]:
+    rng = random.Random(7)
+    remaining = args.requests
+    latencies: list[float] = []
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                response = await client.get(f"/uploads/{rng.choice(names)}")
+                assert response.status_code == 200
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        return args.requests / (time.perf_counter() - started), latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="업로드 정적 서빙 벤치마크")
+    parser.add_argument("--files", type=int, default=20, help="서빙할 파일 수 (자주 요청되는 이미지)")
+    parser.add_argument("--size", type=int, default=50_000, help="파일 크기 (바이트)")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=5000, help="방식별 총 요청 수")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_static_")
+    try:
+        names = []
+        for i in range(args.files):
+            name = f"{i:04d}.webp"
+            with open(os.path.join(workdir, name), "wb") as f:
+                f.write(os.urandom(args.size))
+            names.append(name)
+
+        print(f"{'방식':<18} | {'req/s':>8} | {'p50':>8} | {'p99':>8}")
+        for label, static in (
+            ("StaticFiles", StaticFiles(directory=workdir)),
+            ("UploadStaticFiles", UploadStaticFiles(directory=workdir)),
+        ):
+            app = Starlette()
+            app.mount("/uploads", static)
+            throughput, latencies = await _run(app, names, args)
+            print(
+                f"{label:<18} | {throughput:>8,.0f} | {_percentile(latencies, 0.5):>6.2f}ms | "
+                f"{_percentile(latencies, 0.99):>6.2f}ms"
+            )
+        print(f"ℹ️  파일 {args.files}개 x {args.size:,}B, 동시 요청 {args.concurrency}, 요청 {args.requests:,}회")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
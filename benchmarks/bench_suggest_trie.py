@@ -0,0 +1,117 @@
+"""
+자동완성 트라이 생성 벤치마크
+
+쉼표로 구절을 나눈 프롬프트(태그형) N개로 구절 트라이를 만들 때
+- 이전 방식: 구절이 나올 때마다 트라이에 바로 추가 (이벤트 루프에서 실행)
+- 현재 방식: 구절 빈도를 먼저 세고 상위 SUGGEST_MAX_FRAGMENTS개만 한 번씩 추가 (스레드에서 실행)
+의 생성 시간, 최대 메모리(tracemalloc), 노드 수, 생성 중 이벤트 루프가 멈춘 최대 시간을 비교합니다.
+SUGGEST_PROMPT_SAMPLE 기본값을 정할 때 사용합니다.
+
+실행:
+    python -m benchmarks.bench_suggest_trie
+    python -m benchmarks.bench_suggest_trie --samples 5000 10000 50000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+from typing import Callable
+
+from app.core.config import settings
+from app.services.suggest_service import SuggestService
+from app.utils.prefix_trie import PrefixTrie
+from benchmarks.bench_prompt_search import DETAILS, STYLES, SUBJECTS
+
+TAGS = [
+    "masterpiece", "best quality", "ultra detailed", "8k", "highres", "cinematic lighting",
+    "sharp focus", "trending on artstation", "octane render", "volumetric fog",
+]
+
+
+def _prompt(rng: random.Random) -> str:
+    parts = rng.sample(TAGS, 4) + [
+        f"{rng.choice(STYLES)} {rng.choice(SUBJECTS)}",
+        rng.choice(DETAILS),
+        f"{rng.choice(SUBJECTS)} {rng.choice(DETAILS)} {rng.randint(0, 10 ** 6)}",
+        f"by artist{rng.randint(0, 50_000)}",
+    ]
+    rng.shuffle(parts)
+    return ", ".join(parts)
+
+
+def _build_incremental(prompts: list[str]) -> PrefixTrie:
+    trie = PrefixTrie(top_k=settings.SUGGEST_TOP_K)
+    for prompt in prompts:
+        for fragment in SuggestService.prompt_fragments(prompt):
+            trie.add(fragment)
+    return trie
+
+
+def _build_counted(prompts: list[str]) -> PrefixTrie:
+    return SuggestService.build_tries([], prompts)[1]
+
+
+async def _measure(build: Callable[[list[str]], PrefixTrie], prompts: list[str], in_thread: bool):
+    """생성 시간, 루프 최대 정지 시간, 트라이를 반환합니다."""
+    stalls: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            stalls.append(now - last - 0.005)
+            last = now
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    if in_thread:
+        trie = await asyncio.to_thread(build, prompts)
+    else:
+        trie = build(prompts)
+    elapsed = time.perf_counter() - started
+    done.set()
+    await tick
+    return elapsed, max(stalls, default=0.0), trie
+
+
+def _peak_mb(build: Callable[[list[str]], PrefixTrie], prompts: list[str]) -> float:
+    tracemalloc.start()
+    trie = build(prompts)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del trie
+    return peak / 1024 / 1024
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="자동완성 트라이 생성 벤치마크")
+    parser.add_argument("--samples", type=int, nargs="+", default=[5000, 10000, 50000], help="프롬프트 수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'프롬프트':>8} | {'방식':<10} | {'생성':>7} | {'루프 정지':>9} | {'최대 메모리':>10} | {'구절':>7} | {'노드':>9}")
+    for size in args.samples:
+        prompts = [_prompt(rng) for _ in range(size)]
+        for label, build, in_thread in (
+            ("이전", _build_incremental, False),
+            ("현재", _build_counted, True),
+        ):
+            elapsed, stall, trie = await _measure(build, prompts, in_thread)
+            peak = _peak_mb(build, prompts)
+            print(
+                f"{size:>8,} | {label:<10} | {elapsed:>6.2f}s | {stall * 1000:>7.0f}ms | "
+                f"{peak:>7.0f} MB | {len(trie):>7,} | {trie.node_count:>9,}"
+            )
+    print(
+        f"ℹ️  SUGGEST_MAX_FRAGMENTS={settings.SUGGEST_MAX_FRAGMENTS:,}, "
+        f"SUGGEST_MAX_NODES={settings.SUGGEST_MAX_NODES:,}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
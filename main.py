@@ -6,10 +6,12 @@ FastAPI AI 이미지 커뮤니티 API
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings, CORS_ALLOWED_ORIGINS
 from app.core.lifespan import lifespan
+from app.core.metrics import metrics
+from app.utils.static_files import UploadStaticFiles
 
 # ===== FastAPI 앱 생성 =====
 app = FastAPI(
@@ -31,6 +33,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ===== 응답 압축 (업로드 이미지는 제외, 랭킹/인기 피드는 압축 결과 캐시) =====
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        exclude_paths=("/uploads",),
+        cached_paths=(
+            "/api-image/v1/tournaments/rankings",
+            "/api-image/v1/images/feed/top-24h",
+        ),
+        cache_max_bytes=settings.COMPRESSION_CACHE_MAX_BYTES,
+    )
+
 # ===== 정적 파일 서빙 (업로드된 이미지, 로컬 스토리지일 때만) =====
 import os
 
@@ -39,12 +56,19 @@ if settings.STORAGE_BACKEND.lower() == "local":
     # uploads 디렉토리가 없으면 생성
     os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 
-    # 정적 파일 마운트 (uploads 전체 디렉토리)
+    # 정적 파일 마운트 (uploads 전체 디렉토리, 샤딩/평면 레이아웃 모두 지원)
+    # 업로드 파일은 내용이 바뀌지 않으므로 immutable 캐시 헤더, Range, fd/stat 캐시 사용
     uploads_root = "./uploads"
     if os.path.exists(uploads_root):
         app.mount(
             "/uploads",
-            StaticFiles(directory=uploads_root),
+            UploadStaticFiles(
+                directory=uploads_root,
+                max_age=settings.UPLOADS_CACHE_MAX_AGE,
+                cache_size=settings.UPLOADS_FILE_CACHE_SIZE,
+                cache_ttl_seconds=settings.UPLOADS_FILE_CACHE_TTL_SECONDS,
+                accel_redirect_prefix=settings.UPLOADS_ACCEL_REDIRECT_PREFIX,
+            ),
             name="uploads"
         )
 
@@ -83,6 +107,19 @@ async def health_check():
     }
 
 
+@app.get("/metrics", tags=["Health"])
+async def get_metrics():
+    """
+    메트릭 엔드포인트
+
+    현재 워커 프로세스의 카운터(트랜스코딩 절감 바이트 등)를 반환합니다.
+    """
+    return {
+        "pid": os.getpid(),
+        "counters": metrics.snapshot(),
+    }
+
+
 # ===== 개발 서버 실행 (직접 실행 시) =====
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,14 @@
+"""
+테스트 공통 설정
+
+Settings가 필수로 요구하는 환경변수를 테스트용 값으로 채웁니다 (이미 있으면 그대로 사용).
+"""
+
+import os
+import tempfile
+
+# 메모리 DB(:memory:)는 StaticPool이라 엔진의 pool_size 인자를 받지 않으므로 임시 파일 DB 사용
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite+aiosqlite:///{os.path.join(tempfile.gettempdir(), 'ai-image-test.db')}"
+)
+os.environ.setdefault("JWT_PUBLIC_KEY", "test-public-key")
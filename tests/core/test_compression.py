@@ -0,0 +1,45 @@
+"""
+Accept-Encoding 협상 테스트
+"""
+
+import pytest
+
+from app.core import compression
+from app.core.compression import negotiate_encoding
+
+
+@pytest.fixture
+def with_brotli(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", object())
+
+
+@pytest.fixture
+def without_brotli(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", "br"),
+    ("br", "br"),
+    ("gzip", "gzip"),
+    ("GZIP", "gzip"),
+    ("*", "br"),
+    ("br;q=0, gzip", "gzip"),
+    ("gzip;q=0.5, br;q=0.1", "br"),  # q가 0보다 크면 br 우선
+    ("br;q=0, gzip;q=0", None),
+    ("br;q=abc, gzip", "gzip"),  # 잘못된 q는 0으로 취급
+    ("deflate, identity", None),
+    ("", None),
+])
+def test_negotiate_with_brotli(with_brotli, header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", "gzip"),
+    ("br", None),
+    ("*", "gzip"),
+    (" gzip ; q=1.0 ", "gzip"),
+])
+def test_negotiate_without_brotli(without_brotli, header, expected):
+    assert negotiate_encoding(header) == expected
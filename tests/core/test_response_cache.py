@@ -0,0 +1,100 @@
+"""
+응답 캐시 / singleflight 요청 합치기 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.cache import CACHE_RANKINGS, ResponseCache
+from app.utils.singleflight import SingleFlight
+
+
+class CountingLoader:
+    """호출 횟수를 세고, release()될 때까지 결과를 돌려주지 않는 로더"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> bytes:
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        return f"value-{call}".encode()
+
+
+async def _settle() -> None:
+    """대기 중인 태스크들이 로더 호출 지점까지 진행하도록 이벤트 루프를 몇 번 양보합니다."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_singleflight_runs_concurrent_calls_once():
+    flight = SingleFlight("test")
+    loader = CountingLoader()
+
+    waiters = [asyncio.create_task(flight.do("key", loader)) for _ in range(20)]
+    await _settle()
+    loader.release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert loader.calls == 1
+    assert results == [b"value-1"] * 20
+
+
+@pytest.mark.asyncio
+async def test_singleflight_keeps_running_when_a_caller_is_cancelled():
+    flight = SingleFlight("test")
+    loader = CountingLoader()
+
+    first = asyncio.create_task(flight.do("key", loader))
+    second = asyncio.create_task(flight.do("key", loader))
+    await _settle()
+    first.cancel()
+    loader.release.set()
+
+    assert await second == b"value-1"
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_runs_concurrent_misses_once():
+    cache = ResponseCache(max_entries=16, ttl_seconds=60)
+    loader = CountingLoader()
+
+    waiters = [asyncio.create_task(cache.get_or_load(CACHE_RANKINGS, (50, ()), loader)) for _ in range(20)]
+    await _settle()
+    loader.release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert loader.calls == 1
+    assert results == [b"value-1"] * 20
+    # 이후 호출은 캐시 적중
+    assert await cache.get_or_load(CACHE_RANKINGS, (50, ()), loader) == b"value-1"
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_starts_new_load_after_invalidate():
+    cache = ResponseCache(max_entries=16, ttl_seconds=60)
+    loader = CountingLoader()
+
+    before = asyncio.create_task(cache.get_or_load(CACHE_RANKINGS, (50, ()), loader))
+    await _settle()
+    assert loader.calls == 1
+
+    # 쓰기 커밋 후의 호출은 진행 중인(쓰기 전) 조회에 합쳐지지 않음
+    cache.invalidate(CACHE_RANKINGS)
+    after = asyncio.create_task(cache.get_or_load(CACHE_RANKINGS, (50, ()), loader))
+    await _settle()
+    assert loader.calls == 2
+
+    loader.release.set()
+    assert await before == b"value-1"
+    assert await after == b"value-2"
+
+    # 무효화 전에 시작된 조회 결과는 보관되지 않고, 새 세대의 결과가 캐시됨
+    assert await cache.get_or_load(CACHE_RANKINGS, (50, ()), loader) == b"value-2"
+    assert loader.calls == 2
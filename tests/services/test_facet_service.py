@@ -0,0 +1,54 @@
+"""
+패싯 집계 증감 순서 테스트
+"""
+
+import pytest
+
+from app.services.facet_service import FACET_MODEL_NAME, FACET_TOURNAMENT, FacetService
+
+
+@pytest.fixture
+def adjusted(monkeypatch):
+    calls: list[tuple[str, str, int]] = []
+
+    async def fake_adjust(db, facet, value, delta):
+        calls.append((facet, value, delta))
+
+    monkeypatch.setattr(FacetService, "_adjust", staticmethod(fake_adjust))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_apply_change_updates_rows_in_key_order(adjusted):
+    before = FacetService.facet_values("sdxl", True)
+    after = FacetService.facet_values("dall-e", False)
+
+    await FacetService.apply_change(None, before, after)
+
+    assert adjusted == [
+        (FACET_MODEL_NAME, "dall-e", 1),
+        (FACET_MODEL_NAME, "sdxl", -1),
+        (FACET_TOURNAMENT, "false", 1),
+        (FACET_TOURNAMENT, "true", -1),
+    ]
+    # 반대 방향 변경도 같은 순서로 잠금을 잡음
+    adjusted.clear()
+    await FacetService.apply_change(None, after, before)
+    assert [(facet, value) for facet, value, _ in adjusted] == [
+        (FACET_MODEL_NAME, "dall-e"),
+        (FACET_MODEL_NAME, "sdxl"),
+        (FACET_TOURNAMENT, "false"),
+        (FACET_TOURNAMENT, "true"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_apply_change_skips_unchanged_facets(adjusted):
+    before = FacetService.facet_values(None, True)
+
+    await FacetService.apply_change(None, before, FacetService.facet_values("sdxl", True))
+    assert adjusted == [(FACET_MODEL_NAME, "", -1), (FACET_MODEL_NAME, "sdxl", 1)]
+
+    adjusted.clear()
+    await FacetService.apply_change(None, None, before)
+    assert adjusted == [(FACET_MODEL_NAME, "", 1), (FACET_TOURNAMENT, "true", 1)]
@@ -0,0 +1,33 @@
+"""
+자동완성 트라이 생성 테스트
+"""
+
+from app.core.config import settings
+from app.services.suggest_service import SuggestService
+
+
+def test_prompt_fragments_split_and_dedupe():
+    prompt = "Masterpiece, best quality. masterpiece; a very long fragment with far too many words here | 8k"
+
+    assert SuggestService.prompt_fragments(prompt) == ["Masterpiece", "best quality", "8k"]
+
+
+def test_build_tries_counts_fragments_and_models():
+    models, fragments = SuggestService.build_tries(
+        [("Stable Diffusion", 3), ("DALL-E", 1)],
+        ["neon city, best quality", "Neon City, 8k", "best quality, neon lights"],
+    )
+
+    assert models.suggest("st") == [("Stable Diffusion", 3)]
+    assert fragments.suggest("neon") == [("neon city", 2), ("neon lights", 1)]
+    assert fragments.suggest("best") == [("best quality", 2)]
+
+
+def test_build_tries_keeps_only_most_frequent_fragments(monkeypatch):
+    monkeypatch.setattr(settings, "SUGGEST_MAX_FRAGMENTS", 2)
+    prompts = ["alpha, beta"] * 3 + ["alpha, gamma"] * 2 + ["delta"]
+
+    _, fragments = SuggestService.build_tries([], prompts)
+
+    assert len(fragments) == 2
+    assert fragments.suggest("") == [("alpha", 5), ("beta", 3)]
@@ -0,0 +1,41 @@
+"""
+색상 버킷 양자화 테스트
+"""
+
+import pytest
+
+from app.utils.image_processing import COLOR_BUCKET_LEVELS, color_bucket
+
+
+def test_extremes():
+    assert color_bucket("#000000") == 0
+    assert color_bucket("#ffffff") == COLOR_BUCKET_LEVELS ** 3 - 1
+
+
+def test_channel_order_is_rgb():
+    top = COLOR_BUCKET_LEVELS - 1
+    assert color_bucket("#ff0000") == top * COLOR_BUCKET_LEVELS ** 2
+    assert color_bucket("#00ff00") == top * COLOR_BUCKET_LEVELS
+    assert color_bucket("#0000ff") == top
+
+
+def test_hash_prefix_and_case_are_ignored():
+    assert color_bucket("#FF8800") == color_bucket("ff8800") == color_bucket("#ff8800")
+
+
+def test_step_boundaries():
+    step = 256 // COLOR_BUCKET_LEVELS
+    below = f"#{step - 1:02x}0000"
+    at = f"#{step:02x}0000"
+    assert color_bucket(below) == 0
+    assert color_bucket(at) == COLOR_BUCKET_LEVELS ** 2
+
+
+def test_similar_shades_share_a_bucket():
+    assert color_bucket("#e01010") == color_bucket("#ff2020")
+    assert color_bucket("#e01010") != color_bucket("#10e010")
+
+
+@pytest.mark.parametrize("hex_color", ["#123456", "#abcdef", "#7f7f7f", "#808080"])
+def test_bucket_in_range(hex_color):
+    assert 0 <= color_bucket(hex_color) < COLOR_BUCKET_LEVELS ** 3
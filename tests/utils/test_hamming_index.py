@@ -0,0 +1,78 @@
+"""
+해밍 거리 인덱스 (Multi-Index Hashing) 테스트
+"""
+
+import random
+
+import pytest
+
+from app.utils.hamming_index import HammingIndex
+
+
+def _brute_force(items: dict[int, int], value: int, max_distance: int) -> list[tuple[int, int]]:
+    value &= (1 << 64) - 1
+    results = [
+        (item_id, ((h & ((1 << 64) - 1)) ^ value).bit_count())
+        for item_id, h in items.items()
+    ]
+    return sorted((pair for pair in results if pair[1] <= max_distance), key=lambda p: (p[1], p[0]))
+
+
+def _flip(value: int, bits: list[int]) -> int:
+    for bit in bits:
+        value ^= 1 << bit
+    return value
+
+
+@pytest.mark.parametrize("max_distance", [0, 3, 4, 7, 10])
+def test_search_matches_brute_force(max_distance):
+    rng = random.Random(max_distance)
+    base = rng.getrandbits(64)
+    items = {i: rng.getrandbits(64) for i in range(300)}
+    # 기준 해시 근처의 항목을 섞어 실제로 찾을 대상이 있게 함
+    for i in range(300, 340):
+        items[i] = _flip(base, rng.sample(range(64), rng.randint(0, 12)))
+
+    index = HammingIndex()
+    index.add_many(items.items())
+
+    assert index.search(base, max_distance) == _brute_force(items, base, max_distance)
+
+
+def test_signed_bigint_values_match_unsigned():
+    index = HammingIndex()
+    unsigned = (1 << 63) | 0b1011
+    signed = unsigned - (1 << 64)  # PostgreSQL BIGINT로 저장된 같은 값
+
+    index.add(1, signed)
+
+    assert index.search(unsigned, 0) == [(1, 0)]
+    assert index.search(signed, 0) == [(1, 0)]
+
+
+def test_add_replaces_and_remove_forgets():
+    index = HammingIndex()
+    index.add(1, 0)
+    index.add(1, (1 << 64) - 1)  # 같은 ID를 다시 추가하면 해시 교체
+
+    assert len(index) == 1
+    assert index.search(0, 3) == []
+    assert index.search((1 << 64) - 1, 0) == [(1, 0)]
+
+    index.remove(1)
+    index.remove(1)  # 없는 ID 제거는 무시
+
+    assert 1 not in index
+    assert index.search((1 << 64) - 1, 64) == []
+
+
+def test_results_sorted_by_distance_then_id():
+    index = HammingIndex()
+    index.add_many([(3, 0b1), (1, 0b11), (2, 0b1), (4, 0)])
+
+    assert index.search(0, 2) == [(4, 0), (2, 1), (3, 1), (1, 2)]
+
+
+def test_bits_must_divide_into_chunks():
+    with pytest.raises(ValueError):
+        HammingIndex(bits=64, chunks=5)
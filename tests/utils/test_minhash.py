@@ -0,0 +1,103 @@
+"""
+MinHash 서명과 LSH 버킷 인덱스 테스트
+"""
+
+from app.utils.minhash import (
+    BANDS,
+    NUM_PERM,
+    MinHashLSHIndex,
+    band_keys,
+    shingles,
+    signature,
+    signature_from_bytes,
+    signature_to_bytes,
+    similarity,
+)
+
+
+def test_shingles_include_words_and_pairs():
+    assert shingles("Red Fox, jumping") == {"red", "fox", "jumping", "red fox", "fox jumping"}
+
+
+def test_signature_is_deterministic_and_case_insensitive():
+    sig = signature("a red fox in the snow")
+    assert sig is not None
+    assert len(sig) == NUM_PERM
+    assert all(0 <= value < 2 ** 32 for value in sig)
+    assert signature("A RED FOX in the snow") == sig
+
+
+def test_signature_of_text_without_words_is_none():
+    assert signature("") is None
+    assert signature(" ,.! ") is None
+
+
+def test_signature_bytes_round_trip():
+    sig = signature("cyberpunk city at night, neon lights")
+    data = signature_to_bytes(sig)
+    assert len(data) == NUM_PERM * 4
+    assert signature_from_bytes(data) == sig
+
+
+def test_band_keys_are_stable_signed_64bit():
+    sig = signature("portrait of a cat wearing a hat")
+    keys = band_keys(sig)
+    assert len(keys) == BANDS
+    assert keys == band_keys(sig)
+    assert all(-(2 ** 63) <= key < 2 ** 63 for key in keys)
+
+
+def test_similarity_tracks_overlap():
+    base = signature("a red fox in the snow at sunset, highly detailed")
+    near = signature("a red fox in the snow at sunset, detailed")
+    far = signature("spaceship interior with blue neon panels")
+    assert similarity(base, base) == 1.0
+    assert similarity(base, near) > similarity(base, far)
+
+
+def test_query_finds_similar_and_excludes_unrelated():
+    index = MinHashLSHIndex()
+    index.add(1, signature("a red fox in the snow at sunset, highly detailed"))
+    index.add(2, signature("a red fox in the snow at sunset, detailed"))
+    index.add(3, signature("spaceship interior with blue neon panels"))
+
+    results = index.query(signature("a red fox in the snow at sunset, highly detailed"), exclude=[1])
+    assert [item_id for item_id, _ in results] == [2]
+    assert results[0][1] > 0.5
+
+
+def test_query_respects_limit_and_min_similarity():
+    index = MinHashLSHIndex()
+    for item_id in range(5):
+        index.add(item_id, signature("the same prompt for every image"))
+
+    sig = signature("the same prompt for every image")
+    results = index.query(sig, limit=3)
+    # 유사도가 같으면 ID 내림차순
+    assert results == [(4, 1.0), (3, 1.0), (2, 1.0)]
+    assert index.query(sig, min_similarity=1.01) == []
+
+
+def test_add_replaces_and_remove_cleans_buckets():
+    index = MinHashLSHIndex()
+    first = signature("a red fox in the snow")
+    second = signature("spaceship interior with blue neon panels")
+
+    index.add(1, first)
+    index.add(1, second)
+    assert len(index) == 1
+    assert index.get(1) == second
+    assert index.query(first) == []
+
+    index.remove(1)
+    assert 1 not in index
+    assert index.get(1) is None
+    assert index._buckets == {}
+    index.remove(1)  # 없는 항목 제거는 무시
+
+
+def test_add_with_precomputed_keys():
+    index = MinHashLSHIndex()
+    sig = signature("watercolor landscape with mountains")
+    index.add(7, sig, band_keys(sig))
+    assert index.query(sig) == [(7, 1.0)]
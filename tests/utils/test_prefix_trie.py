@@ -0,0 +1,87 @@
+"""
+빈도 기반 접두사 트라이 테스트
+"""
+
+from app.utils.prefix_trie import PrefixTrie
+
+
+def test_suggest_orders_by_count_then_key():
+    trie = PrefixTrie(top_k=10)
+    trie.add("neon city", 3)
+    trie.add("neon lights", 5)
+    trie.add("nebula", 3)
+    trie.add("forest", 9)
+
+    assert trie.suggest("ne") == [("neon lights", 5), ("nebula", 3), ("neon city", 3)]
+    assert trie.suggest("neon c") == [("neon city", 3)]
+    assert trie.suggest("x") == []
+
+
+def test_case_and_whitespace_insensitive_keeps_first_display():
+    trie = PrefixTrie()
+    trie.add("Stable  Diffusion")
+    trie.add("stable diffusion", 2)
+
+    assert trie.suggest("STABLE d") == [("Stable Diffusion", 3)]
+    assert len(trie) == 1
+
+
+def test_top_k_and_limit():
+    trie = PrefixTrie(top_k=3)
+    for i, word in enumerate(["aa", "ab", "ac", "ad", "ae"]):
+        trie.add(word, i + 1)
+
+    assert [text for text, _ in trie.suggest("a")] == ["ae", "ad", "ac"]
+    assert trie.suggest("a", limit=1) == [("ae", 5)]
+    # 상위 목록 밖이던 항목도 빈도가 오르면 올라옴
+    trie.add("aa", 10)
+    assert trie.suggest("a")[0] == ("aa", 11)
+
+
+def test_empty_prefix_returns_global_top():
+    trie = PrefixTrie(top_k=2)
+    trie.add("x", 1)
+    trie.add("y", 2)
+    trie.add("z", 3)
+
+    assert trie.suggest("") == [("z", 3), ("y", 2)]
+
+
+def test_ignores_empty_and_non_positive():
+    trie = PrefixTrie()
+    trie.add("   ")
+    trie.add("cat", 0)
+
+    assert len(trie) == 0
+    assert trie.suggest("c") == []
+
+
+def test_keys_truncated_to_max_length():
+    trie = PrefixTrie(max_key_length=4)
+    trie.add("abcdefgh")
+
+    assert trie.suggest("abcd") == [("abcd", 1)]
+    assert trie.suggest("abcde") == []
+
+
+def test_max_nodes_caps_growth_and_keeps_frequent_items():
+    trie = PrefixTrie.from_counts([("alpha", 9), ("beta", 5), ("gamma", 1)], max_nodes=11)
+
+    # 루트 + alpha(5) + beta(4) = 10, gamma는 노드 1개만 더 만들 수 있음
+    assert trie.node_count == 11
+    assert trie.suggest("alpha") == [("alpha", 9)]
+    assert trie.suggest("beta") == [("beta", 5)]
+    assert trie.suggest("g") == [("gamma", 1)]
+    assert trie.suggest("ga") == []
+    assert trie.suggest("")[0] == ("alpha", 9)
+
+
+def test_from_counts_matches_incremental_adds():
+    items = [("red", 4), ("rose", 2), ("river", 7), ("rain", 1)]
+    built = PrefixTrie.from_counts(items, top_k=3)
+    incremental = PrefixTrie(top_k=3)
+    for text, count in reversed(items):
+        incremental.add(text, count)
+
+    for prefix in ("", "r", "ri", "ro", "re"):
+        assert built.suggest(prefix) == incremental.suggest(prefix)
@@ -0,0 +1,116 @@
+"""
+워커 간 공유 캐시 (mmap 파일) 테스트
+"""
+
+import errno
+import os
+
+import pytest
+
+from app.utils import shared_cache as shared_cache_module
+from app.utils.shared_cache import SharedCache
+
+pytestmark = pytest.mark.skipif(shared_cache_module.fcntl is None, reason="fcntl 필요")
+
+NS = "ranking"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SharedCache(str(tmp_path / "shared"))
+
+
+def counting_loader(payload: bytes = b"fresh"):
+    calls = []
+
+    async def loader() -> bytes:
+        calls.append(1)
+        return payload
+
+    return loader, calls
+
+
+def test_write_and_read(cache):
+    assert cache.read(NS, "k") is None
+    cache.write(NS, "k", b"hello", ttl_seconds=60)
+    expires_at, view = cache.read(NS, "k")
+    assert bytes(view) == b"hello"
+
+    # 교체된 파일은 다시 매핑해서 읽음
+    cache.write(NS, "k", b"second", ttl_seconds=60)
+    assert bytes(cache.read(NS, "k")[1]) == b"second"
+
+
+def test_invalidate_removes_entries(cache):
+    cache.write(NS, "a", b"1", ttl_seconds=60)
+    cache.write("other", "a", b"2", ttl_seconds=60)
+    cache.invalidate(NS)
+    assert cache.read(NS, "a") is None
+    assert bytes(cache.read("other", "a")[1]) == b"2"
+
+
+@pytest.mark.asyncio
+async def test_get_or_refresh_miss_then_hit(cache):
+    loader, calls = counting_loader()
+    assert bytes(await cache.get_or_refresh(NS, "k", 60, loader)) == b"fresh"
+    assert bytes(await cache.get_or_refresh(NS, "k", 60, loader)) == b"fresh"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_refreshed(cache):
+    cache.write(NS, "k", b"old", ttl_seconds=-1)
+    loader, calls = counting_loader()
+    assert bytes(await cache.get_or_refresh(NS, "k", 60, loader)) == b"fresh"
+    assert len(calls) == 1
+    assert bytes(cache.read(NS, "k")[1]) == b"fresh"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_refresh_prevents_stale_write(cache):
+    async def loader() -> bytes:
+        # 갱신 도중 다른 워커가 무효화한 상황
+        cache.invalidate(NS)
+        return b"computed-before-invalidate"
+
+    assert bytes(await cache.get_or_refresh(NS, "k", 60, loader)) == b"computed-before-invalidate"
+    assert cache.read(NS, "k") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_served_stale_while_another_worker_refreshes(cache):
+    cache.write(NS, "k", b"stale", ttl_seconds=-1)
+    loader, calls = counting_loader()
+
+    # 다른 워커가 갱신 락을 잡고 있는 상황 (flock은 열린 파일마다 따로 잠기므로 같은 프로세스에서도 충돌)
+    fd = os.open(f"{cache._path(NS, 'k')}.lock", os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        shared_cache_module.fcntl.flock(fd, shared_cache_module.fcntl.LOCK_EX)
+        assert bytes(await cache.get_or_refresh(NS, "k", 60, loader)) == b"stale"
+        assert calls == []
+    finally:
+        os.close(fd)
+
+    assert bytes(await cache.get_or_refresh(NS, "k", 60, loader)) == b"fresh"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_error_returns_payload(cache, monkeypatch):
+    def fail_write(*args, **kwargs):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(cache, "write", fail_write)
+    loader, calls = counting_loader()
+    assert bytes(await cache.get_or_refresh(NS, "k", 60, loader)) == b"fresh"
+    assert cache.read(NS, "k") is None
+
+
+def test_failed_write_leaves_no_temp_file(cache, monkeypatch):
+    def fail_replace(src, dst):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(shared_cache_module.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        cache.write(NS, "k", b"x", ttl_seconds=60)
+    assert not [name for name in os.listdir(cache.directory) if name.endswith(".tmp")]
@@ -0,0 +1,75 @@
+"""
+업로드 파일 응답의 Range 해석 테스트
+"""
+
+import os
+
+import pytest
+from starlette.datastructures import Headers
+
+from app.utils.static_files import _OpenFile, _UploadFileResponse
+
+SIZE = 1000
+
+
+@pytest.fixture
+def entry(tmp_path):
+    path = tmp_path / "a.png"
+    path.write_bytes(b"x" * SIZE)
+    with open(path, "rb") as file:
+        yield _OpenFile(file, os.fstat(file.fileno()), "images/a.png", "public, max-age=60", 0.0)
+
+
+def parse(entry, **headers):
+    return _UploadFileResponse._parse_range(Headers(headers={k.replace("_", "-"): v for k, v in headers.items()}), entry)
+
+
+def test_no_range_is_full_response(entry):
+    assert parse(entry) is None
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("bytes=0-99", (0, 100)),
+    ("bytes=100-", (100, SIZE)),
+    ("bytes=990-5000", (990, SIZE)),  # 끝이 파일보다 크면 잘라냄
+    ("bytes=999-999", (999, SIZE)),
+    (" BYTES = 5-9", (5, 10)),
+])
+def test_single_range(entry, spec, expected):
+    assert parse(entry, range=spec) == expected
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("bytes=-100", (SIZE - 100, SIZE)),
+    ("bytes=-5000", (0, SIZE)),  # 파일보다 긴 suffix는 전체
+    ("bytes=-0", "unsatisfiable"),
+])
+def test_suffix_range(entry, spec, expected):
+    assert parse(entry, range=spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["bytes=1000-", "bytes=1000-2000", "bytes=5000-6000"])
+def test_range_beyond_eof_is_unsatisfiable(entry, spec):
+    assert parse(entry, range=spec) == "unsatisfiable"
+
+
+@pytest.mark.parametrize("spec", [
+    "bytes=5-2",  # 끝이 시작보다 앞
+    "bytes=a-b",
+    "bytes=10",
+    "bytes=-x",
+    "items=0-10",  # 알 수 없는 단위
+    "bytes=0-10,20-30",  # 다중 Range
+])
+def test_invalid_range_is_ignored(entry, spec):
+    assert parse(entry, range=spec) is None
+
+
+def test_if_range_matching_validator_keeps_range(entry):
+    assert parse(entry, range="bytes=0-9", if_range=entry.headers["etag"]) == (0, 10)
+    assert parse(entry, range="bytes=0-9", if_range=entry.headers["last-modified"]) == (0, 10)
+
+
+def test_if_range_mismatch_sends_full_response(entry):
+    assert parse(entry, range="bytes=0-9", if_range='"stale-etag"') is None
+    assert parse(entry, range="bytes=5000-", if_range='"stale-etag"') is None